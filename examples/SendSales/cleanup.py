@@ -5,30 +5,24 @@ except for the one with locationCode = "DEFAULT"
 
 """
 
+from bulk_delete import bulk_delete
+from client import AvataxClient
 import os
-import requests
 
 """
 cleanup:
-get locations by calling ListLocationsByCompany (GET)
-(https://sandbox-rest.avatax.com/api/v2/companies/{companyId}/locations)
-
-for each location (response.json()["value"][0]["id"])
-delete the location (DELETE verb)
-("https://sandbox-rest.avatax.com/api/v2/companies/{companyId}/locations/{id}")
+stream the locations of the company by calling ListLocationsByCompany
+and delete them (DeleteLocation), 4 at a time and at most 10 per second.
+Set dry_run=True to only list the locations that would be deleted.
 """
 
-base_url = "https://sandbox-rest.avatax.com/api/v2"
-user_auth = (os.environ["USERNAME"], os.environ["PASSWORD"])
+client = AvataxClient(None, None, None, "sandbox")
+client.add_credentials(os.environ["USERNAME"], os.environ["PASSWORD"])
 comp_id = os.environ["COMPANY"]
-comp_name = "TUGBOAT"
-
-locs_for_company = requests.get("{}/companies/{}/locations".format(
-                                base_url, comp_id), auth=user_auth)
 
-for loc in locs_for_company.json()["value"]:
-    if loc["locationCode"] == "DEFAULT":
-        continue
-    else:
-        requests.delete("{}/companies/{}/locations/{}".format(
-                        base_url, comp_id, loc["id"]), auth=user_auth)
+for result in bulk_delete(client, comp_id, "locations",
+                          exclude=lambda loc: loc["locationCode"] == "DEFAULT",
+                          workers=4, rate=10, dry_run=False):
+    if not result.ok:
+        print("{}: {}".format(result.item["locationCode"],
+                              result.error or result.response.text))
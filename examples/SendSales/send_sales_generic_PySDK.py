@@ -5,15 +5,15 @@ with addresses and creates locations based on that list.
 Then it generates a tax file based on the locations and given
 list of tax codes.
 
-Writing the files requires a folder named "taxfiles" to be
-created prior to running this script.
+The tax files are written to the "taxfiles" folder.
 """
 from client import AvataxClient
+from location_import import import_locations
+from stream_parsers import iter_tax_rates_by_zip_code
 from tax_code_list import sample_codes as tax_codes
 import os
-import sys
-import time
 import datetime
+import itertools
 
 # Creates a client object using dummy company "tugboat"
 tugboat = AvataxClient(None, None, None, "sandbox")
@@ -21,80 +21,47 @@ tugboat.add_credentials(os.environ["USERNAME"], os.environ["PASSWORD"])
 
 comp_id = os.environ["COMPANY"]
 comp_code = tugboat.get_company(comp_id).json()["companyCode"]
-# get list of all zip codes with address by date
-address_gen = tugboat.download_tax_rates_by_zip_code(
-    datetime.date.today().isoformat())
+# stream the list of all zip codes with address by date, keeping
+# only the address columns
+zip_rates = iter_tax_rates_by_zip_code(
+    tugboat, datetime.date.today().isoformat(),
+    ["ZIP_CODE", "STATE_ABBREV", "CITY_NAME"], as_tuples=True)
 
-# List comprehension to create array of all addresses from generator
-#  slicing only address information
-address_array = [item.decode("utf-8").split(",")[:4]
-                 for item in address_gen.iter_lines()][1:]
-
-# create variables for analytic data to be sent to
-analytics = []
-analysis = open("./taxfiles/analytics.txt", "a")
-location_list = []
-iter_count = 0
-skip_count = 0
-
-total_start_time = time.time()
-
-# for each address array create a location - slice used for testing
-for entry in address_array[200:250]:  # take out the slice to use all addr
-    iter_count += 1
-    duration = 0
-    start = time.time()
-
-    # if address has information, create a location model with it.
-    if entry[0]:
-        location_model = [
-            {
-                "id": iter_count,
-                "locationCode": "Location{}".format(iter_count),
-                "addressTypeId": "Location",
-                "addressCategoryId": "Warehouse",
-                "line1": "1 Main St",
-                "postalCode": entry[0],
-                "country": "US"
-            }]
-        location_model[0]["city"] = entry[3]
-        location_model[0]["region"] = entry[1]
-    else:  # if not skip that location in the array of addresses
-        skip_count += 1
+# for each address create a location model - slice used for testing
+location_models = []
+for iter_count, (postal, region, city) in enumerate(
+        itertools.islice(zip_rates, 200, 250), 1):
+    # if address has no information, skip that location
+    if not postal:
         continue
+    location_models.append({
+        "locationCode": "Location{}".format(iter_count),
+        "addressTypeId": "Location",
+        "addressCategoryId": "Warehouse",
+        "line1": "1 Main St",
+        "city": city,
+        "region": region,
+        "postalCode": postal,
+        "country": "US"
+    })
 
-    duration += time.time() - start
-
-# establish variables to log how long the process takes
-    start = time.time()
-    new_location = tugboat.create_locations(comp_id, location_model)
-    duration += time.time() - start
-# set up the model with the tax codes imported on ln 9
-    tax_model = {
-        "companyCode": comp_code,  # change this to take customer's company
-        "responseType": "Json",
-        "taxCodes": tax_codes,
-        "locationCodes": [new_location.json()[0]["locationCode"]]
-    }
-    start = time.time()
-# build the tax file
-    new_file = tugboat.build_tax_content_file(tax_model)
-    duration += time.time() - start
-
-    location_list.append([new_file, duration])
-# write the tax file data to a new file
-    file = open("./taxfiles/{}_{}.txt".format(
-        datetime.datetime.now().date(), tax_model["locationCodes"][0]), "w")
+# create the locations, 100 per call and 4 calls at a time
+imported = import_locations(tugboat, comp_id, location_models,
+                            batch_size=100, workers=4)
+for code, failure in imported.failures.items():
+    print("{}: not created {}".format(code, getattr(failure, "text", failure)))
 
-    file.write(str(new_file.json()) + ", ")
-    file.close()
-# write the analytics to a file
-    analysis.write("{}: Time: {}(s)\n".format(
-        tax_model["locationCodes"][0], duration))
+# the analytics file is opened before the files are built, create the
+# folder first
+if not os.path.isdir("./taxfiles"):
+    os.makedirs("./taxfiles")
 
-    sys.stdout.write("\rProg:  {}".format(location_model[0]["locationCode"]))
-final_time = time.time() - total_start_time
+# build the tax files of the new locations
+with open("./taxfiles/analytics.txt", "a") as analysis:
+    analysis.write("Locations created: {} in {}(s)\n".format(
+        len(imported.created), imported.elapsed))
+    run = tugboat.build_tax_content_files(
+        comp_code, [loc["locationCode"] for loc in imported.created],
+        tax_codes, directory="./taxfiles", report=analysis)
 
 print("\nCOMPLETE")
-analysis.write("Total Time: {}(s)".format(final_time))
-analysis.close()
@@ -17,6 +17,30 @@ setup(
         'client_methods',
         'transaction_builder',
         'transaction_builder_methods',
+        'estimate_cache',
+        'batch_executor',
+        'transaction_pipeline',
+        'tax_content',
+        'pos_tax_engine',
+        'location_import',
+        'bulk_delete',
+        'catalog_sync',
+        'customer_sync',
+        'certificate_transfer',
+        'report_jobs',
+        'stream_parsers',
+        'transaction_export',
+        'reconciliation',
+        'mock_server',
+        'benchmark',
+        'cassette',
+        'loadgen',
+        'transport',
+        'oauth',
+        'warm_up',
+        'hedging',
+        '_bulk',
+        '_fork',
         '_str_version'
     ],
     author='Han Bao, Adrienne Karnoski, Robert Bronson, Philip Werner',
@@ -30,7 +54,9 @@ setup(
         'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.6'
     ],
-    install_requires=['requests', 'ipython'],
+    install_requires=['requests', 'ipython', 'futures; python_version < "3"'],
     extras_require={
-        "test": ['pytest', 'pytest-cov', 'tox']
+        "test": ['pytest', 'pytest-cov', 'tox'],
+        "arrow": ['pyarrow'],
+        "httpx": ['httpx[http2]']
     })
\ No newline at end of file
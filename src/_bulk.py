@@ -0,0 +1,215 @@
+"""Bounded concurrency and rate limiting shared by the bulk helpers."""
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import math
+import threading
+import time
+
+
+class BulkResult(namedtuple('BulkResult', 'item response error elapsed')):
+    """Outcome of a single call made by run_bulk."""
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        """Return True if the call raised nothing and AvaTax accepted it."""
+        return self.error is None and getattr(self.response, 'ok', True)
+
+
+class RateLimiter(object):
+    """Token bucket limiting the number of calls per second."""
+
+    def __init__(self, rate, burst=1, clock=time.time, sleep=time.sleep):
+        """
+        Initialize a full bucket.
+
+        :param  int/float  rate:   Calls allowed per second
+        :param  int        burst:  Calls allowed back to back after idling
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError('rate must be positive and burst at least 1')
+        self.rate = float(rate)
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller is allowed to make one call."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # reserve a token, waiting for it if the bucket went negative
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay:
+            self.sleep(delay)
+
+
+def run_bulk(func, items, workers=8, rate=None):
+    """
+    Call func on every item with bounded concurrency.
+
+    Items are pulled lazily from the iterable, and results are yielded as
+    soon as their call completes, in completion order.
+
+    :param  function   func:     Called with one item, returns a response
+    :param  iterable   items:    The items to process
+    :param  int        workers:  Maximum number of calls in flight
+    :param  int/float  rate:     Maximum number of calls per second
+    :return: generator of BulkResult
+    """
+    limiter = RateLimiter(rate) if rate else None
+
+    def call(item):
+        if limiter:
+            limiter.acquire()
+        start = time.time()
+        try:
+            response = func(item)
+        except Exception as e:
+            return BulkResult(item, None, e, time.time() - start)
+        return BulkResult(item, response, None, time.time() - start)
+
+    with ThreadPoolExecutor(workers) as pool:
+        pending = set()
+        for item in items:
+            pending.add(pool.submit(call, item))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def percentile(values, q):
+    """
+    Return the q-th percentile of values, by the nearest rank method.
+
+    :param  list   values:  The measurements
+    :param  float  q:       The percentile, between 0 and 100
+    :return: float
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = int(math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def chunked(records, size):
+    """Yield lists of at most size records."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Statuses of a chunk rejected for the content of its records, only these
+# chunks are split, AvaTax created none of their records
+VALIDATION_STATUSES = (400, 422)
+
+
+def create_bisecting(create, chunk, limiter=None):
+    """
+    Create a chunk of records, return (created, failed).
+
+    A chunk rejected as invalid is split in halves until the records AvaTax
+    refuses are isolated, so one bad record does not fail its whole chunk.
+    Any other failure, e.g. 401, 429 or 5xx, is reported for every record of
+    the chunk: splitting would only add load to a throttled or failing
+    server, and could create twice records it already created.
+
+    :param  function     create:   Called with a list of records, returns
+        the response of the create call
+    :param  list         chunk:    The records to create
+    :param  RateLimiter  limiter:  Acquired before each call, the calls made
+        for the halves included
+    :return: tuple of the created models and the (record, response) failures
+    """
+    if limiter:
+        limiter.acquire()
+    response = create(chunk)
+    if response.ok:
+        return response.json(), []
+    if len(chunk) == 1 or response.status_code not in VALIDATION_STATUSES:
+        return [], [(record, response) for record in chunk]
+    half = len(chunk) // 2
+    created, failed = create_bisecting(create, chunk[:half], limiter)
+    more_created, more_failed = create_bisecting(create, chunk[half:],
+                                                 limiter)
+    return created + more_created, failed + more_failed
+
+
+def iter_records(fetch, include=None, page_size=1000):
+    """
+    Yield every record of a paginated list endpoint.
+
+    Pages are requested one at a time with `$top` and `$skip`.
+
+    :param  function    fetch:      Called with the query parameters of a
+        page, returns the FetchResult response
+    :param  dictionary  include:    Other query parameters, e.g. `$filter`
+    :param  int         page_size:  Number of records requested per page
+    :return: generator of dictionary
+    """
+    params = dict(include or {})
+    skip = 0
+    while True:
+        params['$top'] = page_size
+        params['$skip'] = skip
+        response = fetch(dict(params))
+        response.raise_for_status()
+        page = response.json().get('value', [])
+        for record in page:
+            yield record
+        if len(page) < page_size:
+            return
+        skip += len(page)
+
+
+def iter_records_by_id(fetch, include=None, page_size=1000):
+    """
+    Yield every record of a list endpoint, paging on ascending id.
+
+    Unlike iter_records, pages are requested with `id gt <last id>`, so
+    records deleted or created while iterating don't shift the pages.
+
+    :param  function    fetch:      Called with the query parameters of a
+        page, returns the FetchResult response
+    :param  dictionary  include:    Other query parameters, a `$filter` is
+        combined with the id condition
+    :param  int         page_size:  Number of records requested per page
+    :return: generator of dictionary
+    """
+    params = dict(include or {})
+    user_filter = params.get('$filter')
+    last_id = None
+    while True:
+        conditions = [] if last_id is None else ['id gt {}'.format(last_id)]
+        if user_filter:
+            conditions.insert(0, '({})'.format(user_filter))
+        if conditions:
+            params['$filter'] = ' and '.join(conditions)
+        params['$orderby'] = 'id ASC'
+        params['$top'] = page_size
+        response = fetch(dict(params))
+        response.raise_for_status()
+        page = response.json().get('value', [])
+        for record in page:
+            yield record
+        if len(page) < page_size:
+            return
+        last_id = page[-1]['id']
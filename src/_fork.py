@@ -0,0 +1,41 @@
+"""Rebuild the connections and locks objects inherit in forked processes."""
+import os
+import weakref
+
+
+# Objects told when the process forks, through their after_fork method
+_registered = weakref.WeakSet()
+# pid of the process the registered objects belong to
+_pid = os.getpid()
+
+
+def register(obj):
+    """
+    Call obj.after_fork() in every child forked from this process.
+
+    A forked child inherits the sockets of its parent, sharing them would
+    interleave the calls of both processes, and the locks held by parent
+    threads that do not exist in the child.
+
+    :param  object  obj:  Has an after_fork method, held by a weak reference
+    :return: obj
+    """
+    _registered.add(obj)
+    return obj
+
+
+def _after_fork():
+    global _pid
+    _pid = os.getpid()
+    for obj in list(_registered):
+        obj.after_fork()
+
+
+def check():
+    """Run the fork hooks if the process forked unnoticed, e.g. before 3.7."""
+    if _pid != os.getpid():
+        _after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
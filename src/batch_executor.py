@@ -0,0 +1,190 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+TransactionBatcher accumulates create_transaction requests coming from many
+threads for a few milliseconds and submits each batch concurrently
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from estimate_cache import estimate_key, is_estimate
+import threading
+import time
+try:
+    import queue
+except ImportError:  # pragma no cover
+    import Queue as queue
+
+
+# Put on the queue by close() to stop the dispatcher thread
+_STOP = object()
+
+
+class TransactionBatcher(object):
+    """Class for a micro-batching create_transaction executor."""
+
+    def __init__(self, client, max_batch_size=16, linger=0.005, workers=None):
+        """
+        Start the dispatcher thread.
+
+        Identical uncommitted SalesOrders found in the same batch are only
+        sent once and share the response. Other transactions are never
+        merged, a multi-document transaction would record them as a single
+        document.
+
+        :param  AvataxClient  client:          The client used to create
+            the transactions
+        :param  int           max_batch_size:  Maximum number of requests
+            dispatched together
+        :param  int/float     linger:          Seconds to wait for more
+            requests once the first request of a batch arrived
+        :param  int           workers:         Maximum number of calls in
+            flight (default: max_batch_size)
+        """
+        if max_batch_size <= 0 or linger < 0:
+            raise ValueError('max_batch_size must be positive and linger '
+                             'must not be negative')
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.linger = linger
+        self.batches = 0
+        self.requests = 0
+        self.calls = 0
+        self._closed = False
+        # makes checking _closed and queueing atomic with close()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(workers or max_batch_size)
+        self._dispatcher = threading.Thread(target=self._dispatch,
+                                            name='avatax-batcher')
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def __enter__(self):
+        """Use the batcher as a context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the batcher, waiting for the pending requests."""
+        self.close()
+
+    def submit(self, model, include=None):
+        """
+        Queue a transaction and return a future of its response.
+
+        :param  dictionary  model:    The transaction you wish to create
+        :param  dictionary  include:  Objects to include in the response
+        :return: Future resolving to the Response object
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('cannot submit to a closed '
+                                   'TransactionBatcher')
+            self._queue.put((future, model, include))
+        return future
+
+    def create_transaction(self, model, include=None):
+        """
+        Queue a transaction and wait for its response.
+
+        :param  dictionary  model:    The transaction you wish to create
+        :param  dictionary  include:  Objects to include in the response
+        :return: Response object
+        """
+        return self.submit(model, include).result()
+
+    def close(self, wait=True):
+        """
+        Stop accepting requests, dispatch the queued ones and shut down.
+
+        :param  boolean  wait:  Block until every pending request completed
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._dispatcher.join()
+        # nothing is queued after _STOP, fail anything left all the same
+        # rather than leave its caller waiting forever
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item[0].set_running_or_notify_cancel():
+                item[0].set_exception(RuntimeError(
+                    'TransactionBatcher closed before the request was sent'))
+        self._pool.shutdown(wait)
+
+    def _collect(self):
+        """Block for the next batch, return None once closed."""
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = time.time() + self.linger
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # dispatch what we have, stop on the next collect
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _dispatch(self):
+        """Dispatcher thread, group queued requests and hand them out."""
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            self.batches += 1
+            self.requests += len(batch)
+            groups = []
+            estimates = {}
+            for future, model, include in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if is_estimate(model):
+                    key = estimate_key(model, include)
+                    if key in estimates:
+                        estimates[key][0].append(future)
+                        continue
+                    estimates[key] = ([future], model, include)
+                    groups.append(estimates[key])
+                else:
+                    groups.append(([future], model, include))
+            for group in groups:
+                self.calls += 1
+                self._pool.submit(self._run, *group)
+
+    def _run(self, futures, model, include):
+        """Worker thread, create one transaction and resolve its futures."""
+        try:
+            response = self.client.create_transaction(model, include)
+        except Exception as e:
+            for future in futures:
+                future.set_exception(e)
+        else:
+            for future in futures:
+                future.set_result(response)
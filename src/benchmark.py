@@ -0,0 +1,231 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Offline benchmark suite measuring AvataxClient against MockAvataxServer
+
+    python -m benchmark --requests 2000 --concurrency 16 --latency 0.005
+    python -m benchmark --transports requests,urllib3,http2 --concurrency 128
+"""
+from collections import namedtuple
+from _bulk import percentile, run_bulk
+from client import AvataxClient
+from mock_server import MockAvataxServer
+import argparse
+import itertools
+import time
+
+
+class BenchmarkResult(namedtuple('BenchmarkResult', 'name requests errors '
+                                 'elapsed latencies')):
+    """
+    Outcome of one scenario.
+
+    latencies holds the seconds taken by each call, elapsed the seconds
+    taken by the whole scenario.
+    """
+
+    __slots__ = ()
+
+    @property
+    def throughput(self):
+        """Return the calls completed per second."""
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def p50(self):
+        """Return the median latency in seconds."""
+        return percentile(self.latencies, 50)
+
+    @property
+    def p99(self):
+        """Return the 99th percentile latency in seconds."""
+        return percentile(self.latencies, 99)
+
+
+def _sale(number):
+    return {
+        'type': 'SalesInvoice', 'companyCode': 'DEFAULT',
+        'code': 'BENCH-{}'.format(number), 'customerCode': 'ABC',
+        'date': '2018-05-31',
+        'addresses': {'SingleLocation': {
+            'line1': '123 Main Street', 'city': 'Irvine', 'region': 'CA',
+            'postalCode': '92615', 'country': 'US'}},
+        'lines': [{'number': '1', 'amount': 100, 'quantity': 1,
+                   'itemCode': 'Y0001', 'taxCode': 'PS081282'}]}
+
+
+# scenario name -> function(client, call number) making one call
+SCENARIOS = {
+    'ping': lambda client, n: client.ping(),
+    'create_transaction': lambda client, n: client.create_transaction(
+        _sale(n)),
+    'resolve_address': lambda client, n: client.resolve_address_post({
+        'line1': '410 Terry Ave. North', 'city': 'Seattle', 'region': 'WA',
+        'postalCode': '98109', 'country': 'US'}),
+    'tax_rates_by_postal_code': lambda client, n:
+        client.tax_rates_by_postal_code({'country': 'US',
+                                         'postalCode': '98109'}),
+    'list_transactions': lambda client, n:
+        client.list_transactions_by_company('DEFAULT', {'$top': 100}),
+}
+
+
+# transport name -> whether the server talks HTTP/2 to it
+TRANSPORTS = {
+    'requests': False,
+    'urllib3': False,
+    'httpx': False,
+    'http2': True,
+}
+
+# Outcome of one transport in compare_transports
+#   transport    the transport name
+#   result       BenchmarkResult of the scenario
+#   connections  number of connections the server accepted
+TransportResult = namedtuple('TransportResult', 'transport result '
+                             'connections')
+
+
+def run_benchmark(name, call, requests=1000, concurrency=8):
+    """
+    Make requests calls with bounded concurrency and time each of them.
+
+    :param  string    name:         The name of the scenario
+    :param  function  call:         Called with the call number
+    :param  int       requests:     Number of calls
+    :param  int       concurrency:  Maximum number of calls in flight
+    :return: BenchmarkResult
+    """
+    latencies, errors = [], 0
+    start = time.time()
+    for result in run_bulk(call, range(requests), concurrency):
+        latencies.append(result.elapsed)
+        if not result.ok:
+            errors += 1
+    return BenchmarkResult(name, requests, errors, time.time() - start,
+                           latencies)
+
+
+def run_suite(client, scenarios=None, requests=1000, concurrency=8):
+    """
+    Run benchmark scenarios one after the other.
+
+    :param  AvataxClient  client:       The client measured
+    :param  list          scenarios:    Names of SCENARIOS (default: all)
+    :param  int           requests:     Number of calls per scenario
+    :param  int           concurrency:  Maximum number of calls in flight
+    :return: list of BenchmarkResult
+    """
+    counter = itertools.count()
+    results = []
+    for name in scenarios or sorted(SCENARIOS):
+        scenario = SCENARIOS[name]
+        results.append(run_benchmark(
+            name, lambda n: scenario(client, next(counter)), requests,
+            concurrency))
+    return results
+
+
+def compare_transports(transports=None, scenario='create_transaction',
+                       requests=1000, concurrency=128, latency=0.02):
+    """
+    Run a scenario with each transport, each against its own server.
+
+    Shows how many connections each transport needs for a given number of
+    concurrent calls, and the latency it gets with them.
+
+    :param  list       transports:   Names of TRANSPORTS (default: all)
+    :param  string     scenario:     The name of the scenario
+    :param  int        requests:     Number of calls per transport
+    :param  int        concurrency:  Maximum number of calls in flight
+    :param  int/float  latency:      Seconds the server adds to every call
+    :return: list of TransportResult
+    """
+    results = []
+    for name in transports or sorted(TRANSPORTS):
+        with MockAvataxServer(latency, http2=TRANSPORTS[name]) as server:
+            client = AvataxClient('benchmark', '1.0', 'localhost',
+                                  server.url, transport=name)
+            client.add_credentials('bench', 'bench')
+            try:
+                result = run_suite(client, [scenario], requests,
+                                   concurrency)[0]
+            finally:
+                client.transport.close()
+            results.append(TransportResult(name, result, server.connections))
+    return results
+
+
+def format_results(results):
+    """Return the results as a text table."""
+    rows = ['{:<26}{:>9}{:>8}{:>10}{:>10}{:>10}'.format(
+        'scenario', 'calls', 'errors', 'req/s', 'p50 ms', 'p99 ms')]
+    for r in results:
+        rows.append('{:<26}{:>9}{:>8}{:>10.1f}{:>10.2f}{:>10.2f}'.format(
+            r.name, r.requests, r.errors, r.throughput, r.p50 * 1000,
+            r.p99 * 1000))
+    return '\n'.join(rows)
+
+
+def format_transports(results):
+    """Return the results of compare_transports as a text table."""
+    rows = ['{:<12}{:>9}{:>8}{:>7}{:>10}{:>10}{:>10}'.format(
+        'transport', 'calls', 'errors', 'conns', 'req/s', 'p50 ms',
+        'p99 ms')]
+    for t in results:
+        r = t.result
+        rows.append('{:<12}{:>9}{:>8}{:>7}{:>10.1f}{:>10.2f}{:>10.2f}'.format(
+            t.transport, r.requests, r.errors, t.connections, r.throughput,
+            r.p50 * 1000, r.p99 * 1000))
+    return '\n'.join(rows)
+
+
+def main(argv=None):
+    """Run the suite against a local MockAvataxServer and print it."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark AvataxClient against a local stand-in server')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0,
+                        help='seconds the server adds to every call')
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument('--scenario', action='append',
+                        choices=sorted(SCENARIOS))
+    parser.add_argument('--transports',
+                        help='compare transports, e.g. requests,http2')
+    args = parser.parse_args(argv)
+    if args.transports:
+        names = args.transports.split(',')
+        unknown = [n for n in names if n not in TRANSPORTS]
+        if unknown:
+            parser.error('unknown transports: {}'.format(', '.join(unknown)))
+        results = compare_transports(
+            names, (args.scenario or ['create_transaction'])[0],
+            args.requests, args.concurrency, args.latency)
+        print(format_transports(results))
+        return results
+    with MockAvataxServer(args.latency, args.error_rate) as server:
+        client = AvataxClient('benchmark', '1.0', 'localhost', server.url)
+        client.add_credentials('bench', 'bench')
+        results = run_suite(client, args.scenario, args.requests,
+                            args.concurrency)
+    print(format_results(results))
+    return results
+
+
+if __name__ == '__main__':  # pragma no cover
+    main()
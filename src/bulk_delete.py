@@ -0,0 +1,76 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Delete many objects of a company, e.g. to clean up a test company
+"""
+from _bulk import BulkResult, iter_records_by_id, run_bulk
+
+
+# resource name -> (list method, delete method, field identifying the
+# object in the delete call)
+RESOURCES = {
+    'contacts': ('list_contacts_by_company', 'delete_contact', 'id'),
+    'customers': ('query_customers', 'delete_customer', 'customerCode'),
+    'items': ('list_items_by_company', 'delete_item', 'id'),
+    'locations': ('list_locations_by_company', 'delete_location', 'id'),
+    'nexus': ('list_nexus_by_company', 'delete_nexus', 'id'),
+    'settings': ('list_settings_by_company', 'delete_setting', 'id'),
+    'tax_codes': ('list_tax_codes_by_company', 'delete_tax_code', 'id'),
+    'tax_rules': ('list_tax_rules', 'delete_tax_rule', 'id'),
+    'upcs': ('list_u_p_cs_by_company', 'delete_u_p_c', 'id'),
+}
+
+
+def bulk_delete(client, company_id, resource, exclude=None, include=None,
+                dry_run=False, workers=4, rate=None, page_size=1000):
+    r"""
+    Delete every object of a kind owned by a company.
+
+    Objects are streamed page by page from the list endpoint and deleted
+    with bounded concurrency, a result is yielded for each of them as soon
+    as its delete completes. Nothing happens until the generator is
+    consumed.
+
+    :param  AvataxClient  client:      The client used to make the calls
+    :param  int           company_id:  The ID of the company
+    :param  string        resource:    The kind of object to delete \
+        (See RESOURCES for a list of allowable values)
+    :param  function      exclude:     Called with each object, the object \
+        is kept when it returns True
+    :param  dictionary    include:     Query parameters of the list call, \
+        e.g. {'$filter': "region eq 'WA'"}
+    :param  boolean       dry_run:     Only yield the objects that would be \
+        deleted, as results without a response
+    :param  int           workers:     Maximum number of deletes in flight
+    :param  int/float     rate:        Maximum number of deletes per second
+    :param  int           page_size:   Number of objects listed per call
+    :return: generator of BulkResult, the item of a result is the object
+    """
+    if resource not in RESOURCES:
+        raise ValueError('resource must be one of {}'.format(
+            ', '.join(sorted(RESOURCES))))
+    list_name, delete_name, key = RESOURCES[resource]
+    list_call = getattr(client, list_name)
+    delete_call = getattr(client, delete_name)
+    records = iter_records_by_id(lambda params: list_call(company_id, params),
+                                 include, page_size)
+    if exclude:
+        records = (r for r in records if not exclude(r))
+    if dry_run:
+        return (BulkResult(r, None, None, 0) for r in records)
+    return run_bulk(lambda record: delete_call(company_id, record[key]),
+                    records, workers, rate)
@@ -0,0 +1,244 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Record the calls of an AvataxClient to a cassette file, and replay them
+offline at the recorded or an accelerated pace
+
+    with record(client, 'checkout.cassette'):
+        run_checkout(client)
+    with replay(client, 'checkout.cassette', speed=10):
+        profile(run_checkout, client)
+"""
+from contextlib import contextmanager
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import threading
+import time
+try:
+    from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+except ImportError:  # pragma no cover
+    from urllib import urlencode
+    from urlparse import parse_qsl, urlsplit, urlunsplit
+
+
+# Response headers kept in a cassette, the others are dropped
+KEPT_HEADERS = ('Content-Type', 'Content-Disposition', 'Location',
+                'Retry-After')
+
+
+def request_key(method, url, body=None):
+    """
+    Return the key matching a request to its recorded response.
+
+    Query parameters are sorted and the body is hashed, so the key does
+    not depend on dictionary order, and credentials are never part of it.
+
+    :param  string  method:  The HTTP method
+    :param  string  url:     The full url, with its query string
+    :param  bytes   body:    The request body
+    :return: string
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+    if body is not None and not isinstance(body, bytes):
+        body = body.encode('utf-8')
+    digest = hashlib.sha1(body).hexdigest() if body else ''
+    return '{} {} {}'.format(method.upper(), url, digest)
+
+
+class Cassette(object):
+    """Class for recorded calls, stored as gzipped JSON lines."""
+
+    def __init__(self, interactions=None):
+        """
+        Initialize the cassette.
+
+        :param  list  interactions:  Recorded calls, dictionaries with the
+            key, status, headers, body and elapsed seconds of each call
+        """
+        self.interactions = list(interactions or [])
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        """Read a cassette file."""
+        with gzip.open(path, 'rb') as f:
+            return cls(json.loads(line.decode('utf-8')) for line in f
+                       if line.strip())
+
+    def save(self, path):
+        """Write the cassette to a file, one call per line."""
+        with gzip.open(path, 'wb') as f:
+            for interaction in self.interactions:
+                f.write(json.dumps(interaction, separators=(',', ':'),
+                                   sort_keys=True).encode('utf-8') + b'\n')
+
+    def append(self, request, response):
+        """Record a call, reading the whole response body."""
+        body = response.content or b''
+        try:
+            encoded = {'text': body.decode('utf-8')}
+        except UnicodeDecodeError:
+            encoded = {'base64': base64.b64encode(body).decode('ascii')}
+        interaction = {
+            'key': request_key(request.method, request.url, request.body),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': dict((k, response.headers[k]) for k in KEPT_HEADERS
+                            if k in response.headers),
+            'elapsed': response.elapsed.total_seconds(),
+        }
+        interaction.update(encoded)
+        with self._lock:
+            self.interactions.append(interaction)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter making real calls and recording them."""
+
+    def __init__(self, cassette, *args, **kwargs):
+        """
+        Initialize the adapter.
+
+        :param  Cassette  cassette:  The cassette the calls are appended to
+        """
+        HTTPAdapter.__init__(self, *args, **kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        """Make the call, then record it."""
+        response = HTTPAdapter.send(self, request, **kwargs)
+        self.cassette.append(request, response)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter answering calls from a cassette."""
+
+    def __init__(self, cassette, speed=None, sleep=time.sleep):
+        """
+        Initialize the adapter.
+
+        Repeated identical calls are answered with their recorded
+        responses in order, the last one is served again once exhausted.
+
+        :param  Cassette   cassette:  The recorded calls
+        :param  int/float  speed:     None answers at once, 1 takes the
+            recorded time of each call, 10 a tenth of it
+        """
+        BaseAdapter.__init__(self)
+        self.speed = speed
+        self.sleep = sleep
+        self.served = 0
+        self._lock = threading.Lock()
+        self._recorded = {}
+        for interaction in cassette.interactions:
+            self._recorded.setdefault(interaction['key'], []).append(
+                interaction)
+
+    def send(self, request, **kwargs):
+        """Answer the call with its recorded response."""
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            responses = self._recorded.get(key)
+            if not responses:
+                raise KeyError('No recorded response for {}'.format(key))
+            interaction = responses.pop(0) if len(responses) > 1 \
+                else responses[0]
+            self.served += 1
+        if self.speed:
+            self.sleep(interaction['elapsed'] / float(self.speed))
+        return self._build(request, interaction)
+
+    def _build(self, request, interaction):
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        if 'base64' in interaction:
+            response._content = base64.b64decode(interaction['base64'])
+        else:
+            response._content = interaction['text'].encode('utf-8')
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(seconds=interaction['elapsed'])
+        return response
+
+    def close(self):
+        """Nothing to release, no connection was opened."""
+
+
+@contextmanager
+def _mounted(client, adapter):
+    """Route the calls of a client through an adapter."""
+    session = getattr(client.transport, 'session', None)
+    if session is None:
+        raise ValueError('Recording and replaying calls requires the '
+                         'requests transport')
+    saved = dict(session.adapters)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    try:
+        yield adapter
+    finally:
+        adapter.close()
+        session.adapters.clear()
+        for prefix, previous in saved.items():
+            session.mount(prefix, previous)
+
+
+@contextmanager
+def record(client, path):
+    """
+    Record the calls made by a client, saving them to path on exit.
+
+    :param  AvataxClient  client:  The client whose calls are recorded
+    :param  string        path:    The cassette file written
+    :return: Cassette
+    """
+    cassette = Cassette()
+    try:
+        with _mounted(client, RecordingAdapter(cassette)):
+            yield cassette
+    finally:
+        cassette.save(path)
+
+
+@contextmanager
+def replay(client, path, speed=None):
+    """
+    Answer the calls made by a client from a cassette, without network.
+
+    :param  AvataxClient  client:  The client whose calls are answered
+    :param  string        path:    The cassette file read
+    :param  int/float     speed:   None answers at once, 1 at the recorded
+        pace, 10 ten times faster
+    :return: ReplayAdapter
+    """
+    with _mounted(client, ReplayAdapter(Cassette.load(path), speed)) \
+            as adapter:
+        yield adapter
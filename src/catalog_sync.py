@@ -0,0 +1,214 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+CatalogSync keeps the items or UPCs of a company in sync with a local
+product catalog
+"""
+from collections import namedtuple
+from _bulk import (RateLimiter, chunked, create_bisecting,
+                   iter_records_by_id, run_bulk)
+import hashlib
+import json
+import time
+
+
+# How a kind of catalog object is listed, created, updated and deleted
+#   key       field identifying an object in the catalog
+#   fields    fields compared to decide if an object must be updated
+CatalogSpec = namedtuple('CatalogSpec',
+                         'list create update delete key fields')
+
+CATALOGS = {
+    'items': CatalogSpec('list_items_by_company', 'create_items',
+                         'update_item', 'delete_item', 'itemCode',
+                         ('itemCode', 'taxCode', 'description', 'itemGroup')),
+    'upcs': CatalogSpec('list_u_p_cs_by_company', 'create_u_p_cs',
+                        'update_u_p_c', 'delete_u_p_c', 'upc',
+                        ('upc', 'legacyTaxCode', 'description',
+                         'effectiveDate', 'endDate', 'usage')),
+}
+
+# Changes needed to bring the remote catalog in line with the local one
+#   creates    local objects missing from AvaTax
+#   updates    (remote id, local object) of the objects that differ
+#   deletes    (key, remote id) of the objects missing from the local source
+#   unchanged  number of objects that are already up to date
+CatalogDiff = namedtuple('CatalogDiff', 'creates updates deletes unchanged')
+
+# Outcome of CatalogSync.sync
+#   created, updated, deleted, unchanged  number of objects
+#   failures  key -> failed response, or the exception raised
+#   timings   phase (index, diff, apply) -> seconds
+CatalogSyncReport = namedtuple('CatalogSyncReport', 'created updated deleted '
+                               'unchanged failures timings')
+
+
+class CatalogSync(object):
+    """Class for synchronizing a local catalog with AvaTax items or UPCs."""
+
+    def __init__(self, client, company_id, catalog='items', fields=None,
+                 batch_size=100, workers=4, rate=None, page_size=1000):
+        r"""
+        Initialize the sync engine.
+
+        :param  AvataxClient  client:      The client used to make the calls
+        :param  int           company_id:  The ID of the company
+        :param  string        catalog:     items or upcs
+        :param  tuple         fields:      Fields compared to detect an \
+            update (default: the fields of CATALOGS)
+        :param  int           batch_size:  Number of objects per create call
+        :param  int           workers:     Maximum number of calls in flight
+        :param  int/float     rate:        Maximum number of calls per second
+        :param  int           page_size:   Number of objects listed per call
+        """
+        if catalog not in CATALOGS:
+            raise ValueError('catalog must be one of {}'.format(
+                ', '.join(sorted(CATALOGS))))
+        self.client = client
+        self.company_id = company_id
+        self.spec = CATALOGS[catalog]
+        self.fields = fields or self.spec.fields
+        self.batch_size = batch_size
+        self.workers = workers
+        self.rate = rate
+        self.page_size = page_size
+
+    def fingerprint(self, obj):
+        """
+        Return a 16 byte digest of the compared fields of an object.
+
+        :param  dictionary  obj:  An item or UPC
+        :return: bytes
+        """
+        values = json.dumps([obj.get(f) for f in self.fields], default=str)
+        return hashlib.md5(values.encode('utf-8')).digest()
+
+    def remote_index(self):
+        """
+        Stream the remote catalog page by page into a compact index.
+
+        :return: dictionary of key -> (remote id, fingerprint)
+        """
+        list_call = getattr(self.client, self.spec.list)
+        index = {}
+        for obj in iter_records_by_id(
+                lambda params: list_call(self.company_id, params),
+                None, self.page_size):
+            index[obj[self.spec.key]] = (obj['id'], self.fingerprint(obj))
+        return index
+
+    def diff(self, local, index=None):
+        """
+        Compare a local catalog with the remote one.
+
+        :param  iterable    local:  Items or UPCs of the local catalog
+        :param  dictionary  index:  The result of remote_index, fetched if
+            not given
+        :return: CatalogDiff
+        """
+        if index is None:
+            index = self.remote_index()
+        creates, updates = [], []
+        seen = set()
+        unchanged = 0
+        for obj in local:
+            key = obj[self.spec.key]
+            seen.add(key)
+            remote = index.get(key)
+            if remote is None:
+                creates.append(obj)
+            elif remote[1] != self.fingerprint(obj):
+                updates.append((remote[0], obj))
+            else:
+                unchanged += 1
+        deletes = [(key, remote[0]) for key, remote in index.items()
+                   if key not in seen]
+        return CatalogDiff(creates, updates, deletes, unchanged)
+
+    def apply(self, diff, delete=False):
+        """
+        Create, update and, if asked, delete remote objects.
+
+        :param  CatalogDiff  diff:    The changes to apply
+        :param  boolean      delete:  Delete the objects missing locally
+        :return: tuple of (created, updated, deleted, failures)
+        """
+        key = self.spec.key
+        failures = {}
+        created = updated = deleted = 0
+        create_call = getattr(self.client, self.spec.create)
+        update_call = getattr(self.client, self.spec.update)
+        delete_call = getattr(self.client, self.spec.delete)
+
+        def create(chunk):
+            return create_call(self.company_id, chunk)
+
+        # acquired for each call, those splitting a rejected chunk included
+        limiter = RateLimiter(self.rate) if self.rate else None
+        for result in run_bulk(
+                lambda chunk: create_bisecting(create, chunk, limiter),
+                chunked(diff.creates, self.batch_size), self.workers):
+            if result.error is not None:
+                for obj in result.item:
+                    failures[obj[key]] = result.error
+                continue
+            chunk_created, chunk_failed = result.response
+            created += len(chunk_created)
+            for obj, response in chunk_failed:
+                failures[obj[key]] = response
+
+        for result in run_bulk(
+                lambda change: update_call(self.company_id, change[0],
+                                           dict(change[1], id=change[0])),
+                diff.updates, self.workers, self.rate):
+            if result.ok:
+                updated += 1
+            else:
+                failures[result.item[1][key]] = result.error or result.response
+
+        if delete:
+            for result in run_bulk(
+                    lambda change: delete_call(self.company_id, change[1]),
+                    diff.deletes, self.workers, self.rate):
+                if result.ok:
+                    deleted += 1
+                else:
+                    failures[result.item[0]] = result.error or result.response
+        return created, updated, deleted, failures
+
+    def sync(self, local, delete=False):
+        """
+        Bring the remote catalog in line with the local one.
+
+        :param  iterable  local:   Items or UPCs of the local catalog
+        :param  boolean   delete:  Delete remote objects missing locally
+        :return: CatalogSyncReport
+        """
+        timings = {}
+        start = time.time()
+        index = self.remote_index()
+        timings['index'] = time.time() - start
+
+        start = time.time()
+        diff = self.diff(local, index)
+        timings['diff'] = time.time() - start
+
+        start = time.time()
+        created, updated, deleted, failures = self.apply(diff, delete)
+        timings['apply'] = time.time() - start
+        return CatalogSyncReport(created, updated, deleted, diff.unchanged,
+                                 failures, timings)
@@ -0,0 +1,209 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+CertificateTransfer moves many certificate images between disk and AvaTax,
+resuming interrupted transfers from a local journal
+"""
+from collections import namedtuple
+from _bulk import run_bulk
+import os
+import time
+
+
+# File extension of each CertificatePreviewType
+EXTENSIONS = {'pdf': 'pdf', 'jpeg': 'jpg'}
+
+# Largest image uploaded by default, requests builds the multipart body of
+# an upload in memory, so each upload in flight holds its whole image
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+
+class TransferReport(namedtuple('TransferReport', 'transferred skipped '
+                                'failures bytes elapsed')):
+    """
+    Outcome of a transfer.
+
+    transferred and skipped are lists of certificate ids, skipped ones were
+    already done according to the journal. failures maps a certificate id
+    to the failed response, or the exception raised.
+    """
+
+    __slots__ = ()
+
+    @property
+    def throughput(self):
+        """Return the bytes transferred per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+
+def _suffix(include):
+    """Return the file name suffix of the images a download writes."""
+    include = include or {}
+    ext = EXTENSIONS.get(str(include.get('$type', 'Pdf')).lower(), 'pdf')
+    page = int(include.get('$page', 1))
+    return '.' + ext if page == 1 else '-{}.{}'.format(page, ext)
+
+
+class CertificateTransfer(object):
+    """Class for bulk, resumable certificate image transfers."""
+
+    def __init__(self, client, company_id, journal_path, workers=8, rate=None,
+                 chunk_size=64 * 1024, max_upload_size=MAX_UPLOAD_SIZE):
+        """
+        Initialize the transfer manager.
+
+        :param  AvataxClient  client:           The client used to make the
+            calls
+        :param  int           company_id:       The ID of the company
+        :param  string        journal_path:     File recording the completed
+            transfers, shared by every run
+        :param  int           workers:          Maximum number of transfers in
+            flight
+        :param  int/float     rate:             Maximum number of calls per
+            second
+        :param  int           chunk_size:       Bytes written to disk at a time
+        :param  int           max_upload_size:  Bytes of the largest image
+            uploaded, up to workers of them are held in memory at once
+        """
+        self.client = client
+        self.company_id = company_id
+        self.journal_path = journal_path
+        self.workers = workers
+        self.rate = rate
+        self.chunk_size = chunk_size
+        self.max_upload_size = max_upload_size
+
+    def completed(self, direction, include=None):
+        r"""
+        Return the ids the journal records as transferred for the company.
+
+        :param  string      direction:  download or upload
+        :param  dictionary  include:    Query parameters of the downloads, \
+            images of another $type or $page are not done
+        :return: set of string
+        """
+        done = set()
+        if not os.path.exists(self.journal_path):
+            return done
+        variant = _suffix(include) if direction == 'download' else ''
+        key = [direction, str(self.company_id), variant]
+        with open(self.journal_path) as f:
+            for line in f:
+                # direction, company id, certificate id, image suffix
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) == 4 and parts[:2] + parts[3:] == key:
+                    done.add(parts[2])
+        return done
+
+    def _run(self, direction, items, transfer, include=None):
+        """Transfer the items not in the journal, journaling each success."""
+        start = time.time()
+        done = self.completed(direction, include)
+        variant = _suffix(include) if direction == 'download' else ''
+        skipped = []
+
+        def pending():
+            for item in items:
+                if str(item[0]) in done:
+                    skipped.append(item[0])
+                else:
+                    yield item
+
+        transferred, failures, total = [], {}, 0
+        with open(self.journal_path, 'a') as journal:
+            for result in run_bulk(transfer, pending(), self.workers,
+                                   self.rate):
+                cert_id = result.item[0]
+                if result.error is not None or not result.response[0].ok:
+                    failures[cert_id] = result.error or result.response[0]
+                    continue
+                journal.write('{}\t{}\t{}\t{}\n'.format(
+                    direction, self.company_id, cert_id, variant))
+                journal.flush()
+                transferred.append(cert_id)
+                total += result.response[1]
+        return TransferReport(transferred, skipped, failures, total,
+                              time.time() - start)
+
+    def download(self, certificate_ids, directory, include=None):
+        r"""
+        Stream certificate images to disk.
+
+        Each image is written to <directory>/<id>.<pdf|jpg>, or
+        <id>-<page>.<pdf|jpg> for the pages after the first, through a
+        temporary file, so an interrupted download never leaves a partial
+        image behind.
+
+        :param  iterable    certificate_ids:  Ids of the certificates
+        :param  string      directory:        Folder the images are saved to
+        :param  dictionary  include:          Query parameters of the call, \
+            e.g. {'$type': 'Jpeg', '$page': 1}
+        :return: TransferReport
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        suffix = _suffix(include)
+
+        def transfer(item):
+            cert_id = item[0]
+            path = os.path.join(directory, '{}{}'.format(cert_id, suffix))
+            response = self.client.download_certificate_image(
+                self.company_id, cert_id, include, stream=True)
+            size = 0
+            try:
+                if not response.ok:
+                    return response, 0
+                with open(path + '.part', 'wb') as f:
+                    for chunk in response.iter_content(self.chunk_size):
+                        f.write(chunk)
+                        size += len(chunk)
+            except Exception:
+                if os.path.exists(path + '.part'):
+                    os.remove(path + '.part')
+                raise
+            finally:
+                response.close()
+            getattr(os, 'replace', os.rename)(path + '.part', path)
+            return response, size
+
+        return self._run('download', ((i,) for i in certificate_ids),
+                         transfer, include)
+
+    def upload(self, files):
+        """
+        Upload certificate images from disk.
+
+        Unlike downloads, uploads are not streamed: the multipart body of
+        each one is built in memory. Images larger than max_upload_size are
+        reported as failures with a ValueError, and not sent.
+
+        :param  iterable  files:  (certificate id, path of the image) pairs
+        :return: TransferReport
+        """
+        def transfer(item):
+            cert_id, path = item
+            size = os.path.getsize(path)
+            if size > self.max_upload_size:
+                raise ValueError('{} is {} bytes, more than the {} bytes '
+                                 'uploaded at most'.format(
+                                     path, size, self.max_upload_size))
+            with open(path, 'rb') as f:
+                response = self.client.upload_certificate_image(
+                    self.company_id, cert_id, f)
+            return response, size
+
+        return self._run('upload', files, transfer)
@@ -17,15 +17,57 @@ file that was distributed with this source code.
 """
 from requests.auth import HTTPBasicAuth
 from _str_version import str_type
+from estimate_cache import EstimateCache
+from hedging import Hedger
+from oauth import TokenAuth
+from transport import make_transport
+from warm_up import ConnectionWarmer
 import client_methods
+import tax_content
+import _fork
 import os
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma no cover
+    from collections import Mapping
+
+
+class _ReadOnlyDict(Mapping):
+    """Read-only view of a dictionary, MappingProxyType before Python 3.3."""
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+    def __getitem__(self, key):
+        return self._mapping[key]
+
+    def __iter__(self):
+        return iter(self._mapping)
+
+    def __len__(self):
+        return len(self._mapping)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self._mapping)
+
+
+try:
+    from types import MappingProxyType
+except ImportError:  # pragma no cover
+    MappingProxyType = _ReadOnlyDict
+
+
+# Attributes a frozen client refuses to change
+CONFIGURATION = ('base_url', 'auth', 'app_name', 'app_version',
+                 'machine_name', 'client_id', 'client_header',
+                 'timeout_limit', 'transport', 'estimate_cache')
 
 
 class AvataxClient(client_methods.Mixin):
     """Class for our Avatax client."""
 
     def __init__(self, app_name=None, app_version=None, machine_name=None,
-                 environment=None, timeout_limit=None):
+                 environment=None, timeout_limit=None, transport=None):
         """
         Initialize the sandbox client.
 
@@ -38,6 +80,9 @@ class AvataxClient(client_methods.Mixin):
             :param  string  enviroment: Default enviroment is production,
                 input sandbox, for the sandbox API
             :param  int/float The timeout limit for every call made by this client instance. (default: 10 sec)
+            :param  string/Transport  transport: How calls are carried,
+                requests, urllib3, httpx, http2 or a Transport object
+                (default: requests), see transport.py
         :return: object
         """
         if not all(isinstance(i, str_type) for i in [app_name,
@@ -59,6 +104,13 @@ class AvataxClient(client_methods.Mixin):
                                                                 machine_name)
         self.client_header = {'X-Avalara-Client': self.client_id}
         self.timeout_limit = timeout_limit 
+        self.estimate_cache = None
+        self.warmer = None
+        self.hedger = None
+        # every call goes through the transport, which keeps connections
+        # alive between calls
+        self.transport = make_transport(transport)
+        _fork.register(self)
 
     def add_credentials(self, username=None, password=None):
         """
@@ -76,11 +128,212 @@ class AvataxClient(client_methods.Mixin):
         if not all(isinstance(i, str_type) for i in [username, password]):
             raise ValueError('Input(s) must be string or none type object')
         if username and not password:
-            self.client_header['Authorization'] = 'Bearer ' + username
+            # replaced rather than mutated, calls in flight on other
+            # threads keep the headers they started with
+            headers = dict(self.client_header)
+            headers['Authorization'] = 'Bearer ' + username
+            self.client_header = headers
         else:
             self.auth = HTTPBasicAuth(username, password)
         return self
 
+    def add_token_provider(self, provider, refresh_margin=60,
+                           background=True):
+        """
+        Configure this client for OAuth 2.0 tokens fetched by a provider.
+
+        Unlike a bearer token given to add_credentials, the token is
+        refreshed before it expires, and a call answered 401 is retried once
+        with a new token. See oauth.py.
+
+        :param  TokenProvider  provider:        Fetches the tokens, e.g.
+            oauth.ClientCredentialsProvider, or a function returning an
+            oauth.Token
+        :param  int/float      refresh_margin:  Seconds before expiry at
+            which the token is refreshed, half way through its life for
+            shorter lived tokens
+        :param  boolean        background:      Refresh the token in a timer
+            thread, calls never wait for it, else the first call once it
+            is due refreshes it
+        :return: AvataxClient
+        """
+        self.auth = TokenAuth(provider, refresh_margin, background)
+        return self
+
+    def freeze(self):
+        """
+        Make the configuration of this client read-only.
+
+        A frozen client can be shared by any number of threads: its
+        credentials, headers, base url, timeout and transport can no longer
+        change, and changing them raises RuntimeError. Size the connection
+        pool for the number of threads, e.g.
+        AvataxClient(..., transport=RequestsTransport(pool_maxsize=64)).
+
+        :return: AvataxClient
+        """
+        self.client_header = MappingProxyType(dict(self.client_header))
+        self.__dict__['_frozen'] = True
+        return self
+
+    def close(self):
+        """
+        Stop the background work of this client and close its connections.
+
+        Stops the token refresh timer, the warm-up pings and the hedging
+        threads, then closes the transport. The client must not be used
+        afterwards.
+        """
+        if hasattr(self.auth, 'close'):
+            self.auth.close()
+        if self.warmer is not None:
+            self.warmer.stop()
+        if self.hedger is not None:
+            self.hedger.close()
+        self.transport.close()
+
+    def __enter__(self):
+        """Use the client as a context manager, closed on exit."""
+        return self
+
+    def __exit__(self, *exc):
+        """Close the client."""
+        self.close()
+
+    def after_fork(self):
+        """
+        Rebuild the connections and locks of this client in a forked process.
+
+        Called in the child on its own, so a client created before gunicorn
+        or a ProcessPoolExecutor forks its workers can be used in each of
+        them. Cached estimates are kept, a warm-up in progress is started
+        again on the new connections.
+        """
+        self.transport.after_fork()
+        if hasattr(self.auth, 'after_fork'):
+            self.auth.after_fork()
+        if self.estimate_cache is not None:
+            self.estimate_cache.after_fork()
+        if self.hedger is not None:
+            self.hedger.after_fork()
+        if self.warmer is not None:
+            self.warmer.after_fork()
+
+    def __setattr__(self, name, value):
+        """Refuse configuration changes once the client is frozen."""
+        if name in CONFIGURATION and self.__dict__.get('_frozen'):
+            raise RuntimeError('{} of a frozen client cannot change, create '
+                               'another client instead'.format(name))
+        self.__dict__[name] = value
+
+    def enable_estimate_cache(self, ttl=300, max_size=1024):
+        """
+        Cache the results of uncommitted SalesOrder calculations.
+
+        Once enabled, create_transaction answers a repeated SalesOrder with
+        the same addresses, lines and date from memory. Use the returned
+        cache's invalidate methods after changing the company configuration.
+
+        :param  int/float  ttl:       Seconds a cached estimate stays valid
+        :param  int        max_size:  Maximum number of estimates kept
+        :return: EstimateCache
+        """
+        self.estimate_cache = EstimateCache(ttl, max_size)
+        return self.estimate_cache
+
+    def enable_hedging(self, percentile=95, budget=0.05, min_samples=20):
+        """
+        Hedge the reads of tax rates, addresses and transactions by code.
+
+        A tax_rates_by_address, tax_rates_by_postal_code, resolve_address or
+        get_transaction_by_code call slower than the given percentile of
+        its recent calls is sent a second time, and the first answer wins.
+        See hedging.Hedger for the parameters and the hedge counters.
+
+        :return: Hedger
+        """
+        self.hedger = Hedger(percentile, budget, min_samples=min_samples)
+        return self.hedger
+
+    def _hedged(self, name, *args):
+        method = getattr(client_methods.Mixin, name)
+        if self.hedger is None:
+            return method(self, *args)
+        return self.hedger.call(name, lambda: method(self, *args))
+
+    def tax_rates_by_address(self, include=None):
+        """Retrieve the tax rates of an address, see client_methods."""
+        return self._hedged('tax_rates_by_address', include)
+
+    def tax_rates_by_postal_code(self, include=None):
+        """Retrieve the tax rates of a postal code, see client_methods."""
+        return self._hedged('tax_rates_by_postal_code', include)
+
+    def resolve_address(self, include=None):
+        """Retrieve the geolocation of an address, see client_methods."""
+        return self._hedged('resolve_address', include)
+
+    def get_transaction_by_code(self, companyCode, transactionCode,
+                                include=None):
+        """Retrieve a single transaction by code, see client_methods."""
+        return self._hedged('get_transaction_by_code', companyCode,
+                            transactionCode, include)
+
+    def warm_up(self, connections=4, keep_alive=None, wait=False):
+        """
+        Open pooled connections in the background, before calls need them.
+
+        The first calls after startup otherwise pay for DNS, TCP and TLS
+        setup. Pings are made concurrently to open and validate the
+        connections, then again every keep_alive seconds so idle
+        connections are not closed by the server.
+
+        :param  int        connections:  Connections opened, at most the
+            pool size of the transport
+        :param  int/float  keep_alive:   Seconds between pings after the
+            first round (default: no keep-alive)
+        :param  boolean    wait:         Block until the first round
+            completed
+        :return: ConnectionWarmer
+        """
+        if self.warmer is not None:
+            self.warmer.stop()
+        self.warmer = ConnectionWarmer(self, connections, keep_alive).start()
+        if wait:
+            self.warmer.wait()
+        return self.warmer
+
+    def build_tax_content_files(self, company, location_codes, tax_codes=None,
+                                directory='taxfiles', workers=8,
+                                response_type='Json', date=None, report=None):
+        """
+        Build and save a tax content file per location, concurrently.
+
+        See tax_content.build_tax_content_files for the parameters.
+
+        :return: TaxContentRun
+        """
+        return tax_content.build_tax_content_files(
+            self, company, location_codes, tax_codes, directory, workers,
+            response_type, date, report)
+
+    def create_transaction(self, model, include=None):
+        """
+        Create a new transaction, see client_methods for the full description.
+
+        When the estimate cache is enabled, uncommitted SalesOrder
+        calculations are served from it.
+
+        :param  dictionary  model:    The transaction you wish to create
+        :param  dictionary  include:  Objects to include in the response
+        :return: Response object
+        """
+        if self.estimate_cache is None:
+            return client_methods.Mixin.create_transaction(self, model, include)
+        return self.estimate_cache.fetch(
+            model, include,
+            lambda m, i: client_methods.Mixin.create_transaction(self, m, i))
+
 # to generate a client object on initialization of this file, uncomment the script below
 # if __name__ == '__main__':  # pragma no cover
 #     """Creating a client with credential, must have env variables username & password."""
@@ -1,4 +1,3 @@
-import requests
 from _str_version import str_type
 
 
@@ -22,7 +21,7 @@ class Mixin:
       :return LicenseKeyModel
     """
     def account_reset_license_key(self, id_, model):
-        return requests.post('{}/api/v2/accounts/{}/resetlicensekey'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/accounts/{}/resetlicensekey'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -43,7 +42,7 @@ class Mixin:
       :return AccountModel
     """
     def activate_account(self, id_, model, include=None):
-        return requests.post('{}/api/v2/accounts/{}/activate'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/accounts/{}/activate'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -60,7 +59,7 @@ class Mixin:
       :return AccountModel
     """
     def get_account(self, id_, include=None):
-        return requests.get('{}/api/v2/accounts/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/accounts/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -81,7 +80,7 @@ class Mixin:
       :return AccountConfigurationModel
     """
     def get_account_configuration(self, id_):
-        return requests.get('{}/api/v2/accounts/{}/configuration'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/accounts/{}/configuration'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -103,7 +102,7 @@ class Mixin:
       :return AccountConfigurationModel
     """
     def set_account_configuration(self, id_, model):
-        return requests.post('{}/api/v2/accounts/{}/configuration'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/accounts/{}/configuration'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -130,7 +129,7 @@ class Mixin:
       :return AddressResolutionModel
     """
     def resolve_address(self, include=None):
-        return requests.get('{}/api/v2/addresses/resolve'.format(self.base_url),
+        return self.transport.get('{}/api/v2/addresses/resolve'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -148,7 +147,7 @@ class Mixin:
       :return AddressResolutionModel
     """
     def resolve_address_post(self, model):
-        return requests.post('{}/api/v2/addresses/resolve'.format(self.base_url),
+        return self.transport.post('{}/api/v2/addresses/resolve'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -164,7 +163,7 @@ class Mixin:
       :return AdvancedRuleScriptModel
     """
     def approve_advanced_rule_script(self, accountId, scriptType):
-        return requests.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/approve'.format(self.base_url, accountId, scriptType),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/approve'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -182,7 +181,7 @@ class Mixin:
       :return string
     """
     def create_advanced_rule_script(self, accountId, scriptType, include=None):
-        return requests.post('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -199,7 +198,7 @@ class Mixin:
       :return string
     """
     def create_advanced_rule_table(self, accountId, csvTableName):
-        return requests.post('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -215,7 +214,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_advanced_rule_script(self, accountId, scriptType):
-        return requests.delete('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
+        return self.transport.delete('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -231,7 +230,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_advanced_rule_table(self, accountId, csvTableName):
-        return requests.delete('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
+        return self.transport.delete('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -247,7 +246,7 @@ class Mixin:
       :return AdvancedRuleScriptModel
     """
     def disable_advanced_rule_script(self, accountId, scriptType):
-        return requests.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/disable'.format(self.base_url, accountId, scriptType),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/disable'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -263,7 +262,7 @@ class Mixin:
       :return AdvancedRuleScriptModel
     """
     def enable_advanced_rule_script(self, accountId, scriptType):
-        return requests.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/enable'.format(self.base_url, accountId, scriptType),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/enable'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -279,7 +278,7 @@ class Mixin:
       :return AdvancedRuleScriptModel
     """
     def get_advanced_rule_script(self, accountId, scriptType):
-        return requests.get('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
+        return self.transport.get('{}/api/v2/accounts/{}/advancedrulescripts/{}'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -295,7 +294,7 @@ class Mixin:
       :return AdvancedRuleTableModel
     """
     def get_advanced_rule_table(self, accountId, csvTableName):
-        return requests.get('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
+        return self.transport.get('{}/api/v2/accounts/{}/advancedruletables/{}'.format(self.base_url, accountId, csvTableName),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -310,7 +309,7 @@ class Mixin:
       :return AdvancedRuleTableModel
     """
     def get_advanced_rule_tables(self, accountId):
-        return requests.get('{}/api/v2/accounts/{}/advancedruletables'.format(self.base_url, accountId),
+        return self.transport.get('{}/api/v2/accounts/{}/advancedruletables'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -326,7 +325,7 @@ class Mixin:
       :return AdvancedRuleScriptModel
     """
     def unapprove_advanced_rule_script(self, accountId, scriptType):
-        return requests.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/unapprove'.format(self.base_url, accountId, scriptType),
+        return self.transport.post('{}/api/v2/accounts/{}/advancedrulescripts/{}/unapprove'.format(self.base_url, accountId, scriptType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -340,7 +339,7 @@ class Mixin:
       :return AvaFileFormModel
     """
     def create_ava_file_forms(self, model):
-        return requests.post('{}/api/v2/avafileforms'.format(self.base_url),
+        return self.transport.post('{}/api/v2/avafileforms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -353,7 +352,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_ava_file_form(self, id_):
-        return requests.delete('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
+        return self.transport.delete('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -366,7 +365,7 @@ class Mixin:
       :return AvaFileFormModel
     """
     def get_ava_file_form(self, id_):
-        return requests.get('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -384,7 +383,7 @@ class Mixin:
       :return FetchResult
     """
     def query_ava_file_forms(self, include=None):
-        return requests.get('{}/api/v2/avafileforms'.format(self.base_url),
+        return self.transport.get('{}/api/v2/avafileforms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -399,7 +398,7 @@ class Mixin:
       :return AvaFileFormModel
     """
     def update_ava_file_form(self, id_, model):
-        return requests.put('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
+        return self.transport.put('{}/api/v2/avafileforms/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -423,7 +422,7 @@ class Mixin:
       :return BatchModel
     """
     def create_batches(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/batches'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/batches'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -444,7 +443,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_batch(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/batches/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/batches/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -459,7 +458,7 @@ class Mixin:
       :return String
     """
     def download_batch(self, companyId, batchId, id_):
-        return requests.get('{}/api/v2/companies/{}/batches/{}/files/{}/attachment'.format(self.base_url, companyId, batchId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/batches/{}/files/{}/attachment'.format(self.base_url, companyId, batchId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -484,7 +483,7 @@ class Mixin:
       :return BatchModel
     """
     def get_batch(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/batches/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/batches/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -517,7 +516,7 @@ class Mixin:
       :return FetchResult
     """
     def list_batches_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/batches'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/batches'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -547,7 +546,7 @@ class Mixin:
       :return FetchResult
     """
     def query_batches(self, include=None):
-        return requests.get('{}/api/v2/batches'.format(self.base_url),
+        return self.transport.get('{}/api/v2/batches'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -573,7 +572,7 @@ class Mixin:
       :return CertExpressInvitationStatusModel
     """
     def create_cert_express_invitation(self, companyId, customerCode, model):
-        return requests.post('{}/api/v2/companies/{}/customers/{}/certexpressinvites'.format(self.base_url, companyId, customerCode),
+        return self.transport.post('{}/api/v2/companies/{}/customers/{}/certexpressinvites'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -600,7 +599,7 @@ class Mixin:
       :return CertExpressInvitationModel
     """
     def get_cert_express_invitation(self, companyId, customerCode, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/customers/{}/certexpressinvites/{}'.format(self.base_url, companyId, customerCode, id_),
+        return self.transport.get('{}/api/v2/companies/{}/customers/{}/certexpressinvites/{}'.format(self.base_url, companyId, customerCode, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -629,7 +628,7 @@ class Mixin:
       :return FetchResult
     """
     def list_cert_express_invitations(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/certexpressinvites'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/certexpressinvites'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -657,7 +656,7 @@ class Mixin:
       :return CertificateModel
     """
     def create_certificates(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/certificates'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/certificates'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -680,7 +679,7 @@ class Mixin:
       :return CertificateModel
     """
     def delete_certificate(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -703,11 +702,12 @@ class Mixin:
       :param id_ [int] The unique ID number of this certificate
       :param page [int] If you choose `$type`=`Jpeg`, you must specify which page number to retrieve.
       :param type [CertificatePreviewType] The data format in which to retrieve the certificate image (See CertificatePreviewType::* for a list of allowable values)
+      :param stream [boolean] When true, the file is not downloaded until the response content is read, e.g. with iter_content
       :return String
     """
-    def download_certificate_image(self, companyId, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/certificates/{}/attachment'.format(self.base_url, companyId, id_),
-                               auth=self.auth, headers=self.client_header, params=include, 
+    def download_certificate_image(self, companyId, id_, include=None, stream=False):
+        return self.transport.get('{}/api/v2/companies/{}/certificates/{}/attachment'.format(self.base_url, companyId, id_),
+                               auth=self.auth, headers=self.client_header, params=include, stream=stream, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
     r"""
@@ -733,7 +733,7 @@ class Mixin:
       :return CertificateModel
     """
     def get_certificate(self, companyId, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -751,7 +751,7 @@ class Mixin:
       :return ProvisionStatusModel
     """
     def get_certificate_setup(self, companyId):
-        return requests.get('{}/api/v2/companies/{}/certificates/setup'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/certificates/setup'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -776,7 +776,7 @@ class Mixin:
       :return FetchResult
     """
     def link_attributes_to_certificate(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/certificates/{}/attributes/link'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/certificates/{}/attributes/link'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -802,7 +802,7 @@ class Mixin:
       :return FetchResult
     """
     def link_customers_to_certificate(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/certificates/{}/customers/link'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/certificates/{}/customers/link'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -826,7 +826,7 @@ class Mixin:
       :return FetchResult
     """
     def list_attributes_for_certificate(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/certificates/{}/attributes'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/certificates/{}/attributes'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -851,7 +851,7 @@ class Mixin:
       :return FetchResult
     """
     def list_customers_for_certificate(self, companyId, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/certificates/{}/customers'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/certificates/{}/customers'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -881,7 +881,7 @@ class Mixin:
       :return FetchResult
     """
     def query_certificates(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/certificates'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/certificates'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -900,7 +900,7 @@ class Mixin:
       :return ProvisionStatusModel
     """
     def request_certificate_setup(self, companyId):
-        return requests.post('{}/api/v2/companies/{}/certificates/setup'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/certificates/setup'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -925,7 +925,7 @@ class Mixin:
       :return FetchResult
     """
     def unlink_attributes_from_certificate(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/certificates/{}/attributes/unlink'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/certificates/{}/attributes/unlink'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -952,7 +952,7 @@ class Mixin:
       :return FetchResult
     """
     def unlink_customers_from_certificate(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/certificates/{}/customers/unlink'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/certificates/{}/customers/unlink'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -975,7 +975,7 @@ class Mixin:
       :return CertificateModel
     """
     def update_certificate(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/certificates/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -996,12 +996,13 @@ class Mixin:
     
       :param companyId [int] The unique ID number of the company that recorded this certificate
       :param id_ [int] The unique ID number of this certificate
-      :param file [String] The exemption certificate file you wanted to upload. Accepted formats are: PDF, JPEG, TIFF, PNG.
+      :param file [String] The exemption certificate file you wanted to upload, an open binary file. Accepted formats are: PDF, JPEG, TIFF, PNG.
       :return string
     """
-    def upload_certificate_image(self, companyId, id_):
-        return requests.post('{}/api/v2/companies/{}/certificates/{}/attachment'.format(self.base_url, companyId, id_),
+    def upload_certificate_image(self, companyId, id_, file=None):
+        return self.transport.post('{}/api/v2/companies/{}/certificates/{}/attachment'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
+                               files={'file': file} if file else None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
     r"""
@@ -1022,7 +1023,7 @@ class Mixin:
       :return string
     """
     def change_filing_status(self, id_, model):
-        return requests.post('{}/api/v2/companies/{}/filingstatus'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingstatus'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1044,7 +1045,7 @@ class Mixin:
       :return CompanyModel
     """
     def company_initialize(self, model):
-        return requests.post('{}/api/v2/companies/initialize'.format(self.base_url),
+        return self.transport.post('{}/api/v2/companies/initialize'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1059,7 +1060,7 @@ class Mixin:
       :return CompanyModel
     """
     def create_companies(self, model):
-        return requests.post('{}/api/v2/companies'.format(self.base_url),
+        return self.transport.post('{}/api/v2/companies'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1082,7 +1083,7 @@ class Mixin:
       :return FundingStatusModel
     """
     def create_funding_request(self, id_, model):
-        return requests.post('{}/api/v2/companies/{}/funding/setup'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/companies/{}/funding/setup'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1095,7 +1096,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_company(self, id_):
-        return requests.delete('{}/api/v2/companies/{}'.format(self.base_url, id_),
+        return self.transport.delete('{}/api/v2/companies/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1111,7 +1112,7 @@ class Mixin:
       :return FundingConfigurationModel
     """
     def funding_configuration_by_company(self, companyId):
-        return requests.get('{}/api/v2/companies/{}/funding/configuration'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/funding/configuration'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1128,7 +1129,7 @@ class Mixin:
       :return FundingConfigurationModel
     """
     def funding_configurations_by_company_and_currency(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/funding/configurations'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/funding/configurations'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1152,7 +1153,7 @@ class Mixin:
       :return CompanyModel
     """
     def get_company(self, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/companies/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1173,7 +1174,7 @@ class Mixin:
       :return CompanyConfigurationModel
     """
     def get_company_configuration(self, id_):
-        return requests.get('{}/api/v2/companies/{}/configuration'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/companies/{}/configuration'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1195,7 +1196,7 @@ class Mixin:
       :return string
     """
     def get_filing_status(self, id_):
-        return requests.get('{}/api/v2/companies/{}/filingstatus'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/companies/{}/filingstatus'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1211,7 +1212,7 @@ class Mixin:
       :return FundingStatusModel
     """
     def list_funding_requests_by_company(self, id_):
-        return requests.get('{}/api/v2/companies/{}/funding'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/companies/{}/funding'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1224,7 +1225,7 @@ class Mixin:
       :return FetchResult
     """
     def list_mrs_companies(self):
-        return requests.get('{}/api/v2/companies/mrs'.format(self.base_url),
+        return self.transport.get('{}/api/v2/companies/mrs'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1253,7 +1254,7 @@ class Mixin:
       :return FetchResult
     """
     def query_companies(self, include=None):
-        return requests.get('{}/api/v2/companies'.format(self.base_url),
+        return self.transport.get('{}/api/v2/companies'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1275,7 +1276,7 @@ class Mixin:
       :return CompanyConfigurationModel
     """
     def set_company_configuration(self, id_, model):
-        return requests.post('{}/api/v2/companies/{}/configuration'.format(self.base_url, id_),
+        return self.transport.post('{}/api/v2/companies/{}/configuration'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1294,7 +1295,7 @@ class Mixin:
       :return CompanyModel
     """
     def update_company(self, id_, model):
-        return requests.put('{}/api/v2/companies/{}'.format(self.base_url, id_),
+        return self.transport.put('{}/api/v2/companies/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1310,7 +1311,7 @@ class Mixin:
       :return ContactModel
     """
     def create_contacts(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/contacts'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/contacts'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1324,7 +1325,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_contact(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1340,7 +1341,7 @@ class Mixin:
       :return ContactModel
     """
     def get_contact(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1360,7 +1361,7 @@ class Mixin:
       :return FetchResult
     """
     def list_contacts_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/contacts'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/contacts'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1381,7 +1382,7 @@ class Mixin:
       :return FetchResult
     """
     def query_contacts(self, include=None):
-        return requests.get('{}/api/v2/contacts'.format(self.base_url),
+        return self.transport.get('{}/api/v2/contacts'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1400,7 +1401,7 @@ class Mixin:
       :return ContactModel
     """
     def update_contact(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/contacts/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1425,7 +1426,7 @@ class Mixin:
       :return CustomerModel
     """
     def create_customers(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/customers'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/customers'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1448,7 +1449,7 @@ class Mixin:
       :return CustomerModel
     """
     def delete_customer(self, companyId, customerCode):
-        return requests.delete('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
+        return self.transport.delete('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1475,7 +1476,7 @@ class Mixin:
       :return CustomerModel
     """
     def get_customer(self, companyId, customerCode, include=None):
-        return requests.get('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
+        return self.transport.get('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1499,7 +1500,7 @@ class Mixin:
       :return FetchResult
     """
     def link_certificates_to_customer(self, companyId, customerCode, model):
-        return requests.post('{}/api/v2/companies/{}/customers/{}/certificates/link'.format(self.base_url, companyId, customerCode),
+        return self.transport.post('{}/api/v2/companies/{}/customers/{}/certificates/link'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1527,7 +1528,7 @@ class Mixin:
       :return FetchResult
     """
     def list_certificates_for_customer(self, companyId, customerCode, include=None):
-        return requests.get('{}/api/v2/companies/{}/customers/{}/certificates'.format(self.base_url, companyId, customerCode),
+        return self.transport.get('{}/api/v2/companies/{}/customers/{}/certificates'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1554,7 +1555,7 @@ class Mixin:
       :return ExemptionStatusModel
     """
     def list_valid_certificates_for_customer(self, companyId, customerCode, country, region):
-        return requests.get('{}/api/v2/companies/{}/customers/{}/certificates/{}/{}'.format(self.base_url, companyId, customerCode, country, region),
+        return self.transport.get('{}/api/v2/companies/{}/customers/{}/certificates/{}/{}'.format(self.base_url, companyId, customerCode, country, region),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1583,7 +1584,7 @@ class Mixin:
       :return FetchResult
     """
     def query_customers(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/customers'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/customers'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1607,7 +1608,7 @@ class Mixin:
       :return FetchResult
     """
     def unlink_certificates_from_customer(self, companyId, customerCode, model):
-        return requests.post('{}/api/v2/companies/{}/customers/{}/certificates/unlink'.format(self.base_url, companyId, customerCode),
+        return self.transport.post('{}/api/v2/companies/{}/customers/{}/certificates/unlink'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1631,7 +1632,7 @@ class Mixin:
       :return CustomerModel
     """
     def update_customer(self, companyId, customerCode, model):
-        return requests.put('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
+        return self.transport.put('{}/api/v2/companies/{}/customers/{}'.format(self.base_url, companyId, customerCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1651,7 +1652,7 @@ class Mixin:
       :return FetchResult
     """
     def get_cross_border_code(self, country, hsCode):
-        return requests.get('{}/api/v2/definitions/crossborder/{}/{}/hierarchy'.format(self.base_url, country, hsCode),
+        return self.transport.get('{}/api/v2/definitions/crossborder/{}/{}/hierarchy'.format(self.base_url, country, hsCode),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1669,7 +1670,7 @@ class Mixin:
       :return FetchResult
     """
     def get_login_verifier_by_form(self, form, include=None):
-        return requests.get('{}/api/v2/definitions/filingcalendars/loginverifiers/{}'.format(self.base_url, form),
+        return self.transport.get('{}/api/v2/definitions/filingcalendars/loginverifiers/{}'.format(self.base_url, form),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1688,7 +1689,7 @@ class Mixin:
       :return FetchResult
     """
     def list_ava_file_forms(self, include=None):
-        return requests.get('{}/api/v2/definitions/avafileforms'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/avafileforms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1708,7 +1709,7 @@ class Mixin:
       :return FetchResult
     """
     def list_certificate_attributes(self, include=None):
-        return requests.get('{}/api/v2/definitions/certificateattributes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/certificateattributes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1728,7 +1729,7 @@ class Mixin:
       :return FetchResult
     """
     def list_certificate_exempt_reasons(self, include=None):
-        return requests.get('{}/api/v2/definitions/certificateexemptreasons'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/certificateexemptreasons'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1748,7 +1749,7 @@ class Mixin:
       :return FetchResult
     """
     def list_certificate_exposure_zones(self, include=None):
-        return requests.get('{}/api/v2/definitions/certificateexposurezones'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/certificateexposurezones'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1765,7 +1766,7 @@ class Mixin:
       :return FetchResult
     """
     def list_communications_service_types(self, id_, include=None):
-        return requests.get('{}/api/v2/definitions/communications/transactiontypes/{}/servicetypes'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/definitions/communications/transactiontypes/{}/servicetypes'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1782,7 +1783,7 @@ class Mixin:
       :return FetchResult
     """
     def list_communications_transaction_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/communications/transactiontypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/communications/transactiontypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1799,7 +1800,7 @@ class Mixin:
       :return FetchResult
     """
     def list_communications_t_s_pairs(self, include=None):
-        return requests.get('{}/api/v2/definitions/communications/tspairs'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/communications/tspairs'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1817,7 +1818,7 @@ class Mixin:
       :return FetchResult
     """
     def list_countries(self, include=None):
-        return requests.get('{}/api/v2/definitions/countries'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/countries'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1838,7 +1839,7 @@ class Mixin:
       :return FetchResult
     """
     def list_cover_letters(self, include=None):
-        return requests.get('{}/api/v2/definitions/coverletters'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/coverletters'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1861,7 +1862,7 @@ class Mixin:
       :return FetchResult
     """
     def list_cross_border_codes(self, country, hsCode, include=None):
-        return requests.get('{}/api/v2/definitions/crossborder/{}/{}'.format(self.base_url, country, hsCode),
+        return self.transport.get('{}/api/v2/definitions/crossborder/{}/{}'.format(self.base_url, country, hsCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1877,7 +1878,7 @@ class Mixin:
       :return FetchResult
     """
     def list_cross_border_sections(self):
-        return requests.get('{}/api/v2/definitions/crossborder/sections'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/crossborder/sections'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1895,7 +1896,7 @@ class Mixin:
       :return FetchResult
     """
     def list_currencies(self, include=None):
-        return requests.get('{}/api/v2/definitions/currencies'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/currencies'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1915,7 +1916,7 @@ class Mixin:
       :return FetchResult
     """
     def list_entity_use_codes(self, include=None):
-        return requests.get('{}/api/v2/definitions/entityusecodes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/entityusecodes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1932,7 +1933,7 @@ class Mixin:
       :return FetchResult
     """
     def list_filing_frequencies(self, include=None):
-        return requests.get('{}/api/v2/definitions/filingfrequencies'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/filingfrequencies'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1950,7 +1951,7 @@ class Mixin:
       :return FetchResult
     """
     def list_jurisdictions(self, include=None):
-        return requests.get('{}/api/v2/definitions/jurisdictions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/jurisdictions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -1977,7 +1978,7 @@ class Mixin:
       :return FetchResult
     """
     def list_jurisdictions_by_address(self, include=None):
-        return requests.get('{}/api/v2/definitions/jurisdictionsnearaddress'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/jurisdictionsnearaddress'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2007,7 +2008,7 @@ class Mixin:
       :return FetchResult
     """
     def list_location_questions_by_address(self, include=None):
-        return requests.get('{}/api/v2/definitions/locationquestions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/locationquestions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2025,7 +2026,7 @@ class Mixin:
       :return FetchResult
     """
     def list_login_verifiers(self, include=None):
-        return requests.get('{}/api/v2/definitions/filingcalendars/loginverifiers'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/filingcalendars/loginverifiers'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2042,7 +2043,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus(self, include=None):
-        return requests.get('{}/api/v2/definitions/nexus'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/nexus'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2069,7 +2070,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus_by_address(self, include=None):
-        return requests.get('{}/api/v2/definitions/nexus/byaddress'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/nexus/byaddress'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2087,7 +2088,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus_by_country(self, country, include=None):
-        return requests.get('{}/api/v2/definitions/nexus/{}'.format(self.base_url, country),
+        return self.transport.get('{}/api/v2/definitions/nexus/{}'.format(self.base_url, country),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2106,7 +2107,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus_by_country_and_region(self, country, region, include=None):
-        return requests.get('{}/api/v2/definitions/nexus/{}/{}'.format(self.base_url, country, region),
+        return self.transport.get('{}/api/v2/definitions/nexus/{}/{}'.format(self.base_url, country, region),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2130,7 +2131,7 @@ class Mixin:
       :return NexusByTaxFormModel
     """
     def list_nexus_by_form_code(self, formCode, include=None):
-        return requests.get('{}/api/v2/definitions/nexus/byform/{}'.format(self.base_url, formCode),
+        return self.transport.get('{}/api/v2/definitions/nexus/byform/{}'.format(self.base_url, formCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2147,7 +2148,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus_tax_type_groups(self, include=None):
-        return requests.get('{}/api/v2/definitions/nexustaxtypegroups'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/nexustaxtypegroups'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2164,7 +2165,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_customer_funding_options(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticecustomerfundingoptions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticecustomerfundingoptions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2181,7 +2182,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_customer_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticecustomertypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticecustomertypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2198,7 +2199,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_filingtypes(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticefilingtypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticefilingtypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2215,7 +2216,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_priorities(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticepriorities'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticepriorities'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2232,7 +2233,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_reasons(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticereasons'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticereasons'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2249,7 +2250,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_responsibilities(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticeresponsibilities'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticeresponsibilities'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2266,7 +2267,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_root_causes(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticerootcauses'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticerootcauses'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2283,7 +2284,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_statuses(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticestatuses'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticestatuses'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2300,7 +2301,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notice_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/noticetypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/noticetypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2318,7 +2319,7 @@ class Mixin:
       :return FetchResult
     """
     def list_parameters(self, include=None):
-        return requests.get('{}/api/v2/definitions/parameters'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/parameters'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2333,7 +2334,7 @@ class Mixin:
       :return FetchResult
     """
     def list_permissions(self, include=None):
-        return requests.get('{}/api/v2/definitions/permissions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/permissions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2349,7 +2350,7 @@ class Mixin:
       :return FetchResult
     """
     def list_postal_codes(self, include=None):
-        return requests.get('{}/api/v2/definitions/postalcodes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/postalcodes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2371,7 +2372,7 @@ class Mixin:
       :return FetchResult
     """
     def list_preferred_programs(self, include=None):
-        return requests.get('{}/api/v2/definitions/preferredprograms'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/preferredprograms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2389,7 +2390,7 @@ class Mixin:
       :return FetchResult
     """
     def list_rate_types_by_country(self, country, include=None):
-        return requests.get('{}/api/v2/definitions/countries/{}/ratetypes'.format(self.base_url, country),
+        return self.transport.get('{}/api/v2/definitions/countries/{}/ratetypes'.format(self.base_url, country),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2407,7 +2408,7 @@ class Mixin:
       :return FetchResult
     """
     def list_regions(self, include=None):
-        return requests.get('{}/api/v2/definitions/regions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/regions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2426,7 +2427,7 @@ class Mixin:
       :return FetchResult
     """
     def list_regions_by_country(self, country, include=None):
-        return requests.get('{}/api/v2/definitions/countries/{}/regions'.format(self.base_url, country),
+        return self.transport.get('{}/api/v2/definitions/countries/{}/regions'.format(self.base_url, country),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2443,7 +2444,7 @@ class Mixin:
       :return FetchResult
     """
     def list_resource_file_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/resourcefiletypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/resourcefiletypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2461,7 +2462,7 @@ class Mixin:
       :return FetchResult
     """
     def list_security_roles(self, include=None):
-        return requests.get('{}/api/v2/definitions/securityroles'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/securityroles'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2480,7 +2481,7 @@ class Mixin:
       :return FetchResult
     """
     def list_subscription_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/subscriptiontypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/subscriptiontypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2497,7 +2498,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_authorities(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxauthorities'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxauthorities'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2516,7 +2517,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_authority_forms(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxauthorityforms'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxauthorityforms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2533,7 +2534,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_authority_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxauthoritytypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxauthoritytypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2553,7 +2554,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_codes(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxcodes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxcodes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2569,7 +2570,7 @@ class Mixin:
       :return TaxCodeTypesModel
     """
     def list_tax_code_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxcodetypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxcodetypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2586,7 +2587,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_forms(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxforms'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxforms'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2603,7 +2604,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_sub_types(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxsubtypes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxsubtypes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2620,7 +2621,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_type_groups(self, include=None):
-        return requests.get('{}/api/v2/definitions/taxtypegroups'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/taxtypegroups'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2637,7 +2638,7 @@ class Mixin:
       :return FetchResult
     """
     def list_unit_of_measurement(self, include=None):
-        return requests.get('{}/api/v2/definitions/unitofmeasurements'.format(self.base_url),
+        return self.transport.get('{}/api/v2/definitions/unitofmeasurements'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2654,7 +2655,7 @@ class Mixin:
       :return CompanyDistanceThresholdModel
     """
     def create_distance_threshold(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/distancethresholds'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/distancethresholds'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2671,7 +2672,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_distance_threshold(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2688,7 +2689,7 @@ class Mixin:
       :return CompanyDistanceThresholdModel
     """
     def get_distance_threshold(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2709,7 +2710,7 @@ class Mixin:
       :return FetchResult
     """
     def list_distance_thresholds(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/distancethresholds'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/distancethresholds'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2731,7 +2732,7 @@ class Mixin:
       :return FetchResult
     """
     def query_distance_thresholds(self, include=None):
-        return requests.get('{}/api/v2/distancethresholds'.format(self.base_url),
+        return self.transport.get('{}/api/v2/distancethresholds'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2751,7 +2752,7 @@ class Mixin:
       :return CompanyDistanceThresholdModel
     """
     def update_distance_threshold(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/distancethresholds/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2768,7 +2769,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def approve_filing_request(self, companyId, id_):
-        return requests.post('{}/api/v2/companies/{}/filingrequests/{}/approve'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingrequests/{}/approve'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2784,7 +2785,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def cancel_filing_request(self, companyId, id_):
-        return requests.post('{}/api/v2/companies/{}/filingrequests/{}/cancel'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingrequests/{}/cancel'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2801,7 +2802,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def cancel_filing_requests(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/filingcalendars/{}/cancel/request'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingcalendars/{}/cancel/request'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2816,7 +2817,7 @@ class Mixin:
       :return FilingCalendarModel
     """
     def create_filing_calendars(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/filingcalendars'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/filingcalendars'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2832,7 +2833,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def create_filing_requests(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/filingcalendars/add/request'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/filingcalendars/add/request'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2846,7 +2847,7 @@ class Mixin:
       :return CycleAddOptionModel
     """
     def cycle_safe_add(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/filingcalendars/add/options'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/filingcalendars/add/options'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2861,7 +2862,7 @@ class Mixin:
       :return CycleEditOptionModel
     """
     def cycle_safe_edit(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/filingcalendars/{}/edit/options'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingcalendars/{}/edit/options'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2875,7 +2876,7 @@ class Mixin:
       :return CycleExpireModel
     """
     def cycle_safe_expiration(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/filingcalendars/{}/cancel/options'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/filingcalendars/{}/cancel/options'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2892,7 +2893,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_filing_calendar(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2906,7 +2907,7 @@ class Mixin:
       :return FilingCalendarModel
     """
     def get_filing_calendar(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2922,7 +2923,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def get_filing_request(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/filingrequests/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/filingrequests/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2941,7 +2942,7 @@ class Mixin:
       :return FetchResult
     """
     def list_filing_calendars(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/filingcalendars'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/filingcalendars'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2961,7 +2962,7 @@ class Mixin:
       :return FetchResult
     """
     def list_filing_requests(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/filingrequests'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/filingrequests'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2975,7 +2976,7 @@ class Mixin:
       :return LoginVerificationOutputModel
     """
     def login_verification_request(self, model):
-        return requests.post('{}/api/v2/filingcalendars/credentials/verify'.format(self.base_url),
+        return self.transport.post('{}/api/v2/filingcalendars/credentials/verify'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -2990,7 +2991,7 @@ class Mixin:
       :return LoginVerificationOutputModel
     """
     def login_verification_status(self, jobId):
-        return requests.get('{}/api/v2/filingcalendars/credentials/{}'.format(self.base_url, jobId),
+        return self.transport.get('{}/api/v2/filingcalendars/credentials/{}'.format(self.base_url, jobId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3008,7 +3009,7 @@ class Mixin:
       :return FetchResult
     """
     def query_filing_calendars(self, include=None):
-        return requests.get('{}/api/v2/filingcalendars'.format(self.base_url),
+        return self.transport.get('{}/api/v2/filingcalendars'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3029,7 +3030,7 @@ class Mixin:
       :return FetchResult
     """
     def query_filing_requests(self, include=None):
-        return requests.get('{}/api/v2/filingrequests'.format(self.base_url),
+        return self.transport.get('{}/api/v2/filingrequests'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3048,7 +3049,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def request_filing_calendar_update(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/filingcalendars/{}/edit/request'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/filingcalendars/{}/edit/request'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3063,7 +3064,7 @@ class Mixin:
       :return FilingCalendarModel
     """
     def update_filing_calendar(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/filingcalendars/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3080,7 +3081,7 @@ class Mixin:
       :return FilingRequestModel
     """
     def update_filing_request(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/filingrequests/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/filingrequests/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3102,7 +3103,7 @@ class Mixin:
       :return FilingModel
     """
     def approve_filings(self, companyId, year, month, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/approve'.format(self.base_url, companyId, year, month),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/approve'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3125,7 +3126,7 @@ class Mixin:
       :return FilingModel
     """
     def approve_filings_country(self, companyId, year, month, country, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/approve'.format(self.base_url, companyId, year, month, country),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/approve'.format(self.base_url, companyId, year, month, country),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3149,7 +3150,7 @@ class Mixin:
       :return FilingModel
     """
     def approve_filings_country_region(self, companyId, year, month, country, region, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/approve'.format(self.base_url, companyId, year, month, country, region),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/approve'.format(self.base_url, companyId, year, month, country, region),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3173,7 +3174,7 @@ class Mixin:
       :return FilingAdjustmentModel
     """
     def create_return_adjustment(self, companyId, year, month, country, region, formCode, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/adjust'.format(self.base_url, companyId, year, month, country, region, formCode),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/adjust'.format(self.base_url, companyId, year, month, country, region, formCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3196,7 +3197,7 @@ class Mixin:
       :return FilingAugmentationModel
     """
     def create_return_augmentation(self, companyId, year, month, country, region, formCode, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/augment'.format(self.base_url, companyId, year, month, country, region, formCode),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/augment'.format(self.base_url, companyId, year, month, country, region, formCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3220,7 +3221,7 @@ class Mixin:
       :return FilingPaymentModel
     """
     def create_return_payment(self, companyId, year, month, country, region, formCode, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/payment'.format(self.base_url, companyId, year, month, country, region, formCode),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}/payment'.format(self.base_url, companyId, year, month, country, region, formCode),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3239,7 +3240,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_return_adjustment(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/filings/adjust/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/filings/adjust/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3257,7 +3258,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_return_augmentation(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/filings/augment/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/filings/augment/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3276,7 +3277,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_return_payment(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/filings/payment/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/filings/payment/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3290,7 +3291,7 @@ class Mixin:
       :return FilingsCheckupModel
     """
     def filings_checkup_report(self, filingsId, companyId):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/checkup'.format(self.base_url, filingsId, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/checkup'.format(self.base_url, filingsId, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3305,7 +3306,7 @@ class Mixin:
       :return FilingsCheckupModel
     """
     def filings_checkup_reports(self, companyId, year, month):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/checkup'.format(self.base_url, companyId, year, month),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/checkup'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3320,7 +3321,7 @@ class Mixin:
       :return String
     """
     def get_filing_attachment(self, companyId, filingReturnId, include=None):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/attachment'.format(self.base_url, companyId, filingReturnId),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/attachment'.format(self.base_url, companyId, filingReturnId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3337,7 +3338,7 @@ class Mixin:
       :return String
     """
     def get_filing_attachments(self, companyId, year, month):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/attachments'.format(self.base_url, companyId, year, month),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/attachments'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3354,7 +3355,7 @@ class Mixin:
       :return String
     """
     def get_filing_attachments_trace_file(self, companyId, year, month):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/attachments/tracefile'.format(self.base_url, companyId, year, month),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/attachments/tracefile'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3370,7 +3371,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filing_return(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/filings/returns/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/filings/returns/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3387,7 +3388,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filings(self, companyId, year, month):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}'.format(self.base_url, companyId, year, month),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3405,7 +3406,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filings_by_country(self, companyId, year, month, country):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/{}'.format(self.base_url, companyId, year, month, country),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/{}'.format(self.base_url, companyId, year, month, country),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3424,7 +3425,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filings_by_country_region(self, companyId, year, month, country, region):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/{}/{}'.format(self.base_url, companyId, year, month, country, region),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/{}/{}'.format(self.base_url, companyId, year, month, country, region),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3444,7 +3445,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filings_by_return_name(self, companyId, year, month, country, region, formCode):
-        return requests.get('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}'.format(self.base_url, companyId, year, month, country, region, formCode),
+        return self.transport.get('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/{}'.format(self.base_url, companyId, year, month, country, region, formCode),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3465,7 +3466,7 @@ class Mixin:
       :return FetchResult
     """
     def get_filings_returns(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/filings/returns'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/filings/returns'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3486,7 +3487,7 @@ class Mixin:
       :return FetchResult
     """
     def rebuild_filings(self, companyId, year, month, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/rebuild'.format(self.base_url, companyId, year, month),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/rebuild'.format(self.base_url, companyId, year, month),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3508,7 +3509,7 @@ class Mixin:
       :return FetchResult
     """
     def rebuild_filings_by_country(self, companyId, year, month, country, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/rebuild'.format(self.base_url, companyId, year, month, country),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/rebuild'.format(self.base_url, companyId, year, month, country),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3531,7 +3532,7 @@ class Mixin:
       :return FetchResult
     """
     def rebuild_filings_by_country_region(self, companyId, year, month, country, region, model):
-        return requests.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/rebuild'.format(self.base_url, companyId, year, month, country, region),
+        return self.transport.post('{}/api/v2/companies/{}/filings/{}/{}/{}/{}/rebuild'.format(self.base_url, companyId, year, month, country, region),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3551,7 +3552,7 @@ class Mixin:
       :return FilingAdjustmentModel
     """
     def update_return_adjustment(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/filings/adjust/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/filings/adjust/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3570,7 +3571,7 @@ class Mixin:
       :return FilingModel
     """
     def update_return_augmentation(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/filings/augment/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/filings/augment/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3590,7 +3591,7 @@ class Mixin:
       :return FilingPaymentModel
     """
     def update_return_payment(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/filings/payment/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/filings/payment/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3609,7 +3610,7 @@ class Mixin:
       :return NewAccountModel
     """
     def request_free_trial(self, model):
-        return requests.post('{}/api/v2/accounts/freetrials/request'.format(self.base_url),
+        return self.transport.post('{}/api/v2/accounts/freetrials/request'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3646,7 +3647,7 @@ class Mixin:
       :return TaxRateModel
     """
     def tax_rates_by_address(self, include=None):
-        return requests.get('{}/api/v2/taxrates/byaddress'.format(self.base_url),
+        return self.transport.get('{}/api/v2/taxrates/byaddress'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3679,7 +3680,7 @@ class Mixin:
       :return TaxRateModel
     """
     def tax_rates_by_postal_code(self, include=None):
-        return requests.get('{}/api/v2/taxrates/bypostalcode'.format(self.base_url),
+        return self.transport.get('{}/api/v2/taxrates/bypostalcode'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3703,7 +3704,7 @@ class Mixin:
       :return FundingStatusModel
     """
     def activate_funding_request(self, id_):
-        return requests.get('{}/api/v2/fundingrequests/{}/widget'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/fundingrequests/{}/widget'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3725,7 +3726,7 @@ class Mixin:
       :return FundingStatusModel
     """
     def funding_request_status(self, id_):
-        return requests.get('{}/api/v2/fundingrequests/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/fundingrequests/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3744,7 +3745,7 @@ class Mixin:
       :return ItemModel
     """
     def create_items(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/items'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/items'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3763,7 +3764,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_item(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3782,7 +3783,7 @@ class Mixin:
       :return ItemModel
     """
     def get_item(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3809,7 +3810,7 @@ class Mixin:
       :return FetchResult
     """
     def list_items_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/items'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/items'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3835,7 +3836,7 @@ class Mixin:
       :return FetchResult
     """
     def query_items(self, include=None):
-        return requests.get('{}/api/v2/items'.format(self.base_url),
+        return self.transport.get('{}/api/v2/items'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3857,7 +3858,7 @@ class Mixin:
       :return ItemModel
     """
     def update_item(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/items/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3875,7 +3876,7 @@ class Mixin:
       :return JurisdictionOverrideModel
     """
     def create_jurisdiction_overrides(self, accountId, model):
-        return requests.post('{}/api/v2/accounts/{}/jurisdictionoverrides'.format(self.base_url, accountId),
+        return self.transport.post('{}/api/v2/accounts/{}/jurisdictionoverrides'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3889,7 +3890,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_jurisdiction_override(self, accountId, id_):
-        return requests.delete('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
+        return self.transport.delete('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3907,7 +3908,7 @@ class Mixin:
       :return JurisdictionOverrideModel
     """
     def get_jurisdiction_override(self, accountId, id_):
-        return requests.get('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
+        return self.transport.get('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3931,7 +3932,7 @@ class Mixin:
       :return FetchResult
     """
     def list_jurisdiction_overrides_by_account(self, accountId, include=None):
-        return requests.get('{}/api/v2/accounts/{}/jurisdictionoverrides'.format(self.base_url, accountId),
+        return self.transport.get('{}/api/v2/accounts/{}/jurisdictionoverrides'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3954,7 +3955,7 @@ class Mixin:
       :return FetchResult
     """
     def query_jurisdiction_overrides(self, include=None):
-        return requests.get('{}/api/v2/jurisdictionoverrides'.format(self.base_url),
+        return self.transport.get('{}/api/v2/jurisdictionoverrides'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3969,7 +3970,7 @@ class Mixin:
       :return JurisdictionOverrideModel
     """
     def update_jurisdiction_override(self, accountId, id_, model):
-        return requests.put('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
+        return self.transport.put('{}/api/v2/accounts/{}/jurisdictionoverrides/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3983,7 +3984,7 @@ class Mixin:
       :return LocationModel
     """
     def create_locations(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/locations'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/locations'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -3997,7 +3998,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_location(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4018,7 +4019,7 @@ class Mixin:
       :return LocationModel
     """
     def get_location(self, companyId, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4044,7 +4045,7 @@ class Mixin:
       :return FetchResult
     """
     def list_locations_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/locations'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/locations'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4069,7 +4070,7 @@ class Mixin:
       :return FetchResult
     """
     def query_locations(self, include=None):
-        return requests.get('{}/api/v2/locations'.format(self.base_url),
+        return self.transport.get('{}/api/v2/locations'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4086,7 +4087,7 @@ class Mixin:
       :return LocationModel
     """
     def update_location(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/locations/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4102,7 +4103,7 @@ class Mixin:
       :return LocationValidationModel
     """
     def validate_location(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/locations/{}/validate'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/locations/{}/validate'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4123,7 +4124,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def adjust_multi_document_transaction(self, code, type, model, include=None):
-        return requests.post('{}/api/v2/transactions/multidocument/{}/type/{}/adjust'.format(self.base_url, code, type),
+        return self.transport.post('{}/api/v2/transactions/multidocument/{}/type/{}/adjust'.format(self.base_url, code, type),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4147,7 +4148,7 @@ class Mixin:
       :return AuditMultiDocumentModel
     """
     def audit_multi_document_transaction(self, code, type):
-        return requests.get('{}/api/v2/transactions/multidocument/{}/type/{}/audit'.format(self.base_url, code, type),
+        return self.transport.get('{}/api/v2/transactions/multidocument/{}/type/{}/audit'.format(self.base_url, code, type),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4164,7 +4165,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def commit_multi_document_transaction(self, model):
-        return requests.post('{}/api/v2/transactions/multidocument/commit'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/multidocument/commit'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4201,7 +4202,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def create_multi_document_transaction(self, model, include=None):
-        return requests.post('{}/api/v2/transactions/multidocument'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/multidocument'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4224,7 +4225,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def get_multi_document_transaction_by_code_and_type(self, code, type, include=None):
-        return requests.get('{}/api/v2/transactions/multidocument/{}/type/{}'.format(self.base_url, code, type),
+        return self.transport.get('{}/api/v2/transactions/multidocument/{}/type/{}'.format(self.base_url, code, type),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4253,7 +4254,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def get_multi_document_transaction_by_id(self, id_, include=None):
-        return requests.get('{}/api/v2/transactions/multidocument/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/transactions/multidocument/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4283,7 +4284,7 @@ class Mixin:
       :return FetchResult
     """
     def list_multi_document_transactions(self, include=None):
-        return requests.get('{}/api/v2/transactions/multidocument'.format(self.base_url),
+        return self.transport.get('{}/api/v2/transactions/multidocument'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4325,7 +4326,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def refund_multi_document_transaction(self, code, type, model, include=None):
-        return requests.post('{}/api/v2/transactions/multidocument/{}/type/{}/refund'.format(self.base_url, code, type),
+        return self.transport.post('{}/api/v2/transactions/multidocument/{}/type/{}/refund'.format(self.base_url, code, type),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4341,7 +4342,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def verify_multi_document_transaction(self, model):
-        return requests.post('{}/api/v2/transactions/multidocument/verify'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/multidocument/verify'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4361,7 +4362,7 @@ class Mixin:
       :return MultiDocumentModel
     """
     def void_multi_document_transaction(self, code, type, model):
-        return requests.post('{}/api/v2/transactions/multidocument/{}/type/{}/void'.format(self.base_url, code, type),
+        return self.transport.post('{}/api/v2/transactions/multidocument/{}/type/{}/void'.format(self.base_url, code, type),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4383,7 +4384,7 @@ class Mixin:
       :return NexusModel
     """
     def create_nexus(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/nexus'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/nexus'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4407,7 +4408,7 @@ class Mixin:
       :return NexusByAddressModel
     """
     def declare_nexus_by_address(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/nexus/byaddress'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/nexus/byaddress'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4422,7 +4423,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_nexus(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4440,7 +4441,7 @@ class Mixin:
       :return NexusModel
     """
     def get_nexus(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4461,7 +4462,7 @@ class Mixin:
       :return NexusByTaxFormModel
     """
     def get_nexus_by_form_code(self, companyId, formCode):
-        return requests.get('{}/api/v2/companies/{}/nexus/byform/{}'.format(self.base_url, companyId, formCode),
+        return self.transport.get('{}/api/v2/companies/{}/nexus/byform/{}'.format(self.base_url, companyId, formCode),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4485,7 +4486,7 @@ class Mixin:
       :return FetchResult
     """
     def list_nexus_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/nexus'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/nexus'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4508,7 +4509,7 @@ class Mixin:
       :return FetchResult
     """
     def query_nexus(self, include=None):
-        return requests.get('{}/api/v2/nexus'.format(self.base_url),
+        return self.transport.get('{}/api/v2/nexus'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4533,7 +4534,7 @@ class Mixin:
       :return NexusModel
     """
     def update_nexus(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/nexus/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4551,7 +4552,7 @@ class Mixin:
       :return ErrorDetail
     """
     def comment_details_delete(self, companyId, id_, commentDetailsId):
-        return requests.delete('{}/api/v2/companies/{}/notices/{}/commentdetails/{}'.format(self.base_url, companyId, id_, commentDetailsId),
+        return self.transport.delete('{}/api/v2/companies/{}/notices/{}/commentdetails/{}'.format(self.base_url, companyId, id_, commentDetailsId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4569,7 +4570,7 @@ class Mixin:
       :return NoticeCommentModel
     """
     def create_notice_comment(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/notices/{}/comments'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/notices/{}/comments'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4588,7 +4589,7 @@ class Mixin:
       :return NoticeFinanceModel
     """
     def create_notice_finance_details(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/notices/{}/financedetails'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/notices/{}/financedetails'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4606,7 +4607,7 @@ class Mixin:
       :return NoticeResponsibilityDetailModel
     """
     def create_notice_responsibilities(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/notices/{}/responsibilities'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/notices/{}/responsibilities'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4624,7 +4625,7 @@ class Mixin:
       :return NoticeRootCauseDetailModel
     """
     def create_notice_root_causes(self, companyId, id_, model):
-        return requests.post('{}/api/v2/companies/{}/notices/{}/rootcauses'.format(self.base_url, companyId, id_),
+        return self.transport.post('{}/api/v2/companies/{}/notices/{}/rootcauses'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4641,7 +4642,7 @@ class Mixin:
       :return NoticeModel
     """
     def create_notices(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/notices'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/notices'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4658,7 +4659,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_notice(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4676,7 +4677,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_responsibilities(self, companyId, noticeId, id_):
-        return requests.delete('{}/api/v2/companies/{}/notices/{}/responsibilities/{}'.format(self.base_url, companyId, noticeId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/notices/{}/responsibilities/{}'.format(self.base_url, companyId, noticeId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4694,7 +4695,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_root_causes(self, companyId, noticeId, id_):
-        return requests.delete('{}/api/v2/companies/{}/notices/{}/rootcauses/{}'.format(self.base_url, companyId, noticeId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/notices/{}/rootcauses/{}'.format(self.base_url, companyId, noticeId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4709,7 +4710,7 @@ class Mixin:
       :return String
     """
     def download_notice_attachment(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/notices/files/{}/attachment'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/notices/files/{}/attachment'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4728,7 +4729,7 @@ class Mixin:
       :return ErrorDetail
     """
     def financedetailsdelete(self, companyId, id_, financeDetailsId):
-        return requests.delete('{}/api/v2/companies/{}/notices/{}/financedetails/{}'.format(self.base_url, companyId, id_, financeDetailsId),
+        return self.transport.delete('{}/api/v2/companies/{}/notices/{}/financedetails/{}'.format(self.base_url, companyId, id_, financeDetailsId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4745,7 +4746,7 @@ class Mixin:
       :return NoticeModel
     """
     def get_notice(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4762,7 +4763,7 @@ class Mixin:
       :return FetchResult
     """
     def get_notice_comments(self, id_, companyId):
-        return requests.get('{}/api/v2/companies/{}/notices/{}/comments'.format(self.base_url, id_, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/notices/{}/comments'.format(self.base_url, id_, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4780,7 +4781,7 @@ class Mixin:
       :return FetchResult
     """
     def get_notice_finance_details(self, id_, companyId):
-        return requests.get('{}/api/v2/companies/{}/notices/{}/financedetails'.format(self.base_url, id_, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/notices/{}/financedetails'.format(self.base_url, id_, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4797,7 +4798,7 @@ class Mixin:
       :return FetchResult
     """
     def get_notice_responsibilities(self, id_, companyId):
-        return requests.get('{}/api/v2/companies/{}/notices/{}/responsibilities'.format(self.base_url, id_, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/notices/{}/responsibilities'.format(self.base_url, id_, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4814,7 +4815,7 @@ class Mixin:
       :return FetchResult
     """
     def get_notice_root_causes(self, id_, companyId):
-        return requests.get('{}/api/v2/companies/{}/notices/{}/rootcauses'.format(self.base_url, id_, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/notices/{}/rootcauses'.format(self.base_url, id_, companyId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4837,7 +4838,7 @@ class Mixin:
       :return FetchResult
     """
     def list_notices_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/notices'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/notices'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4859,7 +4860,7 @@ class Mixin:
       :return FetchResult
     """
     def query_notices(self, include=None):
-        return requests.get('{}/api/v2/notices'.format(self.base_url),
+        return self.transport.get('{}/api/v2/notices'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4879,7 +4880,7 @@ class Mixin:
       :return NoticeModel
     """
     def update_notice(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/notices/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4894,7 +4895,7 @@ class Mixin:
       :return String
     """
     def upload_attachment(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/notices/files/attachment'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/notices/files/attachment'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4917,7 +4918,7 @@ class Mixin:
       :return NewAccountModel
     """
     def request_new_account(self, model):
-        return requests.post('{}/api/v2/accounts/request'.format(self.base_url),
+        return self.transport.post('{}/api/v2/accounts/request'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4934,7 +4935,7 @@ class Mixin:
       :return string
     """
     def change_password(self, model):
-        return requests.put('{}/api/v2/passwords'.format(self.base_url),
+        return self.transport.put('{}/api/v2/passwords'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4950,7 +4951,7 @@ class Mixin:
       :return AccountModel
     """
     def create_account(self, model):
-        return requests.post('{}/api/v2/accounts'.format(self.base_url),
+        return self.transport.post('{}/api/v2/accounts'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4968,7 +4969,7 @@ class Mixin:
       :return SubscriptionModel
     """
     def create_subscriptions(self, accountId, model):
-        return requests.post('{}/api/v2/accounts/{}/subscriptions'.format(self.base_url, accountId),
+        return self.transport.post('{}/api/v2/accounts/{}/subscriptions'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -4984,7 +4985,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_account(self, id_):
-        return requests.delete('{}/api/v2/accounts/{}'.format(self.base_url, id_),
+        return self.transport.delete('{}/api/v2/accounts/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5000,7 +5001,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_subscription(self, accountId, id_):
-        return requests.delete('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
+        return self.transport.delete('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5016,7 +5017,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_user(self, id_, accountId):
-        return requests.delete('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
+        return self.transport.delete('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5041,7 +5042,7 @@ class Mixin:
       :return FetchResult
     """
     def query_accounts(self, include=None):
-        return requests.get('{}/api/v2/accounts'.format(self.base_url),
+        return self.transport.get('{}/api/v2/accounts'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5059,7 +5060,7 @@ class Mixin:
       :return string
     """
     def reset_password(self, userId, model):
-        return requests.post('{}/api/v2/passwords/{}/reset'.format(self.base_url, userId),
+        return self.transport.post('{}/api/v2/passwords/{}/reset'.format(self.base_url, userId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5075,7 +5076,7 @@ class Mixin:
       :return AccountModel
     """
     def update_account(self, id_, model):
-        return requests.put('{}/api/v2/accounts/{}'.format(self.base_url, id_),
+        return self.transport.put('{}/api/v2/accounts/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5096,7 +5097,7 @@ class Mixin:
       :return SubscriptionModel
     """
     def update_subscription(self, accountId, id_, model):
-        return requests.put('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
+        return self.transport.put('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5115,11 +5116,12 @@ class Mixin:
       This API works for all report types.
     
       :param id_ [int] The unique ID number of this report
+      :param stream [boolean] When true, the file is not downloaded until the response content is read, e.g. with iter_content
       :return String
     """
-    def download_report(self, id_):
-        return requests.get('{}/api/v2/reports/{}/attachment'.format(self.base_url, id_),
-                               auth=self.auth, headers=self.client_header, params=None, 
+    def download_report(self, id_, stream=False):
+        return self.transport.get('{}/api/v2/reports/{}/attachment'.format(self.base_url, id_),
+                               auth=self.auth, headers=self.client_header, params=None, stream=stream, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
     r"""
@@ -5137,7 +5139,7 @@ class Mixin:
       :return String
     """
     def export_document_line(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/reports/exportdocumentline'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/reports/exportdocumentline'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5157,7 +5159,7 @@ class Mixin:
       :return ReportModel
     """
     def get_report(self, id_):
-        return requests.get('{}/api/v2/reports/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/reports/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5178,7 +5180,7 @@ class Mixin:
       :return ReportModel
     """
     def initiate_export_document_line_report(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/reports/exportdocumentline/initiate'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/reports/exportdocumentline/initiate'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5197,7 +5199,7 @@ class Mixin:
       :return FetchResult
     """
     def list_reports(self):
-        return requests.get('{}/api/v2/reports'.format(self.base_url),
+        return self.transport.get('{}/api/v2/reports'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5218,7 +5220,7 @@ class Mixin:
       :return SettingModel
     """
     def create_settings(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/settings'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/settings'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5239,7 +5241,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_setting(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5260,7 +5262,7 @@ class Mixin:
       :return SettingModel
     """
     def get_setting(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5287,7 +5289,7 @@ class Mixin:
       :return FetchResult
     """
     def list_settings_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/settings'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/settings'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5313,7 +5315,7 @@ class Mixin:
       :return FetchResult
     """
     def query_settings(self, include=None):
-        return requests.get('{}/api/v2/settings'.format(self.base_url),
+        return self.transport.get('{}/api/v2/settings'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5337,7 +5339,7 @@ class Mixin:
       :return SettingModel
     """
     def update_setting(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/settings/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5353,7 +5355,7 @@ class Mixin:
       :return SubscriptionModel
     """
     def get_subscription(self, accountId, id_):
-        return requests.get('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
+        return self.transport.get('{}/api/v2/accounts/{}/subscriptions/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5374,7 +5376,7 @@ class Mixin:
       :return FetchResult
     """
     def list_subscriptions_by_account(self, accountId, include=None):
-        return requests.get('{}/api/v2/accounts/{}/subscriptions'.format(self.base_url, accountId),
+        return self.transport.get('{}/api/v2/accounts/{}/subscriptions'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5394,7 +5396,7 @@ class Mixin:
       :return FetchResult
     """
     def query_subscriptions(self, include=None):
-        return requests.get('{}/api/v2/subscriptions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/subscriptions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5412,7 +5414,7 @@ class Mixin:
       :return TaxCodeModel
     """
     def create_tax_codes(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/taxcodes'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/taxcodes'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5426,7 +5428,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_tax_code(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5444,7 +5446,7 @@ class Mixin:
       :return TaxCodeModel
     """
     def get_tax_code(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5468,7 +5470,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_codes_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/taxcodes'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/taxcodes'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5491,7 +5493,7 @@ class Mixin:
       :return FetchResult
     """
     def query_tax_codes(self, include=None):
-        return requests.get('{}/api/v2/taxcodes'.format(self.base_url),
+        return self.transport.get('{}/api/v2/taxcodes'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5512,7 +5514,7 @@ class Mixin:
       :return TaxCodeModel
     """
     def update_tax_code(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/taxcodes/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5532,7 +5534,7 @@ class Mixin:
       :return String
     """
     def build_tax_content_file(self, model):
-        return requests.post('{}/api/v2/pointofsaledata/build'.format(self.base_url),
+        return self.transport.post('{}/api/v2/pointofsaledata/build'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5557,7 +5559,7 @@ class Mixin:
       :return String
     """
     def build_tax_content_file_for_location(self, companyId, id_, include=None):
-        return requests.get('{}/api/v2/companies/{}/locations/{}/pointofsaledata'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/locations/{}/pointofsaledata'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5595,11 +5597,12 @@ class Mixin:
     
       :param date [datetime] The date for which point-of-sale data would be calculated (today by default). Example input: 2016-12-31
       :param region [string] If the region is provided, this API is going to generate the tax rate per zipcode for only the region specified.
+      :param stream [boolean] When true, the file is not downloaded until the response content is read, e.g. with iter_lines
       :return String
     """
-    def download_tax_rates_by_zip_code(self, date, include=None):
-        return requests.get('{}/api/v2/taxratesbyzipcode/download/{}'.format(self.base_url, date),
-                               auth=self.auth, headers=self.client_header, params=include, 
+    def download_tax_rates_by_zip_code(self, date, include=None, stream=False):
+        return self.transport.get('{}/api/v2/taxratesbyzipcode/download/{}'.format(self.base_url, date),
+                               auth=self.auth, headers=self.client_header, params=include, stream=stream, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
     r"""
@@ -5616,7 +5619,7 @@ class Mixin:
       :return TaxRuleModel
     """
     def create_tax_rules(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/taxrules'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/taxrules'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5630,7 +5633,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_tax_rule(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5648,7 +5651,7 @@ class Mixin:
       :return TaxRuleModel
     """
     def get_tax_rule(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5672,7 +5675,7 @@ class Mixin:
       :return FetchResult
     """
     def list_tax_rules(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/taxrules'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/taxrules'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5695,7 +5698,7 @@ class Mixin:
       :return FetchResult
     """
     def query_tax_rules(self, include=None):
-        return requests.get('{}/api/v2/taxrules'.format(self.base_url),
+        return self.transport.get('{}/api/v2/taxrules'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5716,7 +5719,7 @@ class Mixin:
       :return TaxRuleModel
     """
     def update_tax_rule(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/taxrules/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5745,7 +5748,7 @@ class Mixin:
       :return TransactionModel
     """
     def add_lines(self, model, include=None):
-        return requests.post('{}/api/v2/companies/transactions/lines/add'.format(self.base_url),
+        return self.transport.post('{}/api/v2/companies/transactions/lines/add'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5768,7 +5771,7 @@ class Mixin:
       :return TransactionModel
     """
     def adjust_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/adjust'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/adjust'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5792,7 +5795,7 @@ class Mixin:
       :return AuditTransactionModel
     """
     def audit_transaction(self, companyCode, transactionCode):
-        return requests.get('{}/api/v2/companies/{}/transactions/{}/audit'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.get('{}/api/v2/companies/{}/transactions/{}/audit'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5817,7 +5820,7 @@ class Mixin:
       :return AuditTransactionModel
     """
     def audit_transaction_with_type(self, companyCode, transactionCode, documentType):
-        return requests.get('{}/api/v2/companies/{}/transactions/{}/types/{}/audit'.format(self.base_url, companyCode, transactionCode, documentType),
+        return self.transport.get('{}/api/v2/companies/{}/transactions/{}/types/{}/audit'.format(self.base_url, companyCode, transactionCode, documentType),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5834,7 +5837,7 @@ class Mixin:
       :return BulkLockTransactionResult
     """
     def bulk_lock_transaction(self, model):
-        return requests.post('{}/api/v2/transactions/lock'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/lock'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5856,7 +5859,7 @@ class Mixin:
       :return TransactionModel
     """
     def change_transaction_code(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/changecode'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/changecode'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5877,7 +5880,7 @@ class Mixin:
       :return TransactionModel
     """
     def commit_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/commit'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/commit'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5911,7 +5914,7 @@ class Mixin:
       :return TransactionModel
     """
     def create_or_adjust_transaction(self, model, include=None):
-        return requests.post('{}/api/v2/transactions/createoradjust'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/createoradjust'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5949,7 +5952,7 @@ class Mixin:
       :return TransactionModel
     """
     def create_transaction(self, model, include=None):
-        return requests.post('{}/api/v2/transactions/create'.format(self.base_url),
+        return self.transport.post('{}/api/v2/transactions/create'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -5975,7 +5978,7 @@ class Mixin:
       :return TransactionModel
     """
     def delete_lines(self, model, include=None):
-        return requests.post('{}/api/v2/companies/transactions/lines/delete'.format(self.base_url),
+        return self.transport.post('{}/api/v2/companies/transactions/lines/delete'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6003,7 +6006,7 @@ class Mixin:
       :return TransactionModel
     """
     def get_transaction_by_code(self, companyCode, transactionCode, include=None):
-        return requests.get('{}/api/v2/companies/{}/transactions/{}'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.get('{}/api/v2/companies/{}/transactions/{}'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6019,7 +6022,7 @@ class Mixin:
       :return TransactionModel
     """
     def get_transaction_by_code_and_type(self, companyCode, transactionCode, documentType, include=None):
-        return requests.get('{}/api/v2/companies/{}/transactions/{}/types/{}'.format(self.base_url, companyCode, transactionCode, documentType),
+        return self.transport.get('{}/api/v2/companies/{}/transactions/{}/types/{}'.format(self.base_url, companyCode, transactionCode, documentType),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6044,7 +6047,7 @@ class Mixin:
       :return TransactionModel
     """
     def get_transaction_by_id(self, id_, include=None):
-        return requests.get('{}/api/v2/transactions/{}'.format(self.base_url, id_),
+        return self.transport.get('{}/api/v2/transactions/{}'.format(self.base_url, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6076,7 +6079,7 @@ class Mixin:
       :return FetchResult
     """
     def list_transactions_by_company(self, companyCode, include=None):
-        return requests.get('{}/api/v2/companies/{}/transactions'.format(self.base_url, companyCode),
+        return self.transport.get('{}/api/v2/companies/{}/transactions'.format(self.base_url, companyCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6098,7 +6101,7 @@ class Mixin:
       :return TransactionModel
     """
     def lock_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/lock'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/lock'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6138,7 +6141,7 @@ class Mixin:
       :return TransactionModel
     """
     def refund_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/refund'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/refund'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6159,7 +6162,7 @@ class Mixin:
       :return TransactionModel
     """
     def settle_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/settle'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/settle'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6176,7 +6179,7 @@ class Mixin:
       :return TransactionModel
     """
     def uncommit_transaction(self, companyCode, transactionCode, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/uncommit'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/uncommit'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6196,7 +6199,7 @@ class Mixin:
       :return TransactionModel
     """
     def verify_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/verify'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/verify'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6217,7 +6220,7 @@ class Mixin:
       :return TransactionModel
     """
     def void_transaction(self, companyCode, transactionCode, model, include=None):
-        return requests.post('{}/api/v2/companies/{}/transactions/{}/void'.format(self.base_url, companyCode, transactionCode),
+        return self.transport.post('{}/api/v2/companies/{}/transactions/{}/void'.format(self.base_url, companyCode, transactionCode),
                                auth=self.auth, headers=self.client_header, params=include, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6232,7 +6235,7 @@ class Mixin:
       :return UPCModel
     """
     def create_u_p_cs(self, companyId, model):
-        return requests.post('{}/api/v2/companies/{}/upcs'.format(self.base_url, companyId),
+        return self.transport.post('{}/api/v2/companies/{}/upcs'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6246,7 +6249,7 @@ class Mixin:
       :return ErrorDetail
     """
     def delete_u_p_c(self, companyId, id_):
-        return requests.delete('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
+        return self.transport.delete('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6261,7 +6264,7 @@ class Mixin:
       :return UPCModel
     """
     def get_u_p_c(self, companyId, id_):
-        return requests.get('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
+        return self.transport.get('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6282,7 +6285,7 @@ class Mixin:
       :return FetchResult
     """
     def list_u_p_cs_by_company(self, companyId, include=None):
-        return requests.get('{}/api/v2/companies/{}/upcs'.format(self.base_url, companyId),
+        return self.transport.get('{}/api/v2/companies/{}/upcs'.format(self.base_url, companyId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6302,7 +6305,7 @@ class Mixin:
       :return FetchResult
     """
     def query_u_p_cs(self, include=None):
-        return requests.get('{}/api/v2/upcs'.format(self.base_url),
+        return self.transport.get('{}/api/v2/upcs'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6320,7 +6323,7 @@ class Mixin:
       :return UPCModel
     """
     def update_u_p_c(self, companyId, id_, model):
-        return requests.put('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
+        return self.transport.put('{}/api/v2/companies/{}/upcs/{}'.format(self.base_url, companyId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6339,7 +6342,7 @@ class Mixin:
       :return UserModel
     """
     def create_users(self, accountId, model):
-        return requests.post('{}/api/v2/accounts/{}/users'.format(self.base_url, accountId),
+        return self.transport.post('{}/api/v2/accounts/{}/users'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6355,7 +6358,7 @@ class Mixin:
       :return UserModel
     """
     def get_user(self, id_, accountId, include=None):
-        return requests.get('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
+        return self.transport.get('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6381,7 +6384,7 @@ class Mixin:
       :return UserEntitlementModel
     """
     def get_user_entitlements(self, id_, accountId):
-        return requests.get('{}/api/v2/accounts/{}/users/{}/entitlements'.format(self.base_url, accountId, id_),
+        return self.transport.get('{}/api/v2/accounts/{}/users/{}/entitlements'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6396,7 +6399,7 @@ class Mixin:
       :return UsernameModel
     """
     def get_username(self, include=None):
-        return requests.get('{}/api/v2/usernames'.format(self.base_url),
+        return self.transport.get('{}/api/v2/usernames'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6419,7 +6422,7 @@ class Mixin:
       :return FetchResult
     """
     def list_users_by_account(self, accountId, include=None):
-        return requests.get('{}/api/v2/accounts/{}/users'.format(self.base_url, accountId),
+        return self.transport.get('{}/api/v2/accounts/{}/users'.format(self.base_url, accountId),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6442,7 +6445,7 @@ class Mixin:
       :return FetchResult
     """
     def query_users(self, include=None):
-        return requests.get('{}/api/v2/users'.format(self.base_url),
+        return self.transport.get('{}/api/v2/users'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=include, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6460,7 +6463,7 @@ class Mixin:
       :return UserModel
     """
     def update_user(self, id_, accountId, model):
-        return requests.put('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
+        return self.transport.put('{}/api/v2/accounts/{}/users/{}'.format(self.base_url, accountId, id_),
                                auth=self.auth, headers=self.client_header, json=model, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6475,7 +6478,7 @@ class Mixin:
       :return SubscriptionModel
     """
     def get_my_subscription(self, serviceTypeId):
-        return requests.get('{}/api/v2/utilities/subscriptions/{}'.format(self.base_url, serviceTypeId),
+        return self.transport.get('{}/api/v2/utilities/subscriptions/{}'.format(self.base_url, serviceTypeId),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6489,7 +6492,7 @@ class Mixin:
       :return FetchResult
     """
     def list_my_subscriptions(self):
-        return requests.get('{}/api/v2/utilities/subscriptions'.format(self.base_url),
+        return self.transport.get('{}/api/v2/utilities/subscriptions'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
 
@@ -6505,7 +6508,7 @@ class Mixin:
       :return PingResultModel
     """
     def ping(self):
-        return requests.get('{}/api/v2/utilities/ping'.format(self.base_url),
+        return self.transport.get('{}/api/v2/utilities/ping'.format(self.base_url),
                                auth=self.auth, headers=self.client_header, params=None, 
                                timeout=self.timeout_limit if self.timeout_limit else 10)
  
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Mirror customers and exemption certificates incrementally, only fetching
+the records modified since the last run
+"""
+from collections import namedtuple
+from _bulk import chunked
+import json
+import os
+
+
+# resource name -> list method
+RESOURCES = {
+    'customers': 'query_customers',
+    'certificates': 'query_certificates',
+}
+
+# Outcome of IncrementalSync.run
+#   records    number of changed records applied
+#   batches    number of batches applied
+#   watermark  modifiedDate and id of the last record applied, stored for
+#              the next run
+SyncRun = namedtuple('SyncRun', 'records batches watermark')
+
+
+class WatermarkStore(object):
+    """Class for the watermarks of each resource, kept in a JSON file."""
+
+    def __init__(self, path):
+        """
+        Load the watermarks stored by previous runs.
+
+        :param  string  path:  The JSON file holding the watermarks
+        """
+        self.path = path
+        try:
+            with open(path) as f:
+                self._marks = json.load(f)
+        except (IOError, OSError):
+            self._marks = {}
+
+    def get(self, key):
+        """Return the watermark of a key, or None before the first run."""
+        return self._marks.get(key)
+
+    def set(self, key, value):
+        """Store the watermark of a key, atomically replacing the file."""
+        self._marks[key] = value
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self._marks, f, indent=2, sort_keys=True)
+        getattr(os, 'replace', os.rename)(tmp, self.path)
+
+
+class IncrementalSync(object):
+    """Class for fetching customers or certificates changed since last run."""
+
+    def __init__(self, client, company_id, state_path, batch_size=100,
+                 page_size=1000):
+        """
+        Initialize the sync.
+
+        :param  AvataxClient  client:      The client used to make the calls
+        :param  int           company_id:  The ID of the company
+        :param  string        state_path:  The JSON file holding watermarks
+        :param  int           batch_size:  Number of records per batch
+        :param  int           page_size:   Number of records listed per call
+        """
+        self.client = client
+        self.company_id = company_id
+        self.watermarks = WatermarkStore(state_path)
+        self.batch_size = batch_size
+        self.page_size = page_size
+
+    def _key(self, resource):
+        return '{}:{}'.format(self.company_id, resource)
+
+    def changes(self, resource, include=None):
+        r"""
+        Yield the records modified since the stored watermark.
+
+        Records are ordered by modifiedDate, then id. Pages are requested
+        after the last record of the previous page rather than by `$skip`:
+        a record modified while the sync runs moves to the end of the order,
+        with offsets the next page would skip the record that took its
+        place. The first run has no watermark and yields every record.
+
+        :param  string      resource:  customers or certificates
+        :param  dictionary  include:   Other query parameters, e.g. \
+            {'$include': 'customers'}
+        :return: generator of dictionary
+        """
+        if resource not in RESOURCES:
+            raise ValueError('resource must be one of {}'.format(
+                ', '.join(sorted(RESOURCES))))
+        key = self._key(resource)
+        mark = self.watermarks.get(key)
+        if mark is not None and not (isinstance(mark, dict) and
+                                     set(mark) == set(['modifiedDate', 'id'])):
+            raise ValueError('The watermark of {} is not a modifiedDate and '
+                             'id pair: {!r}'.format(key, mark))
+        return self._pages(resource, dict(include or {}), mark)
+
+    def _pages(self, resource, params, mark):
+        user_filter = params.get('$filter')
+        list_call = getattr(self.client, RESOURCES[resource])
+        while True:
+            conditions = [] if not mark else [_after(mark)]
+            if user_filter:
+                conditions.insert(0, '({})'.format(user_filter))
+            if conditions:
+                params['$filter'] = ' and '.join(conditions)
+            params['$orderby'] = 'modifiedDate ASC, id ASC'
+            params['$top'] = self.page_size
+            response = list_call(self.company_id, dict(params))
+            response.raise_for_status()
+            page = response.json().get('value', [])
+            for record in page:
+                yield record
+            if len(page) < self.page_size:
+                return
+            mark = _watermark(page[-1])
+
+    def run(self, resource, apply, include=None):
+        """
+        Apply the changed records in batches, advancing the watermark.
+
+        The watermark is stored after each batch is applied, so a failed
+        run resumes from the last applied batch. apply may see a record
+        twice and must be idempotent.
+
+        :param  string      resource:  customers or certificates
+        :param  function    apply:     Called with each list of records
+        :param  dictionary  include:   Other query parameters
+        :return: SyncRun
+        """
+        key = self._key(resource)
+        records = batches = 0
+        for batch in chunked(self.changes(resource, include), self.batch_size):
+            apply(batch)
+            records += len(batch)
+            batches += 1
+            # records come in watermark order, the last one is the latest
+            if batch[-1].get('modifiedDate'):
+                self.watermarks.set(key, _watermark(batch[-1]))
+        return SyncRun(records, batches, self.watermarks.get(key))
+
+
+def _watermark(record):
+    return {'modifiedDate': record['modifiedDate'], 'id': record['id']}
+
+
+def _after(mark):
+    """Return the $filter condition of the records after a watermark."""
+    return "(modifiedDate gt '{0}' or (modifiedDate eq '{0}' and " \
+        "id gt {1}))".format(mark['modifiedDate'], mark['id'])
+
+
+def links_by_customer(certificates):
+    """
+    Group certificates fetched with `$include=customers` by customer code.
+
+    The result is ready for link_certificates_to_customer, e.g.
+    client.link_certificates_to_customer(comp_id, code, {'certificates': ids})
+
+    :param  iterable  certificates:  CertificateModel dictionaries
+    :return: dictionary of customer code -> list of certificate ids
+    """
+    links = {}
+    for certificate in certificates:
+        for customer in certificate.get('customers') or []:
+            links.setdefault(customer['customerCode'], []).append(
+                certificate['id'])
+    return links
@@ -0,0 +1,229 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+EstimateCache keeps the responses of uncommitted SalesOrder calculations, so
+repeated cart recalculations can be answered without calling AvaTax again
+"""
+from collections import OrderedDict
+from concurrent.futures import Future
+import hashlib
+import json
+import threading
+import time
+
+
+# Top level fields of a CreateTransactionModel that do not change the tax
+# calculated for a SalesOrder, these are left out of the cache key
+VOLATILE_FIELDS = ('code', 'description', 'purchaseOrderNo', 'referenceCode')
+
+
+def is_estimate(model):
+    """
+    Return True if the transaction model is an uncommitted SalesOrder.
+
+    AvaTax never records a SalesOrder, when the type is omitted it is
+    calculated as a SalesOrder as well.
+
+    :param  dictionary  model:  A CreateTransactionModel
+    :return: boolean
+    """
+    return (model.get('type') or 'SalesOrder') == 'SalesOrder' and \
+        not model.get('commit')
+
+
+def estimate_key(model, include=None):
+    """
+    Return the canonical hash of a SalesOrder model.
+
+    Volatile fields are dropped and the document date is truncated to the
+    day, so two carts with the same addresses and lines on the same day
+    share a key.
+
+    :param  dictionary  model:    A CreateTransactionModel
+    :param  dictionary  include:  The query parameters sent along the model
+    :return: string
+    """
+    canonical = dict((k, v) for k, v in model.items()
+                     if k not in VOLATILE_FIELDS)
+    if canonical.get('date'):
+        canonical['date'] = str(canonical['date'])[:10]
+    payload = json.dumps([canonical, include], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class EstimateCache(object):
+    """Class for a bounded, expiring cache of SalesOrder responses."""
+
+    def __init__(self, ttl=300, max_size=1024, clock=time.time):
+        """
+        Initialize an empty cache.
+
+        :param  int/float  ttl:       Seconds a cached estimate stays valid
+        :param  int        max_size:  Maximum number of estimates kept, the
+            least recently used estimate is evicted first
+        :param  function   clock:     Returns the current time in seconds
+        """
+        if ttl <= 0 or max_size <= 0:
+            raise ValueError('ttl and max_size must be greater than zero')
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # calls that waited for an identical calculation already in flight
+        self.coalesced = 0
+        # key -> (expires_at, company_code, response)
+        self._entries = OrderedDict()
+        # key -> Future of the calculation in flight
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of estimates currently held."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, model, include=None):
+        """
+        Return the cached response for this model, or None.
+
+        :param  dictionary  model:    A CreateTransactionModel
+        :param  dictionary  include:  The query parameters sent along the model
+        :return: Response object or None
+        """
+        key = estimate_key(model, include)
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return cached
+
+    def _lookup(self, key):
+        """Return the cached response of a key, the lock must be held."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            if entry is not None:
+                del self._entries[key]
+            return None
+        # move to the most recently used end
+        del self._entries[key]
+        self._entries[key] = entry
+        return entry[2]
+
+    def put(self, model, response, include=None):
+        """
+        Store the response of a successful SalesOrder calculation.
+
+        Unsuccessful responses are never cached.
+
+        :param  dictionary  model:     A CreateTransactionModel
+        :param  object      response:  The response returned by AvaTax
+        :param  dictionary  include:   The query parameters sent along the model
+        :return: Response object
+        """
+        if not getattr(response, 'ok', False):
+            return response
+        key = estimate_key(model, include)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self.clock() + self.ttl,
+                                  model.get('companyCode'), response)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return response
+
+    def fetch(self, model, include, create):
+        """
+        Return the cached response, or call create and cache its result.
+
+        Threads missing the same estimate at the same time share a single
+        create call, the others wait for its response.
+
+        :param  dictionary  model:    A CreateTransactionModel
+        :param  dictionary  include:  The query parameters sent along the model
+        :param  function    create:   Called with (model, include) on a miss
+        :return: Response object
+        """
+        if not is_estimate(model):
+            return create(model, include)
+        key = estimate_key(model, include)
+        with self._lock:
+            cached = self._lookup(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            pending = self._inflight.get(key)
+            if pending is None:
+                self.misses += 1
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if pending is not None:
+            return pending.result()
+        try:
+            response = create(model, include)
+        except Exception as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        self.put(model, response, include)
+        with self._lock:
+            del self._inflight[key]
+        future.set_result(response)
+        return response
+
+    def after_fork(self):
+        """Keep the cached responses, but not the locks of the parent."""
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def invalidate(self, model, include=None):
+        """
+        Drop the cached estimate of a single model.
+
+        :param  dictionary  model:    A CreateTransactionModel
+        :param  dictionary  include:  The query parameters sent along the model
+        :return: boolean, True if an estimate was dropped
+        """
+        with self._lock:
+            return self._entries.pop(estimate_key(model, include),
+                                     None) is not None
+
+    def invalidate_company(self, company_code):
+        """
+        Drop every estimate calculated for a company.
+
+        Call this after changing the configuration of the company, e.g. its
+        nexus, tax rules, items or exemptions.
+
+        :param  string  company_code:  The code of the company
+        :return: int, the number of estimates dropped
+        """
+        with self._lock:
+            stale = [k for k, v in self._entries.items()
+                     if v[1] == company_code]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        """Drop every cached estimate."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,208 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Hedger sends a duplicate of a read that is slower than usual and answers
+with whichever call completes first, cutting the latency tail
+
+    hedger = client.enable_hedging(percentile=95, budget=0.05)
+"""
+from _bulk import percentile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+import time
+
+
+class Hedger(object):
+    """Class for hedged calls and the latencies they are timed against."""
+
+    def __init__(self, percentile=95, budget=0.05, window=1000,
+                 min_samples=20, workers=64):
+        """
+        Initialize the hedger.
+
+        A call still running after the given percentile of the recent
+        latencies of its endpoint is sent again. At most budget duplicates
+        are sent per call made, so a slow server does not get twice the
+        load. Until min_samples latencies are known, calls are not hedged.
+
+        :param  int/float  percentile:   Percentile of the latencies after
+            which a duplicate is sent, between 0 and 100
+        :param  float      budget:       Duplicates allowed per call, e.g.
+            0.05 for 5% extra calls
+        :param  int        window:       Recent latencies kept per endpoint
+        :param  int        min_samples:  Latencies needed before hedging
+        :param  int        workers:      Worker threads, duplicates included,
+            a call made while they are all busy runs on the calling thread
+            and is not hedged
+        """
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        if budget < 0:
+            raise ValueError('budget must not be negative')
+        self.percentile = percentile
+        self.budget = budget
+        self.window = window
+        self.min_samples = min_samples
+        self.workers = workers
+        self.calls = 0
+        # duplicates sent, and duplicates which answered first
+        self.hedged = 0
+        self.wins = 0
+        # calls past their delay left alone because the budget was spent,
+        # and calls not hedged because every worker was busy
+        self.over_budget = 0
+        self.saturated = 0
+        # endpoint -> deque of recent latencies, -> the delay computed last,
+        # and -> latencies recorded since, the delay is recomputed once 5%
+        # of the window changed
+        self._latencies = {}
+        self._delays = {}
+        self._stale = {}
+        self._lock = threading.Lock()
+        # one per worker thread, taken before a submit so none waits queued
+        self._slots = threading.BoundedSemaphore(workers)
+        self._pool = ThreadPoolExecutor(workers)
+
+    def delay(self, name):
+        """
+        Return the seconds after which a call to an endpoint is hedged.
+
+        :param  string  name:  The endpoint, e.g. the client method name
+        :return: float, None while too few latencies are known
+        """
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            if name not in self._delays or \
+                    self._stale[name] >= max(self.window // 20, 1):
+                self._delays[name] = percentile(latencies, self.percentile)
+                self._stale[name] = 0
+            return self._delays[name]
+
+    def _record(self, name, elapsed):
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None:
+                latencies = self._latencies[name] = deque(maxlen=self.window)
+            latencies.append(elapsed)
+            self._stale[name] = self._stale.get(name, 0) + 1
+
+    def _timed(self, name, call):
+        start = time.time()
+        response = call()
+        self._record(name, time.time() - start)
+        return response
+
+    def _allow(self):
+        with self._lock:
+            if self.hedged < self.budget * self.calls:
+                self.hedged += 1
+                return True
+            self.over_budget += 1
+            return False
+
+    def _submit(self, fn, *args):
+        """Run fn on a free worker, return None if none is free."""
+        if not self._slots.acquire(False):
+            with self._lock:
+                self.saturated += 1
+            return None
+        try:
+            future = self._pool.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+        return future
+
+    def call(self, name, call):
+        """
+        Make a call, sending a duplicate if it is slower than usual.
+
+        :param  string    name:  The endpoint, latencies are kept per name
+        :param  function  call:  Makes the call, returns a response
+        :return: Response object, of the first call answered without a
+            server error or throttling, else the failure of the primary call,
+            a response preferred over an exception
+        """
+        with self._lock:
+            self.calls += 1
+        delay = self.delay(name)
+        # until the usual latency is known, and while the workers are busy
+        # with other calls, the call is made on the calling thread
+        primary = None if delay is None else \
+            self._submit(self._timed, name, call)
+        if primary is None:
+            return self._timed(name, call)
+        done, _ = wait([primary], delay)
+        if done or not self._allow():
+            return primary.result()
+        hedge = self._submit(call)
+        if hedge is None:
+            # not sent, give the budget back
+            with self._lock:
+                self.hedged -= 1
+            return primary.result()
+        pending = [primary, hedge]
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # the first call answering wins, a call raising, throttled or
+            # failing on the server does not
+            answered = [f for f in (primary, hedge)
+                        if f in done and _answered(f)]
+            if answered:
+                winner = answered[0]
+                if winner is hedge:
+                    with self._lock:
+                        self.wins += 1
+                for loser in (primary, hedge):
+                    if loser is not winner:
+                        loser.add_done_callback(_close)
+                return winner.result()
+        # both failed, a response is preferred over an exception
+        failed = hedge if primary.exception() is not None and \
+            hedge.exception() is None else primary
+        for loser in (primary, hedge):
+            if loser is not failed:
+                _close(loser)
+        return failed.result()
+
+    def close(self):
+        """Stop the worker threads once the calls in flight complete."""
+        self._pool.shutdown(wait=False)
+
+    def after_fork(self):
+        """Keep the latencies, but not the threads and lock of the parent."""
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._pool = ThreadPoolExecutor(self.workers)
+
+
+def _answered(future):
+    """Return whether a call completed with a response worth returning."""
+    if future.exception() is not None:
+        return False
+    status = future.result().status_code
+    return status < 500 and status != 429
+
+
+def _close(future):
+    """Release the connection of the response nobody waits for."""
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,276 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Generate synthetic AvaTax workloads and measure how the client copes
+
+    python -m loadgen --local --workload transaction=6,address=3,rates=1
+    python -m loadgen --environment sandbox --concurrency 32 --duration 30
+    python -m loadgen --environment sandbox --rate 20 --requests 500
+"""
+from _bulk import run_bulk
+from benchmark import BenchmarkResult, percentile
+from client import AvataxClient
+from collections import namedtuple
+from mock_server import MockAvataxServer
+from transaction_builder import TransactionBuilder
+import argparse
+import itertools
+import os
+import random
+import threading
+import time
+
+
+# Ship-to addresses picked at random by the workloads
+ADDRESSES = [
+    {'line1': '600 5th Ave', 'city': 'Seattle', 'region': 'WA',
+     'postalCode': '98104', 'country': 'US'},
+    {'line1': '200 Moe St Ne', 'city': 'Poulsbo', 'region': 'WA',
+     'postalCode': '98370', 'country': 'US'},
+    {'line1': '1945 S Hill St', 'city': 'Los Angeles', 'region': 'CA',
+     'postalCode': '90007', 'country': 'US'},
+    {'line1': '50 W Washington St', 'city': 'Chicago', 'region': 'IL',
+     'postalCode': '60602', 'country': 'US'},
+    {'line1': '123 Main Street', 'city': 'Irvine', 'region': 'CA',
+     'postalCode': '92615', 'country': 'US'},
+]
+
+# Outcome of generate_load
+#   workloads  workload name -> BenchmarkResult
+#   total      BenchmarkResult of every call
+#   statuses   HTTP status, or exception name -> number of calls
+#   cpu        seconds of CPU time spent by the threads making the calls,
+#              other threads, e.g. of a local server, are not counted;
+#              the CPU time of the whole process before Python 3.7
+LoadReport = namedtuple('LoadReport', 'workloads total statuses cpu')
+
+
+def _transaction(client, rng, options):
+    builder = TransactionBuilder(client, options.get('company', 'DEFAULT'),
+                                 options.get('doc_type', 'SalesOrder'),
+                                 'LOADGEN')
+    builder.with_address('SingleLocation', rng.choice(ADDRESSES))
+    for _ in range(options.get('lines', 3)):
+        builder.with_line(rng.randint(1, 500), rng.randint(1, 5),
+                          'ITEM{}'.format(rng.randint(1, 1000)), 'P0000000')
+    return builder.create()
+
+
+def _address(client, rng, options):
+    return client.resolve_address_post(rng.choice(ADDRESSES))
+
+
+def _rates(client, rng, options):
+    return client.tax_rates_by_address(rng.choice(ADDRESSES))
+
+
+# workload name -> function(client, random generator, options) making a call
+WORKLOADS = {
+    'transaction': _transaction,
+    'address': _address,
+    'rates': _rates,
+}
+
+
+def parse_mix(spec):
+    """
+    Parse a workload mix such as transaction=6,address=3,rates=1.
+
+    :param  string  spec:  Comma separated workload names, with an optional
+        weight each
+    :return: dictionary of workload name -> weight
+    """
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.strip().partition('=')
+        if name not in WORKLOADS:
+            raise ValueError('Unknown workload {}, pick from {}'.format(
+                name, ', '.join(sorted(WORKLOADS))))
+        mix[name] = float(weight) if weight else 1.0
+        if mix[name] <= 0:
+            raise ValueError('Workload weights must be positive')
+    return mix
+
+
+# CPU time of the calling thread, None before Python 3.7
+_thread_time = getattr(time, 'thread_time', None)
+
+
+def _cpu_time():
+    times = os.times()
+    return times[0] + times[1]
+
+
+def generate_load(client, mix=None, requests=None, duration=None,
+                  concurrency=8, rate=None, options=None, seed=None):
+    """
+    Make calls drawn from a workload mix and measure them.
+
+    Without rate, concurrency calls are kept in flight, the client runs as
+    fast as it can. With rate, calls start at that pace and concurrency
+    only caps the calls in flight. The CPU time reported is that of the
+    threads making the calls, a server running in this process, e.g. with
+    --local, is left out.
+
+    :param  AvataxClient  client:       The client measured
+    :param  dictionary    mix:          workload name -> weight (default:
+        transactions only)
+    :param  int           requests:     Stop after this many calls
+    :param  int/float     duration:     Stop after this many seconds
+    :param  int           concurrency:  Maximum number of calls in flight
+    :param  int/float     rate:         Calls started per second
+    :param  dictionary    options:      Workload options: company, doc_type
+        and lines
+    :param  int           seed:         Seed of the synthetic data
+    :return: LoadReport
+    """
+    if requests is None and duration is None:
+        raise ValueError('Give requests, duration or both')
+    mix = mix or {'transaction': 1.0}
+    options = options or {}
+    names = sorted(mix)
+    rng = random.Random(seed)
+    # cumulative weights, a call picks the first one above a random draw
+    weights = [sum(mix[n] for n in names[:i + 1]) for i in range(len(names))]
+
+    def calls():
+        deadline = time.time() + duration if duration else None
+        for count in itertools.count():
+            if requests is not None and count >= requests:
+                return
+            if deadline is not None and time.time() >= deadline:
+                return
+            pick = rng.random() * weights[-1]
+            name = names[next(i for i, w in enumerate(weights) if pick < w)]
+            yield name, random.Random(rng.random())
+
+    # CPU seconds of the calls, summed over the threads making them
+    spent = [0.0]
+    lock = threading.Lock()
+
+    def call(item):
+        name, call_rng = item
+        if _thread_time is None:
+            return WORKLOADS[name](client, call_rng, options)
+        cpu = _thread_time()
+        try:
+            return WORKLOADS[name](client, call_rng, options)
+        finally:
+            cpu = _thread_time() - cpu
+            with lock:
+                spent[0] += cpu
+
+    latencies = dict((name, []) for name in names)
+    errors = dict((name, 0) for name in names)
+    statuses = {}
+    cpu = _cpu_time()
+    start = time.time()
+    for result in run_bulk(call, calls(), concurrency, rate):
+        name = result.item[0]
+        latencies[name].append(result.elapsed)
+        status = type(result.error).__name__ if result.error is not None \
+            else result.response.status_code
+        statuses[status] = statuses.get(status, 0) + 1
+        if not result.ok:
+            errors[name] += 1
+    elapsed = time.time() - start
+    cpu = _cpu_time() - cpu if _thread_time is None else spent[0]
+    workloads = dict((name, BenchmarkResult(
+        name, len(latencies[name]), errors[name], elapsed, latencies[name]))
+        for name in names)
+    every = [value for name in names for value in latencies[name]]
+    total = BenchmarkResult('total', len(every), sum(errors.values()),
+                            elapsed, every)
+    return LoadReport(workloads, total, statuses, cpu)
+
+
+def format_report(report):
+    """Return a load report as a text table."""
+    rows = ['{:<14}{:>8}{:>9}{:>10}{:>9}{:>9}{:>9}{:>9}'.format(
+        'workload', 'calls', 'errors %', 'req/s', 'p50 ms', 'p90 ms',
+        'p99 ms', 'max ms')]
+    results = [report.workloads[n] for n in sorted(report.workloads)]
+    for r in results + [report.total]:
+        rows.append(
+            '{:<14}{:>8}{:>9.2f}{:>10.1f}{:>9.2f}{:>9.2f}{:>9.2f}{:>9.2f}'
+            .format(r.name, r.requests,
+                    100.0 * r.errors / r.requests if r.requests else 0,
+                    r.throughput, r.p50 * 1000,
+                    percentile(r.latencies, 90) * 1000, r.p99 * 1000,
+                    max(r.latencies or [0]) * 1000))
+    rows.append('statuses: {}'.format(', '.join(
+        '{}={}'.format(k, v) for k, v in sorted(report.statuses.items(),
+                                                key=lambda kv: str(kv[0])))))
+    per_call = report.cpu / report.total.requests \
+        if report.total.requests else 0
+    rows.append('client CPU: {:.2f} s, {:.3f} ms per call'.format(
+        report.cpu, per_call * 1000))
+    return '\n'.join(rows)
+
+
+def main(argv=None):
+    """Run a workload from the command line and print its report."""
+    parser = argparse.ArgumentParser(
+        prog='python -m loadgen',
+        description='Generate synthetic AvaTax workloads with AvataxClient')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--environment', default='sandbox',
+                        help='sandbox, production or a base url')
+    target.add_argument('--local', action='store_true',
+                        help='call a local stand-in server')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='seconds the local server adds to every call')
+    parser.add_argument('--username', default=os.environ.get('USERNAME'))
+    parser.add_argument('--password', default=os.environ.get('PASSWORD'))
+    parser.add_argument('--workload', default='transaction',
+                        help='e.g. transaction=6,address=3,rates=1')
+    parser.add_argument('--requests', type=int)
+    parser.add_argument('--duration', type=float)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--rate', type=float,
+                        help='calls started per second')
+    parser.add_argument('--company', default='DEFAULT')
+    parser.add_argument('--doc-type', default='SalesOrder',
+                        help='SalesOrder calls are not saved by AvaTax')
+    parser.add_argument('--lines', type=int, default=3)
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+    try:
+        mix = parse_mix(args.workload)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.requests is None and args.duration is None:
+        args.requests = 1000
+    server = MockAvataxServer(args.latency).start() if args.local else None
+    try:
+        client = AvataxClient('loadgen', '1.0', 'loadgen',
+                              server.url if server else args.environment)
+        if args.username:
+            client.add_credentials(args.username, args.password)
+        report = generate_load(
+            client, mix, args.requests, args.duration, args.concurrency,
+            args.rate, {'company': args.company, 'doc_type': args.doc_type,
+                        'lines': args.lines}, args.seed)
+    finally:
+        if server:
+            server.stop()
+    print(format_report(report))
+    return report
+
+
+if __name__ == '__main__':  # pragma no cover
+    main()
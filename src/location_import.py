@@ -0,0 +1,82 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Create large lists of locations with batched, concurrent create_locations
+calls
+"""
+from collections import namedtuple
+from _bulk import RateLimiter, chunked, create_bisecting, run_bulk
+import time
+
+
+# Outcome of import_locations
+#   created     location models returned by AvaTax
+#   failures    location code -> failed response, or the exception raised
+#   duplicates  location codes that appeared more than once, only the first
+#               occurrence was sent
+#   elapsed     seconds spent on the whole import
+LocationImport = namedtuple('LocationImport',
+                            'created failures duplicates elapsed')
+
+
+def import_locations(client, company_id, locations, batch_size=100,
+                     workers=4, rate=None):
+    """
+    Create every location, batch_size locations per create_locations call.
+
+    Locations are deduplicated by locationCode before being sent.
+
+    :param  AvataxClient  client:      The client used to make the calls
+    :param  int           company_id:  The ID of the company owning the
+        locations
+    :param  iterable      locations:   LocationModel dictionaries
+    :param  int           batch_size:  Number of locations per call
+    :param  int           workers:     Maximum number of calls in flight
+    :param  int/float     rate:        Maximum number of calls per second
+    :return: LocationImport
+    """
+    start = time.time()
+    seen = set()
+    duplicates = []
+
+    def unique():
+        for location in locations:
+            code = location.get('locationCode')
+            if code in seen:
+                duplicates.append(code)
+                continue
+            seen.add(code)
+            yield location
+
+    def create(chunk):
+        return client.create_locations(company_id, chunk)
+
+    # acquired for each call, those splitting a rejected chunk included
+    limiter = RateLimiter(rate) if rate else None
+    created, failures = [], {}
+    for result in run_bulk(
+            lambda chunk: create_bisecting(create, chunk, limiter),
+            chunked(unique(), batch_size), workers):
+        if result.error is not None:
+            for location in result.item:
+                failures[location.get('locationCode')] = result.error
+            continue
+        chunk_created, chunk_failed = result.response
+        created.extend(chunk_created)
+        for location, response in chunk_failed:
+            failures[location.get('locationCode')] = response
+    return LocationImport(created, failures, duplicates, time.time() - start)
@@ -0,0 +1,471 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+MockAvataxServer is a local stand-in for the AvaTax REST API, for offline
+tests and benchmarks
+
+    with MockAvataxServer(latency=0.02) as server:
+        client = AvataxClient('bench', '1.0', 'localhost', server.url)
+
+With http2=True it talks HTTP/2 without negotiation (h2c), which requires h2:
+pip install Avalara[httpx]
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.structures import CaseInsensitiveDict
+from decimal import Decimal, ROUND_HALF_UP
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+except ImportError:  # pragma no cover
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs, urlparse
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+except ImportError:  # pragma no cover
+    h2 = None
+
+
+# Sales tax rate of each region, other regions use DEFAULT_RATE
+RATES = {'CA': Decimal('0.0775'), 'WA': Decimal('0.101'),
+         'IL': Decimal('0.1025'), 'NY': Decimal('0.08875')}
+DEFAULT_RATE = Decimal('0.06')
+
+# Document types AvaTax calculates without saving them
+UNSAVED_TYPES = ('SalesOrder', 'PurchaseOrder', 'ReturnOrder',
+                 'InventoryTransferOrder')
+
+
+def _error(code, message):
+    """Return an AvaTax ErrorResult body."""
+    return {'error': {'code': code, 'message': message, 'details': [
+        {'code': code, 'message': message, 'severity': 'Error'}]}}
+
+
+def _cents(amount):
+    return amount.quantize(Decimal('0.01'), ROUND_HALF_UP)
+
+
+def _region(model):
+    """Return the region taxes are calculated for."""
+    addresses = model.get('addresses') or {}
+    for kind in ('ShipTo', 'SingleLocation', 'PointOfOrderAcceptance'):
+        if addresses.get(kind):
+            return str(addresses[kind].get('region', '')).upper()
+    return ''
+
+
+def _split(path):
+    """Return the path of a url and its query parameters."""
+    url = urlparse(path)
+    return url.path, dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve one connection, requests are kept alive between calls."""
+
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately, without this each kept
+    # alive call waits for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.mock._connected()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        path, query = _split(self.path)
+        status, result = self.server.mock.handle(method, path, query, body,
+                                                 self.headers)
+        payload = json.dumps(result).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    # the default backlog of 5 resets bursts of concurrent connections
+    request_queue_size = 128
+
+
+class _H2Connection(object):
+    """Serve one HTTP/2 connection, each stream is answered by the pool."""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(
+            client_side=False, header_encoding='utf-8'))
+        # guards the connection state and the socket writes, waited on
+        # when the client's flow control window is exhausted
+        self.cond = threading.Condition()
+        self.closed = False
+        self.streams = {}
+
+    def _flush(self):
+        self.sock.sendall(self.conn.data_to_send())
+
+    def run(self):
+        try:
+            with self.cond:
+                self.conn.initiate_connection()
+                self._flush()
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                with self.cond:
+                    events = self.conn.receive_data(data)
+                    self._flush()
+                if not self._dispatch(events):
+                    break
+        except (socket.error, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            with self.cond:
+                self.closed = True
+                self.cond.notify_all()
+            self.sock.close()
+
+    def _dispatch(self, events):
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self.streams[event.stream_id] = (
+                    CaseInsensitiveDict(event.headers), [])
+            elif isinstance(event, h2.events.DataReceived):
+                self.streams[event.stream_id][1].append(event.data)
+                with self.cond:
+                    self.conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id)
+                    self._flush()
+            elif isinstance(event, h2.events.StreamEnded):
+                headers, body = self.streams.pop(event.stream_id)
+                self.server.pool.submit(self._respond, event.stream_id,
+                                        headers, b''.join(body))
+            elif isinstance(event, (h2.events.WindowUpdated,
+                                    h2.events.RemoteSettingsChanged)):
+                with self.cond:
+                    self.cond.notify_all()
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                return False
+        return True
+
+    def _respond(self, stream_id, headers, body):
+        path, query = _split(headers[':path'])
+        status, result = self.server.mock.handle(headers[':method'], path,
+                                                 query, body, headers)
+        payload = json.dumps(result).encode('utf-8')
+        try:
+            with self.cond:
+                self.conn.send_headers(stream_id, [
+                    (':status', str(status)),
+                    ('content-type', 'application/json'),
+                    ('content-length', str(len(payload)))])
+                while True:
+                    window = self.conn.local_flow_control_window(stream_id)
+                    if payload and window <= 0:
+                        self._flush()
+                        self.cond.wait()
+                        if self.closed:
+                            return
+                        continue
+                    size = min(window, self.conn.max_outbound_frame_size,
+                               len(payload))
+                    self.conn.send_data(stream_id, payload[:size],
+                                        end_stream=size == len(payload))
+                    payload = payload[size:]
+                    if not payload:
+                        break
+                self._flush()
+        except (socket.error, h2.exceptions.ProtocolError):
+            # the client reset the stream or went away
+            pass
+
+
+class _H2Server(object):
+    """Accept HTTP/2 connections, with the interface of HTTPServer."""
+
+    def __init__(self, address, mock):
+        self.mock = mock
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(address)
+        self.socket.listen(128)
+        # wakes the accept loop regularly so shutdown is noticed
+        self.socket.settimeout(0.1)
+        self.server_address = self.socket.getsockname()
+        self.pool = ThreadPoolExecutor(256)
+        self._running = threading.Event()
+
+    def serve_forever(self):
+        self._running.set()
+        while self._running.is_set():
+            try:
+                sock, _ = self.socket.accept()
+            except socket.timeout:
+                continue
+            except socket.error:
+                return
+            sock.settimeout(None)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.mock._connected()
+            thread = threading.Thread(target=_H2Connection(self, sock).run)
+            thread.daemon = True
+            thread.start()
+
+    def shutdown(self):
+        self._running.clear()
+
+    def server_close(self):
+        self.socket.close()
+        self.pool.shutdown(False)
+
+
+class MockAvataxServer(object):
+    """Class for a local HTTP server answering like AvaTax."""
+
+    def __init__(self, latency=0, error_rate=0, error_status=503, seed=None,
+                 host='127.0.0.1', port=0, http2=False):
+        """
+        Initialize the server, call start or use it as a context manager.
+
+        :param  int/float/function  latency:       Seconds added to every
+            call, or a function returning them
+        :param  float               error_rate:    Fraction of calls answered
+            with error_status instead
+        :param  int                 error_status:  Status of injected errors
+        :param  int                 seed:          Seed of the error injection
+        :param  string              host:          Interface to listen on
+        :param  int                 port:          Port to listen on, 0 picks
+            a free one
+        :param  boolean             http2:         Talk HTTP/2 instead of
+            HTTP/1.1
+        """
+        if http2 and h2 is None:
+            raise ImportError('The HTTP/2 server requires h2, '
+                              'pip install Avalara[httpx]')
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.host = host
+        self.port = port
+        self.http2 = http2
+        self.requests = 0
+        self.errors = 0
+        # number of client connections accepted
+        self.connections = 0
+        self.transactions = OrderedDict()
+        self.companies = [{'id': 1, 'companyCode': 'DEFAULT',
+                           'name': 'Default company', 'isActive': True}]
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._routes = [
+            ('GET', r'/api/v2/utilities/ping$', self._ping),
+            ('POST', r'/api/v2/transactions/create$', self._create),
+            ('GET', r'/api/v2/addresses/resolve$', self._resolve),
+            ('POST', r'/api/v2/addresses/resolve$', self._resolve),
+            ('GET', r'/api/v2/taxrates/by(address|postalcode)$', self._rates),
+            ('GET', r'/api/v2/companies$', self._companies),
+            ('GET', r'/api/v2/companies/([^/]+)/transactions$',
+             self._transactions),
+            ('GET', r'/api/v2/companies/([^/]+)/transactions/([^/]+)$',
+             self._transaction),
+        ]
+
+    @property
+    def url(self):
+        """Return the base url to give AvataxClient as environment."""
+        return 'http://{}:{}'.format(self.host, self.port)
+
+    def start(self):
+        """Listen in a background thread."""
+        if self.http2:
+            self._server = _H2Server((self.host, self.port), self)
+        else:
+            self._server = _ThreadingServer((self.host, self.port), _Handler)
+            self._server.mock = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='avatax-mock-server')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop listening and close the socket."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def _connected(self):
+        with self._lock:
+            self.connections += 1
+
+    def __enter__(self):
+        """Start the server as a context manager."""
+        return self.start()
+
+    def __exit__(self, *exc):
+        """Stop the server."""
+        self.stop()
+
+    def handle(self, method, path, query, body, headers):
+        """
+        Answer one call, return (status, body).
+
+        :param  string      method:   The HTTP method
+        :param  string      path:     The path of the url
+        :param  dictionary  query:    The query parameters
+        :param  bytes       body:     The request body
+        :param  object      headers:  The request headers
+        :return: tuple of int and dictionary
+        """
+        with self._lock:
+            self.requests += 1
+            fail = self.error_rate and self._random.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return self.error_status, _error('ServerConfiguration',
+                                             'Injected error')
+        for route_method, pattern, handler in self._routes:
+            match = re.match(pattern, path)
+            if match and route_method == method:
+                try:
+                    model = json.loads(body.decode('utf-8')) if body else None
+                except ValueError:
+                    return 400, _error('InvalidJson', 'Malformed body')
+                return handler(query, model, headers, *match.groups())
+        return 404, _error('EntityNotFoundError',
+                           'No route for {} {}'.format(method, path))
+
+    def _ping(self, query, model, headers):
+        return 200, {'version': '18.5.0-mock',
+                     'authenticated': bool(headers.get('Authorization')),
+                     'authenticationType': 'None'}
+
+    def _create(self, query, model, headers):
+        if not model or not model.get('lines'):
+            return 400, _error('MissingLine', 'A transaction needs lines')
+        rate = RATES.get(_region(model), DEFAULT_RATE)
+        lines, total, total_tax = [], Decimal(0), Decimal(0)
+        for number, line in enumerate(model['lines'], 1):
+            amount = Decimal(str(line.get('amount', 0)))
+            tax = _cents(amount * rate)
+            total += amount
+            total_tax += tax
+            lines.append({
+                'id': number, 'lineNumber': str(line.get('number', number)),
+                'itemCode': line.get('itemCode', ''),
+                'lineAmount': float(amount), 'tax': float(tax),
+                'taxCode': line.get('taxCode', 'P0000000'),
+                'details': [{'id': number, 'jurisName': _region(model),
+                             'rate': float(rate), 'tax': float(tax)}]})
+        company = model.get('companyCode') or 'DEFAULT'
+        code = model.get('code') or str(uuid.uuid4())
+        trans = {
+            'id': 0, 'code': code, 'companyCode': company,
+            'type': model.get('type', 'SalesOrder'),
+            'date': model.get('date'), 'customerCode':
+                model.get('customerCode'),
+            'status': 'Committed' if model.get('commit') else 'Saved',
+            'totalAmount': float(total), 'totalTax': float(total_tax),
+            'totalTaxable': float(total), 'lines': lines}
+        if trans['type'] in UNSAVED_TYPES:
+            trans['status'] = 'Temporary'
+            return 201, trans
+        with self._lock:
+            trans['id'] = len(self.transactions) + 1
+            self.transactions[(company, code)] = trans
+        return 201, trans
+
+    def _resolve(self, query, model, headers):
+        address = model.get('address', model) if model else query
+        validated = dict((k, address.get(k)) for k in (
+            'line1', 'city', 'region', 'postalCode', 'country'))
+        validated.update({'latitude': 47.6, 'longitude': -122.3,
+                          'addressType': 'StreetOrResidentialAddress'})
+        return 200, {'address': address, 'validatedAddresses': [validated],
+                     'coordinates': {'latitude': 47.6, 'longitude': -122.3},
+                     'resolutionQuality': 'Intersection'}
+
+    def _rates(self, query, model, headers, kind):
+        rate = RATES.get(str(query.get('region', '')).upper(), DEFAULT_RATE)
+        return 200, {'totalRate': float(rate), 'rates': [
+            {'rate': float(rate), 'name': 'STATE', 'type': 'State'}]}
+
+    def _page(self, records, query):
+        skip = int(query.get('$skip', 0))
+        top = int(query.get('$top', 1000))
+        return 200, {'@recordsetCount': len(records),
+                     'value': records[skip:skip + top]}
+
+    def _companies(self, query, model, headers):
+        return self._page(self.companies, query)
+
+    def _transactions(self, query, model, headers, company):
+        with self._lock:
+            records = [t for (c, _), t in self.transactions.items()
+                       if c == company]
+        return self._page(records, query)
+
+    def _transaction(self, query, model, headers, company, code):
+        trans = self.transactions.get((company, code))
+        if trans is None:
+            return 404, _error('EntityNotFoundError',
+                               'Transaction {} not found'.format(code))
+        return 200, trans
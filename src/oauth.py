@@ -0,0 +1,235 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+OAuth 2.0 bearer tokens fetched from a token provider, cached, and refreshed
+before they expire
+
+    provider = ClientCredentialsProvider(token_url, client_id, secret)
+    client = AvataxClient(...).add_token_provider(provider)
+"""
+from collections import namedtuple
+from requests import Session
+from requests.auth import AuthBase, HTTPBasicAuth
+from transport import reset_session
+import threading
+import time
+
+
+# A bearer token
+#   access_token  the token sent in the Authorization header
+#   expires_at    time.time() at which AvaTax stops accepting it
+Token = namedtuple('Token', 'access_token expires_at')
+
+
+class TokenProvider(object):
+    """
+    Base class of the token providers.
+
+    A provider fetches a new token from the identity provider each time it
+    is asked, TokenAuth does the caching.
+    """
+
+    def fetch(self):
+        """
+        Fetch a new token.
+
+        :return: Token
+        """
+        raise NotImplementedError
+
+    def after_fork(self):
+        """
+        Forget the connections inherited from the parent process.
+
+        Called in a forked child by TokenAuth, the default does nothing.
+        """
+
+
+class ClientCredentialsProvider(TokenProvider):
+    """Token provider using the OAuth 2.0 client credentials grant."""
+
+    def __init__(self, token_url, client_id, client_secret, scope=None,
+                 timeout=10, session=None, clock=time.time):
+        """
+        Initialize the provider.
+
+        :param  string     token_url:      The token endpoint of the
+            identity provider
+        :param  string     client_id:      The OAuth client id
+        :param  string     client_secret:  The OAuth client secret
+        :param  string     scope:          Space separated scopes requested
+        :param  int/float  timeout:        Seconds to wait for a token
+        :param  Session    session:        The session used (default: a
+            new one)
+        """
+        self.token_url = token_url
+        self.scope = scope
+        self.timeout = timeout
+        self.session = session or Session()
+        self.clock = clock
+        self._auth = HTTPBasicAuth(client_id, client_secret)
+
+    def fetch(self):
+        """Ask the token endpoint for a token, see TokenProvider.fetch."""
+        data = {'grant_type': 'client_credentials'}
+        if self.scope:
+            data['scope'] = self.scope
+        start = self.clock()
+        r = self.session.post(self.token_url, data=data, auth=self._auth,
+                              timeout=self.timeout)
+        r.raise_for_status()
+        body = r.json()
+        # counted from the request, the token may have aged on the way back
+        return Token(body['access_token'],
+                     start + float(body.get('expires_in', 3600)))
+
+    def after_fork(self):
+        """Give the session new connection pools, see TokenProvider."""
+        reset_session(self.session)
+
+
+class TokenAuth(AuthBase):
+    """
+    requests authentication sending the token of a provider.
+
+    The token is cached and shared by every thread. A single thread fetches
+    a new one at a time, the others wait for it, so an expiring token does
+    not send each concurrent call to the identity provider. The token is
+    refreshed refresh_margin seconds before it expires, or half way through
+    its life if it is shorter lived. With background, a timer thread
+    refreshes it, calls never wait for it; without, the first call past
+    that time does. A call answered 401 fetches a new token and is retried
+    once.
+    """
+
+    def __init__(self, provider, refresh_margin=60, background=True,
+                 clock=time.time):
+        """
+        Initialize the authentication, the first token is fetched on use.
+
+        :param  TokenProvider  provider:        Fetches the tokens, or a
+            function returning a Token
+        :param  int/float      refresh_margin:  Seconds before expiry at
+            which the token is refreshed
+        :param  boolean        background:      Refresh the token in a timer
+            thread, rather than in the call made once it is due
+        """
+        self.provider = provider
+        self.fetch = getattr(provider, 'fetch', provider)
+        self.refresh_margin = refresh_margin
+        self.background = background
+        self.clock = clock
+        # number of tokens fetched
+        self.refreshes = 0
+        self._token = None
+        # clock() at which the token is due for a refresh
+        self._refresh_at = None
+        self._lock = threading.Lock()
+        self._timer = None
+
+    @property
+    def token(self):
+        """Return the cached token, fetching one if it is due or expired."""
+        token = self._token
+        now = self.clock()
+        if token is None or token.expires_at <= now or \
+                (not self.background and self._refresh_at <= now):
+            token = self._refresh(token)
+        return token
+
+    def _refresh_delay(self, remaining):
+        """Return the seconds until a token valid for remaining is due."""
+        # short lived tokens are refreshed half way through their life
+        return max(remaining - self.refresh_margin, remaining / 2.0)
+
+    def _refresh(self, stale):
+        """Replace the stale token, unless another thread already did."""
+        with self._lock:
+            if self._token is stale:
+                token = self.fetch()
+                now = self.clock()
+                # set first, a thread seeing the new token sees it too
+                self._refresh_at = now + self._refresh_delay(
+                    token.expires_at - now)
+                self._token = token
+                self.refreshes += 1
+                self._schedule()
+            return self._token
+
+    def _schedule(self, retry=False):
+        """Start the timer refreshing the token, the lock must be held."""
+        if not self.background:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        remaining = self._token.expires_at - self.clock()
+        if remaining <= 0:
+            return
+        if retry:
+            delay = max(remaining / 2.0, 1)
+        else:
+            delay = self._refresh_delay(remaining)
+        self._timer = threading.Timer(delay, self._refresh_ahead)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_ahead(self):
+        token = self._token
+        try:
+            self._refresh(token)
+        except Exception:
+            # the current token is used until it expires, try again meanwhile
+            with self._lock:
+                if self._token is token:
+                    self._schedule(retry=True)
+
+    def __call__(self, r):
+        """Add the token to a prepared request."""
+        r.headers['Authorization'] = 'Bearer ' + self.token.access_token
+        return r
+
+    def handle_401(self, response):
+        """
+        Drop the token AvaTax refused, called by the transport on a 401.
+
+        :param  Response  response:  The 401 answer
+        :return: boolean, True to retry the call with a new token
+        """
+        token = self._token
+        sent = response.request.headers.get('Authorization') \
+            if response.request is not None else None
+        if token is not None and sent == 'Bearer ' + token.access_token:
+            self._refresh(token)
+        return True
+
+    def close(self):
+        """Stop refreshing the token in the background."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def after_fork(self):
+        """Keep the token, but not the lock, timer and connections."""
+        self._lock = threading.Lock()
+        self._timer = None
+        if hasattr(self.provider, 'after_fork'):
+            self.provider.after_fork()
+        if self._token is not None:
+            with self._lock:
+                self._schedule()
@@ -0,0 +1,247 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Offline point-of-sale tax calculation from the JSON tax content built by
+build_tax_content_file, indexed by (location code, tax code)
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from _str_version import str_type
+import bisect
+import json
+import mmap
+import struct
+
+
+# Header of a compiled table: magic, record count, key width
+_MAGIC = b'AVAPOS01'
+_HEADER = struct.Struct('<8sII')
+# Record of a compiled table after the key: effective date, end date, rate
+_VALUE = struct.Struct('<iid')
+# Used for scenarios without an end date
+_FOREVER = 99991231
+_CENT = Decimal('0.01')
+
+
+def _field(record, name):
+    """Return a field of a tax content record, whatever its casing."""
+    if name in record:
+        return record[name]
+    return record.get(name[0].lower() + name[1:])
+
+
+def _day(value, default):
+    """Return a date like 2018-05-31 as the integer 20180531."""
+    if not value:
+        return default
+    return int(str(value)[:10].replace('-', ''))
+
+
+def tax_content_records(source):
+    """
+    Return the list of scenarios of a tax content file.
+
+    :param  object  source:  The response of build_tax_content_file, the
+        path of a JSON tax content file, or the already parsed content
+    :return: list of dictionary
+    """
+    if hasattr(source, 'json'):
+        source = source.json()
+    elif source is not None and isinstance(source, str_type):
+        with open(source) as f:
+            source = json.load(f)
+    if isinstance(source, dict):
+        source = source.get('value', [])
+    return source
+
+
+def _scenarios(records):
+    """Yield (key, effective, end, rate) for each tax content record."""
+    for record in records:
+        key = '{}\0{}'.format(_field(record, 'LocationCode') or '',
+                              _field(record, 'TaxCode') or '')
+        yield (key,
+               _day(_field(record, 'EffDate'), 0),
+               _day(_field(record, 'EndDate'), _FOREVER),
+               float(_field(record, 'TotalTaxRate') or 0))
+
+
+class TaxContentTable(object):
+    """Class for the in-memory rate index of tax content files."""
+
+    def __init__(self, records=()):
+        """
+        Index the scenarios of tax content files.
+
+        :param  iterable  records:  Scenarios returned by tax_content_records
+        """
+        self._index = {}
+        self.add(records)
+
+    def __len__(self):
+        """Return the number of (location, tax code) pairs indexed."""
+        return len(self._index)
+
+    def add(self, records):
+        """
+        Add the scenarios of another tax content file to the index.
+
+        :param  iterable  records:  Scenarios returned by tax_content_records
+        """
+        for key, eff, end, rate in _scenarios(records):
+            bisect.insort(self._index.setdefault(key, []), (eff, end, rate))
+
+    def rate(self, location_code, tax_code, date=None):
+        r"""
+        Return the total tax rate of a tax code at a location.
+
+        :param  string  location_code:  The code of the location
+        :param  string  tax_code:       The tax code of the item
+        :param  string  date:           The document date, e.g. 2018-05-31 \
+            (default: any date)
+        :return: float, or None if the content has no matching scenario
+        """
+        ranges = self._index.get('{}\0{}'.format(location_code, tax_code))
+        if not ranges:
+            return None
+        return _in_range(ranges, _day(date, None))
+
+    def compile(self, path):
+        """
+        Write the index to a file that MappedTaxContentTable can map.
+
+        :param  string  path:  The file to write
+        """
+        keys = sorted(self._index)
+        encoded = [k.encode('utf-8') for k in keys]
+        width = max([len(k) for k in encoded] or [0])
+        count = sum(len(self._index[k]) for k in keys)
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, count, width))
+            for key, raw in zip(keys, encoded):
+                for eff, end, rate in self._index[key]:
+                    f.write(raw.ljust(width, b'\0'))
+                    f.write(_VALUE.pack(eff, end, rate))
+
+
+def _in_range(ranges, day):
+    """Return the rate of the (eff, end, rate) range holding day."""
+    if day is None:
+        return ranges[-1][2]
+    for eff, end, rate in reversed(ranges):
+        if eff <= day <= end:
+            return rate
+    return None
+
+
+class MappedTaxContentTable(object):
+    """Class for a compiled rate index read straight from a memory map."""
+
+    def __init__(self, path):
+        """
+        Map a file written by TaxContentTable.compile.
+
+        :param  string  path:  The compiled file
+        """
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._width = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError('{} is not a compiled tax content file'
+                             .format(path))
+        self._size = self._width + _VALUE.size
+
+    def __len__(self):
+        """Return the number of scenarios in the file."""
+        return self._count
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def _key(self, i):
+        offset = _HEADER.size + i * self._size
+        return self._map[offset:offset + self._width]
+
+    def rate(self, location_code, tax_code, date=None):
+        """
+        Return the total tax rate of a tax code at a location.
+
+        See TaxContentTable.rate.
+        """
+        key = '{}\0{}'.format(location_code, tax_code).encode('utf-8')
+        if len(key) > self._width:
+            return None
+        key = key.ljust(self._width, b'\0')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        ranges = []
+        while lo < self._count and self._key(lo) == key:
+            offset = _HEADER.size + lo * self._size + self._width
+            ranges.append(_VALUE.unpack_from(self._map, offset))
+            lo += 1
+        if not ranges:
+            return None
+        return _in_range(ranges, _day(date, None))
+
+
+class LocalTaxCalculator(object):
+    """Class for calculating line tax offline from a tax content table."""
+
+    def __init__(self, table):
+        """
+        Initialize the calculator.
+
+        :param  object  table:  A TaxContentTable or MappedTaxContentTable
+        """
+        self.table = table
+
+    def line_tax(self, location_code, tax_code, amount, date=None):
+        """
+        Return the tax of a single line, rounded to the cent.
+
+        :param  string      location_code:  The code of the location
+        :param  string      tax_code:       The tax code of the item
+        :param  int/float   amount:         The total amount of the line
+        :param  string      date:           The document date
+        :return: Decimal
+        """
+        rate = self.table.rate(location_code, tax_code, date)
+        if rate is None:
+            raise KeyError('No tax content for tax code {} at location {}'
+                           .format(tax_code, location_code))
+        return (Decimal(str(amount)) * Decimal(repr(rate))).quantize(
+            _CENT, rounding=ROUND_HALF_UP)
+
+    def calculate(self, location_code, lines, date=None):
+        """
+        Return the tax of each line of a sale and the total tax.
+
+        :param  string  location_code:  The code of the location
+        :param  list    lines:          Lines with `amount` and `taxCode`, as
+            added by TransactionBuilder.with_line
+        :param  string  date:           The document date
+        :return: dictionary with `lines` (list of Decimal) and `totalTax`
+        """
+        taxes = [self.line_tax(location_code, line.get('taxCode'),
+                               line['amount'], date) for line in lines]
+        return {'lines': taxes, 'totalTax': sum(taxes, Decimal('0.00'))}
@@ -0,0 +1,196 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Reconcile the transactions recorded by AvaTax against a local source of
+orders, for many companies at once
+"""
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from _bulk import iter_records_by_id
+import time
+
+
+# Fields compared by default, tolerance applies to the numeric ones
+FIELDS = ('totalAmount', 'totalTax')
+
+# Document type assumed for documents without one, e.g. local orders
+DEFAULT_TYPE = 'SalesInvoice'
+
+# Outcome for one company, documents are identified by (type, code) since
+# e.g. an invoice and its return may share a code
+#   matched      number of documents found on both sides with equal fields
+#   missing      (type, code) in the local source but not in AvaTax
+#   unexpected   (type, code) in AvaTax but not in the local source
+#   mismatched   (type, code) -> list of (field, local value, AvaTax value)
+#   local_tax    totalTax summed over the local documents
+#   avatax_tax   totalTax summed over the AvaTax documents
+CompanyReconciliation = namedtuple('CompanyReconciliation', 'matched missing '
+                                   'unexpected mismatched local_tax '
+                                   'avatax_tax')
+
+# Outcome of reconcile
+#   companies  company code -> CompanyReconciliation
+#   failures   company code -> exception raised while fetching its documents
+#   totals     matched, missing, unexpected and mismatched summed over every
+#              company
+#   elapsed    seconds spent on the whole reconciliation
+ReconciliationReport = namedtuple('ReconciliationReport', 'companies '
+                                  'failures totals elapsed')
+
+
+def transaction_index(transactions, fields=FIELDS):
+    """
+    Index transactions by type and code, keeping only the compared fields.
+
+    :param  iterable  transactions:  Transaction dictionaries with a code,
+        and a type (default: DEFAULT_TYPE)
+    :param  tuple     fields:        The fields kept for each document
+    :return: dictionary of (type, code) -> tuple of field values
+    """
+    return dict(((trans.get('type') or DEFAULT_TYPE, trans['code']),
+                 tuple(trans.get(f) for f in fields))
+                for trans in transactions)
+
+
+def _equal(local, remote, tolerance):
+    if isinstance(local, (int, float)) and isinstance(remote, (int, float)) \
+            and not isinstance(local, bool):
+        return abs(local - remote) <= tolerance
+    return local == remote
+
+
+def compare(local, remote, fields=FIELDS, tolerance=0.005):
+    """
+    Compare the local and AvaTax indexes of one company.
+
+    :param  dictionary  local:      (type, code) -> values, from
+        transaction_index
+    :param  dictionary  remote:     (type, code) -> values, from
+        transaction_index
+    :param  tuple       fields:     The fields the values stand for
+    :param  float       tolerance:  Largest difference between equal amounts
+    :return: CompanyReconciliation
+    """
+    matched = 0
+    mismatched = {}
+    for key, values in local.items():
+        other = remote.get(key)
+        if other is None:
+            continue
+        diffs = [(field, a, b) for field, a, b in zip(fields, values, other)
+                 if not _equal(a, b, tolerance)]
+        if diffs:
+            mismatched[key] = diffs
+        else:
+            matched += 1
+    tax = fields.index('totalTax') if 'totalTax' in fields else None
+
+    def total(index):
+        if tax is None:
+            return 0.0
+        return sum(values[tax] or 0 for values in index.values())
+
+    return CompanyReconciliation(
+        matched, sorted(set(local) - set(remote)),
+        sorted(set(remote) - set(local)), mismatched, total(local),
+        total(remote))
+
+
+def _compare_args(args):
+    """Unpack the arguments of compare, the target of the process pool."""
+    return compare(*args)
+
+
+def company_codes(client, include=None):
+    r"""
+    Yield the code of every company the account can see.
+
+    :param  AvataxClient  client:   The client used to make the calls
+    :param  dictionary    include:  Query parameters, e.g. \
+        {'$filter': 'isActive eq true'}
+    :return: generator of string
+    """
+    for company in iter_records_by_id(client.query_companies, include):
+        yield company['companyCode']
+
+
+def reconcile(client, local, companies=None, fields=FIELDS, include=None,
+              tolerance=0.005, workers=8, processes=None, page_size=1000):
+    r"""
+    Reconcile the transactions of many companies against a local source.
+
+    The transactions of each company are fetched concurrently, in pages of
+    ascending ids so documents committed meanwhile do not shift them, and
+    indexed by type and code as they arrive, only the compared fields are
+    kept. With
+    processes, the comparison of each company runs on a process pool so it
+    scales across cores.
+
+    :param  AvataxClient  client:     The client used to make the calls
+    :param  dictionary    local:      company code -> iterable of local
+        documents, dictionaries with a code, the compared fields and a
+        type (default: DEFAULT_TYPE)
+    :param  list          companies:  Company codes to reconcile (default:
+        every company returned by query_companies)
+    :param  tuple         fields:     The fields compared
+    :param  dictionary    include:    Query parameters of the transaction \
+        lists, e.g. {'$filter': "date ge '2018-01-01'"}
+    :param  float         tolerance:  Largest difference between equal amounts
+    :param  int           workers:    Maximum number of companies fetched at
+        once
+    :param  int           processes:  Number of processes comparing, None to
+        compare in this process
+    :param  int           page_size:  Number of transactions per call
+    :return: ReconciliationReport
+    """
+    start = time.time()
+    fields = tuple(fields)
+    if companies is None:
+        companies = list(company_codes(client))
+
+    def fetch(code):
+        return transaction_index(iter_records_by_id(
+            lambda params: client.list_transactions_by_company(code, params),
+            include, page_size), fields)
+
+    remote, failures = {}, {}
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [(code, pool.submit(fetch, code)) for code in companies]
+        for code, future in futures:
+            try:
+                remote[code] = future.result()
+            except Exception as e:
+                failures[code] = e
+
+    codes = [code for code in companies if code in remote]
+    jobs = [(transaction_index(local.get(code, ()), fields), remote[code],
+             fields, tolerance) for code in codes]
+    if processes:
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_compare_args, jobs))
+    else:
+        results = [_compare_args(job) for job in jobs]
+    outcome = dict(zip(codes, results))
+
+    totals = {'matched': 0, 'missing': 0, 'unexpected': 0, 'mismatched': 0}
+    for result in results:
+        totals['matched'] += result.matched
+        totals['missing'] += len(result.missing)
+        totals['unexpected'] += len(result.unexpected)
+        totals['mismatched'] += len(result.mismatched)
+    return ReconciliationReport(outcome, failures, totals,
+                                time.time() - start)
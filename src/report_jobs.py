@@ -0,0 +1,230 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+ReportJobManager runs many ExportDocumentLine reports, polling them from a
+single scheduler thread and saving each report as soon as it is completed
+"""
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from requests.exceptions import HTTPError
+import heapq
+import itertools
+import os
+import threading
+import time
+
+
+# Report statuses after which a report will never complete
+FAILED_STATUSES = ('Failed', 'Error', 'Cancelled', 'Canceled', 'Expired')
+
+
+class ReportJob(object):
+    """Class for a report initiated through a ReportJobManager."""
+
+    def __init__(self, company_id, report_id, path):
+        """
+        Initialize the job.
+
+        :param  int     company_id:  The company reported on
+        :param  int     report_id:   The ID of the report task
+        :param  string  path:        Where the report is saved
+        """
+        self.company_id = company_id
+        self.report_id = report_id
+        self.path = path
+        self.status = 'Pending'
+        self.polls = 0
+        # polls failed in a row
+        self.errors = 0
+        # resolves to the path once saved
+        self.future = Future()
+
+
+class ReportJobManager(object):
+    """Class for running and downloading asynchronous report tasks."""
+
+    def __init__(self, client, directory, min_interval=2, max_interval=60,
+                 backoff=1.5, workers=4, chunk_size=64 * 1024, retries=3):
+        """
+        Start the scheduler thread.
+
+        Each report is first polled min_interval seconds after it is
+        initiated, then the interval grows by the backoff factor up to
+        max_interval, so long running reports are polled less often. A poll
+        raising, or answered 429 or 5xx, is tried again at the next interval,
+        a job fails after retries such polls in a row.
+
+        :param  AvataxClient  client:        The client used to make the calls
+        :param  string        directory:     Folder the reports are saved to
+        :param  int/float     min_interval:  First polling interval in seconds
+        :param  int/float     max_interval:  Longest polling interval
+        :param  float         backoff:       Growth factor of the interval
+        :param  int           workers:       Maximum number of downloads in
+            flight
+        :param  int           chunk_size:    Bytes written to disk at a time
+        :param  int           retries:       Failed polls in a row retried
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.client = client
+        self.directory = directory
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.jobs = []
+        self._pool = ThreadPoolExecutor(workers)
+        self._heap = []
+        self._seq = itertools.count()
+        self._closed = False
+        self._cond = threading.Condition()
+        self._scheduler = threading.Thread(target=self._schedule,
+                                           name='avatax-reports')
+        self._scheduler.daemon = True
+        self._scheduler.start()
+
+    def __enter__(self):
+        """Use the manager as a context manager."""
+        return self
+
+    def __exit__(self, *exc):
+        """Stop polling and wait for the downloads in flight."""
+        self.close()
+
+    def submit(self, company_id, model):
+        """
+        Initiate an ExportDocumentLine report and schedule its polling.
+
+        :param  int         company_id:  The company to report on
+        :param  dictionary  model:       The ExportDocumentLineModel
+        :return: ReportJob
+        """
+        response = self.client.initiate_export_document_line_report(
+            company_id, model)
+        response.raise_for_status()
+        report_id = response.json()['id']
+        ext = str(model.get('format') or 'Csv').lower()
+        path = os.path.join(self.directory, 'report_{}_{}.{}'.format(
+            company_id, report_id, ext))
+        job = ReportJob(company_id, report_id, path)
+        self.jobs.append(job)
+        self._schedule_poll(job, self.min_interval)
+        return job
+
+    def as_completed(self, jobs=None, timeout=None):
+        """
+        Yield jobs as their reports are saved or fail.
+
+        :param  list       jobs:     The jobs to wait for (default: all)
+        :param  int/float  timeout:  Seconds to wait for all of them
+        :return: generator of ReportJob, job.future.result() is the path
+        """
+        by_future = dict((job.future, job) for job in (jobs or self.jobs))
+        for future in as_completed(by_future, timeout):
+            yield by_future[future]
+
+    def close(self):
+        """
+        Stop the scheduler and wait for the downloads in flight.
+
+        Jobs still waiting for their report are cancelled, their future
+        raises CancelledError.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._scheduler.join()
+        with self._cond:
+            pending, self._heap = self._heap, []
+        for _, _, job, _ in pending:
+            _cancel(job)
+        self._pool.shutdown(True)
+
+    def _schedule_poll(self, job, interval):
+        with self._cond:
+            if not self._closed:
+                heapq.heappush(self._heap, (time.time() + interval,
+                                            next(self._seq), job, interval))
+                self._cond.notify()
+                return
+        # closed while the job was being polled
+        _cancel(job)
+
+    def _schedule(self):
+        """Scheduler thread, poll each report when its interval elapsed."""
+        while True:
+            with self._cond:
+                while not self._closed and (
+                        not self._heap or self._heap[0][0] > time.time()):
+                    timeout = self._heap[0][0] - time.time() \
+                        if self._heap else None
+                    self._cond.wait(timeout)
+                if self._closed:
+                    return
+                _, _, job, interval = heapq.heappop(self._heap)
+            self._poll(job, interval)
+
+    def _poll(self, job, interval):
+        job.polls += 1
+        next_interval = min(interval * self.backoff, self.max_interval)
+        try:
+            response = self.client.get_report(job.report_id)
+            response.raise_for_status()
+            job.status = response.json().get('status')
+        except Exception as e:
+            job.errors += 1
+            status = e.response.status_code if isinstance(e, HTTPError) \
+                and e.response is not None else None
+            transient = status is None or status == 429 or status >= 500
+            if transient and job.errors <= self.retries:
+                self._schedule_poll(job, next_interval)
+                return
+            job.status = 'Error'
+            job.future.set_exception(e)
+            return
+        job.errors = 0
+        if job.status == 'Completed':
+            self._pool.submit(self._download, job)
+        elif job.status in FAILED_STATUSES:
+            job.future.set_exception(RuntimeError(
+                'Report {} ended with status {}'.format(job.report_id,
+                                                        job.status)))
+        else:
+            self._schedule_poll(job, next_interval)
+
+    def _download(self, job):
+        """Worker thread, stream a completed report to disk."""
+        try:
+            response = self.client.download_report(job.report_id, stream=True)
+            try:
+                response.raise_for_status()
+                with open(job.path + '.part', 'wb') as f:
+                    for chunk in response.iter_content(self.chunk_size):
+                        f.write(chunk)
+            finally:
+                response.close()
+            getattr(os, 'replace', os.rename)(job.path + '.part', job.path)
+        except Exception as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(job.path)
+
+
+def _cancel(job):
+    """Cancel the future of a job, waking up as_completed."""
+    job.future.cancel()
+    job.future.set_running_or_notify_cancel()
@@ -0,0 +1,234 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Turn large downloads, like reports and the tax rates by zip code file, into
+record iterators without loading them in memory
+
+For flat memory, request the download with stream=True, e.g.
+iter_csv_records(client.download_report(id_, stream=True))
+"""
+import codecs
+import csv
+import json
+import sys
+
+
+_WHITESPACE = ' \t\r\n'
+
+
+def iter_chunks(source, chunk_size=64 * 1024):
+    """
+    Yield the bytes of a download, chunk by chunk.
+
+    :param  object  source:      A Response object, an open binary file or
+        an iterable of bytes
+    :param  int     chunk_size:  Bytes read at a time
+    :return: generator of bytes
+    """
+    if hasattr(source, 'iter_content'):
+        for chunk in source.iter_content(chunk_size):
+            yield chunk
+    elif hasattr(source, 'read'):
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
+
+
+def iter_text(source, encoding='utf-8', chunk_size=64 * 1024):
+    """Yield the decoded text of a download, chunk by chunk."""
+    decoder = codecs.getincrementaldecoder(encoding)('replace')
+    first = True
+    for chunk in iter_chunks(source, chunk_size):
+        text = decoder.decode(chunk)
+        if first and text:
+            text = text.lstrip(u'\ufeff')
+            first = False
+        if text:
+            yield text
+    tail = decoder.decode(b'', True)
+    if tail:
+        yield tail
+
+
+def iter_lines(source, encoding='utf-8', chunk_size=64 * 1024):
+    """Yield the lines of a download, with their line endings."""
+    pending = u''
+    for text in iter_text(source, encoding, chunk_size):
+        buf = pending + text
+        start = 0
+        end = buf.find(u'\n')
+        while end >= 0:
+            yield buf[start:end + 1]
+            start = end + 1
+            end = buf.find(u'\n', start)
+        pending = buf[start:]
+    if pending:
+        yield pending
+
+
+def _project(header, columns):
+    """Return the positions of the projected columns in the header."""
+    if columns is None:
+        return list(range(len(header)))
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise KeyError('Columns not in the file: {}'.format(
+            ', '.join(missing)))
+    return [header.index(c) for c in columns]
+
+
+def iter_csv_records(source, columns=None, as_tuples=False,
+                     encoding='utf-8', chunk_size=64 * 1024):
+    """
+    Yield the records of a CSV download whose first row is the header.
+
+    :param  object   source:     A Response object, an open binary file or
+        an iterable of bytes
+    :param  list     columns:    Only keep these columns, in this order
+    :param  boolean  as_tuples:  Yield tuples of values instead of
+        dictionaries keyed by column name
+    :param  string   encoding:   The encoding of the file
+    :return: generator of dictionary or tuple
+    """
+    lines = iter_lines(source, encoding, chunk_size)
+    if sys.version_info.major == 2:  # pragma no cover
+        lines = (line.encode('utf-8') for line in lines)
+    reader = csv.reader(lines)
+    try:
+        header = [h.strip() for h in next(reader)]
+    except StopIteration:
+        return
+    positions = _project(header, columns)
+    names = [header[i] for i in positions]
+    for row in reader:
+        if not row:
+            continue
+        values = tuple(row[i] if i < len(row) else None for i in positions)
+        yield values if as_tuples else dict(zip(names, values))
+
+
+def iter_json_records(source, columns=None, as_tuples=False,
+                      encoding='utf-8', chunk_size=64 * 1024):
+    """
+    Yield the records of a JSON download holding an array of objects.
+
+    Objects are decoded one at a time as the array is read. A download
+    holding a FetchResult object is decoded whole and its `value` records
+    are yielded.
+
+    :param  object   source:     A Response object, an open binary file or
+        an iterable of bytes
+    :param  list     columns:    Only keep these fields, in this order
+    :param  boolean  as_tuples:  Yield tuples of values instead of
+        dictionaries
+    :param  string   encoding:   The encoding of the file
+    :return: generator of dictionary or tuple
+    """
+    decoder = json.JSONDecoder()
+    text = iter_text(source, encoding, chunk_size)
+    buf = u''
+    pos = 0
+    started = False
+
+    def shape(record):
+        if columns is None:
+            return tuple(record.values()) if as_tuples else record
+        values = tuple(record.get(c) for c in columns)
+        return values if as_tuples else dict(zip(columns, values))
+
+    for chunk in text:
+        buf = buf[pos:] + chunk
+        pos = 0
+        while True:
+            while pos < len(buf) and (buf[pos] in _WHITESPACE or
+                                      (started and buf[pos] == ',')):
+                pos += 1
+            if pos >= len(buf):
+                break
+            if not started:
+                if buf[pos] == '{':
+                    # not an array, decode the whole document
+                    document = json.loads(buf[pos:] + u''.join(text))
+                    for record in document.get('value', []):
+                        yield shape(record)
+                    return
+                if buf[pos] != '[':
+                    raise ValueError('Expected a JSON array')
+                started = True
+                pos += 1
+                continue
+            if buf[pos] == ']':
+                return
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                # the object continues in the next chunk
+                break
+            pos = end
+            yield shape(record)
+    if started or buf[pos:].strip():
+        raise ValueError('Truncated JSON array')
+
+
+def iter_tax_rates_by_zip_code(client, date, columns=None, as_tuples=False,
+                               include=None):
+    r"""
+    Stream the records of the tax rates by zip code file.
+
+    :param  AvataxClient  client:     The client used to make the call
+    :param  string        date:       The date of the rates, e.g. 2018-05-31
+    :param  list          columns:    Only keep these columns, e.g. \
+        ['ZIP_CODE', 'TOTAL_SALES_TAX']
+    :param  boolean       as_tuples:  Yield tuples instead of dictionaries
+    :param  dictionary    include:    Other query parameters, e.g. \
+        {'region': 'WA'}
+    :return: generator of dictionary or tuple
+    """
+    response = client.download_tax_rates_by_zip_code(date, include,
+                                                     stream=True)
+    try:
+        response.raise_for_status()
+        for record in iter_csv_records(response, columns, as_tuples):
+            yield record
+    finally:
+        response.close()
+
+
+def iter_report_records(client, report_id, columns=None, as_tuples=False,
+                        format='Csv'):
+    r"""
+    Stream the records of a completed report.
+
+    :param  AvataxClient  client:     The client used to make the call
+    :param  int           report_id:  The ID of the report
+    :param  list          columns:    Only keep these columns
+    :param  boolean       as_tuples:  Yield tuples instead of dictionaries
+    :param  string        format:     The format the report was built in, \
+        Csv or Json
+    :return: generator of dictionary or tuple
+    """
+    parse = iter_json_records if format.lower() == 'json' else \
+        iter_csv_records
+    response = client.download_report(report_id, stream=True)
+    try:
+        response.raise_for_status()
+        for record in parse(response, columns, as_tuples):
+            yield record
+    finally:
+        response.close()
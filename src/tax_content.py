@@ -0,0 +1,284 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Build point-of-sale tax content files for many locations concurrently, and
+keep a versioned on-disk copy of them incrementally in sync
+"""
+from collections import namedtuple
+from _bulk import iter_records, run_bulk
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import time
+
+
+# Outcome of build_tax_content_files
+#   files     location code -> path of the file written
+#   timings   location code -> seconds spent building the file
+#   failures  location code -> BulkResult of the failed call
+#   elapsed   seconds spent on the whole run
+TaxContentRun = namedtuple('TaxContentRun', 'files timings failures elapsed')
+
+# Outcome of sync_tax_content
+#   version    the version now in use
+#   changed    codes of the locations whose content changed
+#   unchanged  codes of the locations whose content is the same
+#   failures   location code -> BulkResult of the failed call
+#   elapsed    seconds spent on the whole sync
+TaxContentSync = namedtuple('TaxContentSync',
+                            'version changed unchanged failures elapsed')
+
+# Name of the file holding the version readers should use
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+
+FILE_EXTENSIONS = {'json': 'json', 'csv': 'csv', 'xml': 'xml'}
+
+
+def tax_content_path(directory, location_code, date, response_type='Json'):
+    """
+    Return the path of the tax content file of a location.
+
+    :param  string  directory:      Folder holding the tax content files
+    :param  string  location_code:  The code of the location
+    :param  string  date:           The date the content was built for
+    :param  string  response_type:  The format of the file
+    :return: string
+    """
+    ext = FILE_EXTENSIONS.get(response_type.lower(), 'txt')
+    return os.path.join(directory, '{}_{}.{}'.format(date, location_code, ext))
+
+
+def _location_ids(client, company):
+    """Return the location code -> location id map of a company."""
+    companies = client.query_companies(
+        {'$filter': "companyCode eq '{}'".format(company)})
+    companies.raise_for_status()
+    matches = companies.json().get('value', [])
+    if not matches:
+        raise ValueError('Company {} does not exist'.format(company))
+    comp_id = matches[0]['id']
+    return comp_id, dict(
+        (loc['locationCode'], loc['id']) for loc in iter_records(
+            lambda params: client.list_locations_by_company(comp_id, params)))
+
+
+def _builder(client, company, tax_codes, response_type, date):
+    """Return the function building the tax content of one location."""
+    if tax_codes:
+        def build(code):
+            return client.build_tax_content_file({
+                'companyCode': company,
+                'documentDate': date,
+                'responseType': response_type,
+                'taxCodes': tax_codes,
+                'locationCodes': [code]})
+        return build
+    comp_id, loc_ids = _location_ids(client, company)
+
+    def build(code):
+        if code not in loc_ids:
+            raise ValueError('Location {} does not exist'.format(code))
+        return client.build_tax_content_file_for_location(
+            comp_id, loc_ids[code], {'date': date, 'format': response_type})
+    return build
+
+
+def build_tax_content_files(client, company, location_codes, tax_codes=None,
+                            directory='taxfiles', workers=8,
+                            response_type='Json', date=None, report=None):
+    r"""
+    Build and save one tax content file per location, concurrently.
+
+    With tax codes, each file is built by build_tax_content_file for those
+    codes. Without, build_tax_content_file_for_location builds it from the
+    items configured on the company. Each file is written to disk as soon as
+    its call completes.
+
+    :param  AvataxClient  client:          The client used to make the calls
+    :param  string        company:         The code of the company
+    :param  iterable      location_codes:  Codes of the locations to build
+    :param  list          tax_codes:       Tax codes included in every file
+    :param  string        directory:       Folder the files are written to, \
+        created if missing
+    :param  int           workers:         Maximum number of calls in flight
+    :param  string        response_type:   The format of the files \
+        (See PointOfSaleFileType::* for a list of allowable values)
+    :param  string        date:            The date to build the content for \
+        (default: today)
+    :param  file          report:          If given, a line with the time \
+        spent is written for each location, followed by the total time
+    :return: TaxContentRun
+    """
+    date = date or datetime.date.today().isoformat()
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    build = _builder(client, company, tax_codes, response_type, date)
+    files, timings, failures = {}, {}, {}
+    start = time.time()
+    for result in run_bulk(build, location_codes, workers):
+        code = result.item
+        timings[code] = result.elapsed
+        if result.ok:
+            path = tax_content_path(directory, code, date, response_type)
+            with open(path, 'wb') as f:
+                f.write(result.response.content)
+            files[code] = path
+        else:
+            failures[code] = result
+        if report:
+            report.write('{}: time elapsed: {}(s)\n'.format(code,
+                                                             result.elapsed))
+    elapsed = time.time() - start
+    if report:
+        report.write('Total Time: {}(s)\n'.format(elapsed))
+    return TaxContentRun(files, timings, failures, elapsed)
+
+
+def current_tax_content_dir(root):
+    """
+    Return the folder holding the tax content version in use, or None.
+
+    Readers should resolve this once and read every file from the returned
+    folder, it is never modified once published.
+
+    :param  string  root:  The root folder given to sync_tax_content
+    :return: string
+    """
+    try:
+        with open(os.path.join(root, CURRENT_FILE)) as f:
+            version = f.read().strip()
+    except (IOError, OSError):
+        return None
+    return os.path.join(root, 'versions', version)
+
+
+def read_manifest(root):
+    """
+    Return the manifest of the tax content version in use.
+
+    :param  string  root:  The root folder given to sync_tax_content
+    :return: dictionary, with `version` and the `locations` of the version
+    """
+    directory = current_tax_content_dir(root)
+    if directory is None:
+        return {'version': 0, 'locations': {}}
+    with open(os.path.join(directory, MANIFEST_FILE)) as f:
+        return json.load(f)
+
+
+def _publish(root, version):
+    """Atomically point readers to a new version."""
+    tmp = os.path.join(root, CURRENT_FILE + '.tmp')
+    with open(tmp, 'w') as f:
+        f.write(str(version))
+    getattr(os, 'replace', os.rename)(tmp, os.path.join(root, CURRENT_FILE))
+
+
+def _reuse(src, dst):
+    """Hard link an unchanged file into the new version, copy if we can't."""
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+
+
+def sync_tax_content(client, company, location_codes, tax_codes=None,
+                     root='taxfiles', workers=8, response_type='Json',
+                     date=None, keep=2):
+    r"""
+    Refresh tax content files, only rewriting the ones that changed.
+
+    Each sync builds the content of every location and compares its SHA-256
+    fingerprint with the manifest of the version in use. When something
+    changed, a new version folder is assembled: changed files are written,
+    unchanged files are hard linked from the previous version, then the
+    CURRENT file is atomically replaced to publish it. Locations that
+    failed keep their previous content.
+
+    :param  AvataxClient  client:          The client used to make the calls
+    :param  string        company:         The code of the company
+    :param  iterable      location_codes:  Codes of the locations to build
+    :param  list          tax_codes:       Tax codes included in every file
+    :param  string        root:            Folder holding the versions
+    :param  int           workers:         Maximum number of calls in flight
+    :param  string        response_type:   The format of the files
+    :param  string        date:            The date to build the content for \
+        (default: today)
+    :param  int           keep:            Number of versions kept on disk, \
+        the published one included
+    :return: TaxContentSync
+    """
+    if keep < 1:
+        # pruning would delete the version just published
+        raise ValueError('keep must be at least 1')
+    start = time.time()
+    date = date or datetime.date.today().isoformat()
+    previous = read_manifest(root)
+    old_dir = current_tax_content_dir(root)
+    version = previous['version'] + 1
+    new_dir = os.path.join(root, 'versions', str(version))
+    if os.path.isdir(new_dir):
+        # left over by an interrupted sync, never published
+        shutil.rmtree(new_dir)
+    os.makedirs(new_dir)
+
+    build = _builder(client, company, tax_codes, response_type, date)
+    locations, changed, unchanged, failures = {}, [], [], {}
+    for result in run_bulk(build, location_codes, workers):
+        code = result.item
+        old = previous['locations'].get(code)
+        if not result.ok:
+            failures[code] = result
+            if old:
+                _reuse(os.path.join(old_dir, old['file']),
+                       os.path.join(new_dir, old['file']))
+                locations[code] = old
+            continue
+        content = result.response.content
+        digest = hashlib.sha256(content).hexdigest()
+        if old and old['sha256'] == digest:
+            _reuse(os.path.join(old_dir, old['file']),
+                   os.path.join(new_dir, old['file']))
+            locations[code] = old
+            unchanged.append(code)
+            continue
+        name = os.path.basename(
+            tax_content_path('', code, date, response_type))
+        with open(os.path.join(new_dir, name), 'wb') as f:
+            f.write(content)
+        locations[code] = {'file': name, 'sha256': digest, 'version': version,
+                           'date': date}
+        changed.append(code)
+
+    if not changed and set(locations) == set(previous['locations']):
+        shutil.rmtree(new_dir)
+        return TaxContentSync(previous['version'], changed, unchanged,
+                              failures, time.time() - start)
+    with open(os.path.join(new_dir, MANIFEST_FILE), 'w') as f:
+        json.dump({'version': version, 'company': company,
+                   'locations': locations}, f, indent=2, sort_keys=True)
+    _publish(root, version)
+    for old_version in range(version - keep, 0, -1):
+        old_path = os.path.join(root, 'versions', str(old_version))
+        if not os.path.isdir(old_path):
+            break
+        shutil.rmtree(old_path)
+    return TaxContentSync(version, changed, unchanged, failures,
+                          time.time() - start)
@@ -0,0 +1,353 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Export the transaction history of a company to Parquet or Arrow files,
+one columnar batch at a time
+
+Writing files requires pyarrow: pip install Avalara[arrow]
+"""
+from collections import namedtuple
+from _bulk import iter_records_by_id
+from _str_version import str_type
+import json
+import os
+import time
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma no cover
+    pyarrow = None
+
+
+# Nested lists exported as their own table, the lines of a transaction and
+# the details of a line. Other nested values are exported as JSON strings.
+EXPLODED = ('lines', 'details')
+
+# Outcome of export_transactions
+#   rows     table name -> number of rows written
+#   files    table name -> path of the file written
+#   elapsed  seconds spent on the whole export
+ExportReport = namedtuple('ExportReport', 'rows files elapsed')
+
+
+def iter_transactions(client, company_code, include=None, page_size=1000):
+    r"""
+    Yield every transaction of a company, page by page.
+
+    Pages follow ascending ids, transactions created or deleted during the
+    export do not shift them.
+
+    :param  AvataxClient  client:        The client used to make the calls
+    :param  string        company_code:  The code of the company
+    :param  dictionary    include:       Query parameters, e.g. \
+        {'$include': 'Lines,Details', '$filter': "date ge '2018-01-01'"}
+    :param  int           page_size:     Number of transactions per call
+    :return: generator of dictionary
+    """
+    return iter_records_by_id(
+        lambda params: client.list_transactions_by_company(company_code,
+                                                           params),
+        include, page_size)
+
+
+def _scalars(obj, **extra):
+    """Return the fields of an object, nested values encoded as JSON."""
+    row = {}
+    for key, value in obj.items():
+        if key in EXPLODED:
+            continue
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, sort_keys=True)
+        row[key] = value
+    row.update(extra)
+    return row
+
+
+def flatten(transactions):
+    """
+    Split transactions into rows of transactions, lines and details tables.
+
+    Line rows carry the transactionId, detail rows the transactionId and
+    transactionLineId, so the tables can be joined back.
+
+    :param  iterable  transactions:  TransactionModel dictionaries
+    :return: generator of (table name, row)
+    """
+    for trans in transactions:
+        yield 'transactions', _scalars(trans)
+        for line in trans.get('lines') or []:
+            yield 'lines', _scalars(line, transactionId=trans.get('id'))
+            for detail in line.get('details') or []:
+                yield 'details', _scalars(
+                    detail, transactionId=trans.get('id'),
+                    transactionLineId=line.get('id'))
+
+
+def iter_column_batches(rows, batch_size=10000):
+    """
+    Group rows into columnar batches, one table at a time.
+
+    :param  iterable  rows:        (table name, row) as yielded by flatten
+    :param  int       batch_size:  Number of rows per batch
+    :return: generator of (table name, dictionary of column -> values)
+    """
+    pending = {}
+    for table, row in rows:
+        batch = pending.setdefault(table, [])
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield table, _columns(batch)
+            pending[table] = []
+    for table, batch in pending.items():
+        if batch:
+            yield table, _columns(batch)
+
+
+def _columns(rows):
+    """Return a list of rows as a dictionary of column -> values."""
+    names = []
+    seen = set()
+    for row in rows:
+        for name in row:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+    return dict((name, [row.get(name) for row in rows]) for name in names)
+
+
+def _arrow_type(name, values):
+    """Pick the Arrow type of a column from a batch of its values."""
+    kinds = set(type(v) for v in values if v is not None)
+    if not kinds:
+        return pyarrow.null()
+    if kinds == set([bool]):
+        return pyarrow.bool_()
+    if all(issubclass(k, (int, float)) and k is not bool for k in kinds):
+        # amounts come back as 100 or 100.5, ids are always integers
+        if kinds == set([int]) and (name == 'id' or name.endswith('Id')):
+            return pyarrow.int64()
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _merge_type(current, other):
+    """Return the narrowest type holding the values of both types."""
+    if current == other or other == pyarrow.null():
+        return current
+    if current == pyarrow.null():
+        return other
+    numbers = (pyarrow.int64(), pyarrow.float64())
+    if current in numbers and other in numbers:
+        return pyarrow.float64()
+    return pyarrow.string()
+
+
+def _coerce(value, type_, name):
+    """Return a value as a type, raise ValueError if it does not fit."""
+    if value is None:
+        return None
+    number = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if type_ == pyarrow.string():
+        # a column mixing types, keep the JSON spelling of the others
+        return value if isinstance(value, str_type) else json.dumps(value)
+    if type_ == pyarrow.float64() and number:
+        return float(value)
+    if type_ == pyarrow.int64() and number and value == int(value):
+        return int(value)
+    if type_ == pyarrow.bool_() and isinstance(value, bool):
+        return value
+    raise ValueError('Column {} can not hold {!r} as {}'.format(
+        name, value, type_))
+
+
+class _TableWriter(object):
+    """
+    Write the batches of one table.
+
+    Batches are written to a segment file as long as they fit its schema.
+    A batch bringing a new column, or values the column type can not hold,
+    starts a segment with the widened schema. On close, the segments are
+    rewritten into one file with the schema of the last one.
+    """
+
+    def __init__(self, path, format):
+        self.path = path
+        self.format = format
+        self.schema = None
+        self.rows = 0
+        self._segments = []
+        self._writer = None
+        self._sink = None
+
+    def _open(self, path, schema):
+        if self.format == 'parquet':
+            self._writer = pyarrow.parquet.ParquetWriter(path, schema)
+        else:
+            self._sink = pyarrow.OSFile(path, 'wb')
+            self._writer = pyarrow.ipc.new_file(self._sink, schema)
+
+    def _close_writer(self):
+        if self._writer is not None:
+            self._writer.close()
+            if self._sink is not None:
+                self._sink.close()
+        self._writer = self._sink = None
+
+    def _write_batch(self, batch):
+        if self.format == 'parquet':
+            self._writer.write_table(pyarrow.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def _widened(self, columns):
+        """Return the schema holding the current segment and a batch."""
+        fields = [(f.name, f.type) for f in self.schema or []]
+        known = dict(fields)
+        for name, values in sorted(columns.items()):
+            type_ = _arrow_type(name, values)
+            if name in known:
+                known[name] = _merge_type(known[name], type_)
+            else:
+                fields.append((name, type_))
+                known[name] = type_
+        return pyarrow.schema([(name, known[name]) for name, _ in fields])
+
+    def write(self, columns):
+        schema = self._widened(columns)
+        if self.schema is None or not schema.equals(self.schema):
+            self._close_writer()
+            self.schema = schema
+            self._segments.append('{}.{}.tmp'.format(self.path,
+                                                     len(self._segments)))
+            self._open(self._segments[-1], schema)
+        count = len(next(iter(columns.values())))
+        arrays = []
+        for field in self.schema:
+            values = columns.get(field.name, [None] * count)
+            arrays.append(pyarrow.array(
+                [_coerce(v, field.type, field.name) for v in values],
+                field.type))
+        self._write_batch(pyarrow.RecordBatch.from_arrays(
+            arrays, schema=self.schema))
+        self.rows += count
+
+    def _read_segment(self, path):
+        if self.format == 'parquet':
+            for batch in pyarrow.parquet.ParquetFile(path).iter_batches():
+                yield batch
+        else:
+            with pyarrow.OSFile(path) as f:
+                reader = pyarrow.ipc.open_file(f)
+                for i in range(reader.num_record_batches):
+                    yield reader.get_batch(i)
+
+    def _conform(self, batch):
+        """Return a batch of an earlier segment with the final schema."""
+        arrays = []
+        for field in self.schema:
+            if field.name in batch.schema.names:
+                column = batch.column(batch.schema.get_field_index(
+                    field.name))
+                if column.type != field.type:
+                    column = column.cast(field.type)
+            else:
+                column = pyarrow.nulls(batch.num_rows, field.type)
+            arrays.append(column)
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def close(self):
+        """Publish the table at path, from its segments."""
+        self._close_writer()
+        if len(self._segments) == 1:
+            getattr(os, 'replace', os.rename)(self._segments[0], self.path)
+        elif self._segments:
+            self._open(self.path, self.schema)
+            try:
+                for segment in self._segments:
+                    for batch in self._read_segment(segment):
+                        self._write_batch(self._conform(batch))
+            except Exception:
+                self._close_writer()
+                os.remove(self.path)
+                raise
+            finally:
+                self._close_writer()
+                for segment in self._segments:
+                    os.remove(segment)
+        self._segments = []
+
+    def discard(self):
+        """Remove the segments written, nothing is published."""
+        self._close_writer()
+        for segment in self._segments:
+            if os.path.exists(segment):
+                os.remove(segment)
+        self._segments = []
+
+
+def export_transactions(client, company_code, directory, include=None,
+                        format='parquet', batch_size=10000, page_size=1000):
+    r"""
+    Write the transactions of a company to columnar files.
+
+    Transactions are fetched page by page and written in batches of
+    batch_size rows, so memory stays bounded whatever the history size.
+    A transactions file is always written, lines and details files are
+    written when they are requested through `$include`. Other nested
+    values, e.g. addresses or summary, are written as JSON strings. A column
+    appearing in a later batch is added to its file, a column whose values
+    change type is widened to float or string. Files are only written once
+    every transaction was fetched, an export that fails writes none.
+
+    :param  AvataxClient  client:        The client used to make the calls
+    :param  string        company_code:  The code of the company
+    :param  string        directory:     Folder the files are written to
+    :param  dictionary    include:       Query parameters, e.g. \
+        {'$include': 'Lines,Details', '$filter': "date ge '2018-01-01'"}
+    :param  string        format:        parquet or arrow
+    :param  int           batch_size:    Number of rows per columnar batch
+    :param  int           page_size:     Number of transactions per call
+    :return: ExportReport
+    """
+    if pyarrow is None:
+        raise ImportError('Exporting transactions requires pyarrow, '
+                          'pip install Avalara[arrow]')
+    if format not in ('parquet', 'arrow'):
+        raise ValueError('format must be parquet or arrow')
+    start = time.time()
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    writers = {}
+    try:
+        rows = flatten(iter_transactions(client, company_code, include,
+                                         page_size))
+        for table, columns in iter_column_batches(rows, batch_size):
+            if table not in writers:
+                writers[table] = _TableWriter(os.path.join(
+                    directory, '{}.{}'.format(table, format)), format)
+            writers[table].write(columns)
+    except Exception:
+        # a truncated history must not look like a complete export
+        for writer in writers.values():
+            writer.discard()
+        raise
+    for writer in writers.values():
+        writer.close()
+    return ExportReport(dict((t, w.rows) for t, w in writers.items()),
+                        dict((t, w.path) for t, w in writers.items()),
+                        time.time() - start)
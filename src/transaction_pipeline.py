@@ -0,0 +1,103 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+TransactionPipeline commits, voids, settles or locks many transactions
+identified by (companyCode, transactionCode) pairs
+"""
+from _bulk import run_bulk
+
+
+class TransactionPipeline(object):
+    """Class for bulk operations on existing transactions."""
+
+    def __init__(self, client, workers=8, rate=None):
+        """
+        Initialize the pipeline.
+
+        :param  AvataxClient  client:   The client used to make the calls
+        :param  int           workers:  Maximum number of calls in flight
+        :param  int/float     rate:     Maximum number of calls per second
+        """
+        self.client = client
+        self.workers = workers
+        self.rate = rate
+
+    def run(self, method, pairs, model, include=None):
+        r"""
+        Call a transaction method for every pair.
+
+        Results are yielded as soon as each call completes, the item of a
+        result is its (companyCode, transactionCode) pair.
+
+        :param  string      method:   Name of the client method, e.g.
+            commit_transaction
+        :param  iterable    pairs:    (companyCode, transactionCode) pairs
+        :param  dictionary  model:    The request model sent for every pair
+        :param  dictionary  include:  Query parameters sent for every pair, \
+            e.g. {'documentType': 'PurchaseInvoice'}
+        :return: generator of BulkResult
+        """
+        call = getattr(self.client, method)
+        return run_bulk(lambda pair: call(pair[0], pair[1], model, include),
+                        pairs, self.workers, self.rate)
+
+    def commit(self, pairs, include=None):
+        """
+        Commit every transaction for reporting.
+
+        :param  iterable    pairs:    (companyCode, transactionCode) pairs
+        :param  dictionary  include:  Query parameters sent for every pair
+        :return: generator of BulkResult
+        """
+        return self.run('commit_transaction', pairs, {'commit': True}, include)
+
+    def void(self, pairs, code='DocVoided', include=None):
+        r"""
+        Void every transaction.
+
+        :param  iterable    pairs:    (companyCode, transactionCode) pairs
+        :param  string      code:     Reason of the void \
+            (See VoidReasonCode::* for a list of allowable values)
+        :param  dictionary  include:  Query parameters sent for every pair
+        :return: generator of BulkResult
+        """
+        return self.run('void_transaction', pairs, {'code': code}, include)
+
+    def settle(self, pairs, model, include=None):
+        """
+        Settle every transaction with the same SettleTransactionModel.
+
+        :param  iterable    pairs:    (companyCode, transactionCode) pairs
+        :param  dictionary  model:    The SettleTransactionModel
+        :param  dictionary  include:  Query parameters sent for every pair
+        :return: generator of BulkResult
+        """
+        return self.run('settle_transaction', pairs, model, include)
+
+    def lock(self, pairs, is_locked=True, include=None):
+        """
+        Lock, or unlock, every transaction.
+
+        bulk_lock_transaction works on document ids, this locks by code.
+
+        :param  iterable    pairs:      (companyCode, transactionCode) pairs
+        :param  boolean     is_locked:  False to unlock the transactions
+        :param  dictionary  include:    Query parameters sent for every pair
+        :return: generator of BulkResult
+        """
+        return self.run('lock_transaction', pairs, {'isLocked': is_locked},
+                        include)
@@ -0,0 +1,429 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+Transports carry the calls of AvataxClient, pick one at construction
+
+    AvataxClient('app', '1.0', 'host', 'sandbox', transport='urllib3')
+
+Whatever the transport, calls return requests Response objects, so code
+using the client does not change. The httpx and http2 transports require
+httpx and h2: pip install Avalara[httpx]
+"""
+from requests import Request, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from _str_version import str_type
+import _fork
+import datetime
+import threading
+import time
+import urllib3
+import warnings
+try:
+    from http.cookiejar import DefaultCookiePolicy
+except ImportError:  # pragma no cover
+    from cookielib import DefaultCookiePolicy
+try:
+    import asyncio
+    import httpx
+except ImportError:  # pragma no cover
+    httpx = None
+
+
+class Transport(object):
+    """
+    Base class of the transports.
+
+    A transport prepares each call like requests would, then sends it with
+    send. Test doubles can subclass it and only implement send.
+    """
+
+    def request(self, method, url, params=None, json=None, files=None,
+                headers=None, auth=None, timeout=None, stream=False):
+        """
+        Make a call.
+
+        :param  string      method:   The HTTP method
+        :param  string      url:      The full url of the endpoint
+        :param  dictionary  params:   The query parameters
+        :param  dictionary  json:     The body, encoded as JSON
+        :param  dictionary  files:    Files sent as multipart/form-data
+        :param  dictionary  headers:  The request headers
+        :param  object      auth:     requests authentication, e.g.
+            HTTPBasicAuth
+        :param  int/float   timeout:  Seconds to wait for the server
+        :param  boolean     stream:   Leave the body unread until consumed
+        :return: Response object
+
+        A 401 answer is retried once if auth asks for it, through its
+        handle_401 method, see oauth.TokenAuth. Uploads are not retried.
+        """
+        _fork.check()
+        kwargs = dict(params=params, json=json, files=files, headers=headers,
+                      auth=auth, timeout=timeout, stream=stream)
+        response = self._request(method, url, **kwargs)
+        if response.status_code == 401 and files is None and \
+                hasattr(auth, 'handle_401') and auth.handle_401(response):
+            response.close()
+            response = self._request(method, url, **kwargs)
+        return response
+
+    def _request(self, method, url, auth=None, timeout=None, stream=False,
+                 **kwargs):
+        prepared = Request(method, url, auth=auth, **kwargs).prepare()
+        return self.send(prepared, timeout, stream)
+
+    def send(self, prepared, timeout=None, stream=False):
+        """
+        Send a prepared call.
+
+        :param  PreparedRequest  prepared:  The call, with its final url,
+            headers and body
+        :param  int/float        timeout:   Seconds to wait for the server
+        :param  boolean          stream:    Leave the body unread
+        :return: Response object
+        """
+        raise NotImplementedError
+
+    def get(self, url, **kwargs):
+        """Make a GET call."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Make a POST call."""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        """Make a PUT call."""
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        """Make a DELETE call."""
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        """Close the connections kept alive."""
+
+    def after_fork(self):
+        """
+        Forget the connections and locks inherited from the parent process.
+
+        Called in a forked child before its first call. The inherited
+        sockets are dropped, not closed, closing them would end the
+        connections of the parent as well.
+        """
+
+
+class RequestsTransport(Transport):
+    """Transport calling through a requests Session, the default."""
+
+    def __init__(self, session=None, pool_maxsize=None):
+        """
+        Initialize the transport.
+
+        The session is shared by every thread using the client. Cookies are
+        refused, given session included, AvaTax authenticates each call and
+        a cookie jar would only be state the threads race on.
+
+        :param  Session  session:       The session used, adapters can be
+            mounted on it (default: a new session)
+        :param  int      pool_maxsize:  Connections kept alive per host, one
+            per thread sharing the client (default: 10), only for a session
+            created here, mount an HTTPAdapter on a given one instead
+        """
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize or 10)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        elif pool_maxsize is not None:
+            raise ValueError('pool_maxsize does not apply to a given session, '
+                             'mount an HTTPAdapter(pool_maxsize=...) on it')
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.session = session
+
+    def _request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def send(self, prepared, timeout=None, stream=False):
+        """Send a prepared call with the session."""
+        return self.session.send(prepared, timeout=timeout, stream=stream)
+
+    def close(self):
+        """Close the session."""
+        self.session.close()
+
+    def after_fork(self):
+        """Give each mounted adapter new connection pools."""
+        reset_session(self.session)
+
+
+def reset_session(session):
+    """
+    Give the adapters of a session new connection pools, after a fork.
+
+    Other adapters than HTTPAdapters are reset by their own after_fork
+    method. Those without one are left as is with a RuntimeWarning, they
+    may share their sockets with the parent process.
+
+    :param  Session  session:  A session inherited from the parent process
+    """
+    seen = set()
+    for prefix, adapter in session.adapters.items():
+        # one adapter is usually mounted on both http:// and https://
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        if isinstance(adapter, HTTPAdapter):
+            adapter.init_poolmanager(adapter._pool_connections,
+                                     adapter._pool_maxsize,
+                                     adapter._pool_block)
+            adapter.proxy_manager = {}
+        elif hasattr(adapter, 'after_fork'):
+            adapter.after_fork()
+        else:
+            warnings.warn('The %s mounted on %s is not reset after the fork, '
+                          'give it an after_fork method'
+                          % (type(adapter).__name__, prefix), RuntimeWarning)
+    # a parent thread may have held it while the process forked
+    session.cookies._cookies_lock = threading.RLock()
+
+
+class Urllib3Transport(Transport):
+    """Transport calling through a urllib3 connection pool."""
+
+    def __init__(self, maxsize=10, pool_manager=None):
+        """
+        Initialize the transport.
+
+        :param  int          maxsize:       Connections kept alive per host
+        :param  PoolManager  pool_manager:  The pool used (default: a new
+            one)
+        """
+        self.pool = pool_manager or urllib3.PoolManager(maxsize=maxsize,
+                                                        block=False)
+        # builds requests Response objects around urllib3 responses
+        self._adapter = HTTPAdapter()
+
+    def send(self, prepared, timeout=None, stream=False):
+        """Send a prepared call through the pool."""
+        start = time.time()
+        try:
+            raw = self.pool.urlopen(
+                prepared.method, prepared.url, body=prepared.body,
+                headers=dict(prepared.headers), retries=False,
+                redirect=False, preload_content=False, decode_content=False,
+                timeout=urllib3.Timeout(connect=timeout, read=timeout))
+        except urllib3.exceptions.NewConnectionError as e:
+            # a subclass of ConnectTimeoutError, but nothing timed out
+            raise ConnectionError(e, request=prepared)
+        except urllib3.exceptions.TimeoutError as e:
+            raise Timeout(e, request=prepared)
+        except urllib3.exceptions.HTTPError as e:
+            raise ConnectionError(e, request=prepared)
+        response = self._adapter.build_response(prepared, raw)
+        response.elapsed = datetime.timedelta(seconds=time.time() - start)
+        if not stream:
+            # read the body now and give the connection back to the pool
+            response.content
+        return response
+
+    def close(self):
+        """Close every pooled connection."""
+        self.pool.clear()
+
+    def after_fork(self):
+        """Replace the pool by an empty one with the same options."""
+        self.pool = urllib3.PoolManager(headers=self.pool.headers,
+                                        **self.pool.connection_pool_kw)
+
+
+class _HttpxRaw(object):
+    """The body of an httpx response, as requests reads a raw body."""
+
+    def __init__(self, response, loop=None):
+        self._response = response
+        # the event loop reading the response of an httpx.AsyncClient
+        self._loop = loop
+
+    def _await(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def stream(self, chunk_size, decode_content=True):
+        if self._loop is None:
+            for chunk in self._response.iter_bytes(chunk_size):
+                yield chunk
+            return
+        chunks = self._response.aiter_bytes(chunk_size)
+        while True:
+            try:
+                yield self._await(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+
+    def read(self, amt=None):
+        if self._loop is None:
+            return self._response.read()
+        return self._await(self._response.aread())
+
+    def close(self):
+        if self._loop is None:
+            self._response.close()
+        else:
+            self._await(self._response.aclose())
+
+    release_conn = close
+
+
+class HttpxTransport(Transport):
+    """Transport calling through an httpx client, over HTTP/1.1 or HTTP/2."""
+
+    def __init__(self, http2=False, max_connections=100, client=None,
+                 http1=True):
+        """
+        Initialize the transport.
+
+        With http2, concurrent calls to a host share one connection, up to
+        100 calls in flight per connection. HTTP/2 is negotiated over https,
+        give http1=False as well to talk it to a plain http server, e.g.
+        MockAvataxServer(http2=True).
+
+        The HTTP/2 connections of a sync httpx client are not safe to share
+        between threads, so with http2 the calls are made by an
+        httpx.AsyncClient, on an event loop thread owned by the transport.
+        An AsyncClient given is used the same way.
+
+        :param  boolean  http2:            Negotiate HTTP/2 with the server
+        :param  int      max_connections:  Connections open at most
+        :param  Client   client:           The httpx Client or AsyncClient
+            used (default: a new one, rebuilt in forked processes, a client
+            given cannot be used by a forked child)
+        :param  boolean  http1:            Allow HTTP/1.1
+        """
+        if httpx is None:
+            raise ImportError('The httpx transport requires httpx, '
+                              'pip install Avalara[httpx]')
+        self._options = None if client else dict(
+            http1=http1, http2=http2,
+            limits=httpx.Limits(max_connections=max_connections))
+        self._loop = None
+        self._start(client)
+        # set in a forked child when the client given shares its sockets
+        # with the parent process
+        self._inherited = False
+
+    def _start(self, client=None):
+        if client is None:
+            client = (httpx.AsyncClient if self._options['http2']
+                      else httpx.Client)(**self._options)
+        self.client = client
+        if isinstance(client, httpx.AsyncClient):
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _call(self, method, *args, **kwargs):
+        # runs a client method, on the event loop for an AsyncClient
+        if self._loop is None:
+            return method(*args, **kwargs)
+        if not self._thread.is_alive():
+            raise RuntimeError('The HttpxTransport is closed')
+        return asyncio.run_coroutine_threadsafe(method(*args, **kwargs),
+                                                self._loop).result()
+
+    def send(self, prepared, timeout=None, stream=False):
+        """Send a prepared call with the httpx client."""
+        if self._inherited:
+            raise RuntimeError('The httpx client given to HttpxTransport '
+                               'belongs to the parent process, create the '
+                               'transport in the forked child instead')
+        start = time.time()
+        request = self.client.build_request(
+            prepared.method, prepared.url, headers=dict(prepared.headers),
+            content=prepared.body, timeout=timeout)
+        try:
+            sent = self._call(self.client.send, request, stream=True)
+        except httpx.TimeoutException as e:
+            raise Timeout(e, request=prepared)
+        except httpx.TransportError as e:
+            raise ConnectionError(e, request=prepared)
+        response = Response()
+        response.status_code = sent.status_code
+        response.reason = sent.reason_phrase
+        response.headers = CaseInsensitiveDict(sent.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = prepared.url
+        response.request = prepared
+        response.raw = _HttpxRaw(sent, self._loop)
+        response.elapsed = datetime.timedelta(seconds=time.time() - start)
+        if not stream:
+            try:
+                response._content = response.raw.read()
+            finally:
+                response.raw.close()
+            response._content_consumed = True
+        return response
+
+    def close(self):
+        """Close the httpx client, and stop its event loop."""
+        if self._loop is None:
+            self.client.close()
+        elif self._thread.is_alive():
+            self._call(self.client.aclose)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def after_fork(self):
+        """Build a new httpx client, a client given can no longer be used."""
+        if self._options is None:
+            self._inherited = True
+        else:
+            # the event loop thread did not survive the fork
+            self._start()
+
+
+# transport name -> function building it
+TRANSPORTS = {
+    'requests': RequestsTransport,
+    'urllib3': Urllib3Transport,
+    'httpx': HttpxTransport,
+    # HTTP/2 only, negotiated over https, with prior knowledge over http
+    'http2': lambda: HttpxTransport(http2=True, http1=False),
+}
+
+
+def make_transport(transport=None):
+    """
+    Return a transport from its name, or the transport given.
+
+    :param  string/Transport  transport:  requests, urllib3, httpx, http2, a
+        Transport object, or None for requests
+    :return: Transport
+    """
+    if transport is None:
+        return RequestsTransport()
+    if isinstance(transport, str_type):
+        if transport not in TRANSPORTS:
+            raise ValueError('transport must be one of {}'.format(
+                ', '.join(sorted(TRANSPORTS))))
+        return TRANSPORTS[transport]()
+    return transport
@@ -0,0 +1,125 @@
+"""
+AvaTax Software Development Kit for Python.
+
+(c) 2004-2017 Avalara, Inc.
+
+For the full copyright and license information, please view the LICENSE
+file that was distributed with this source code.
+
+@author     Robert Bronson
+@author     Phil Werner
+@author     Adrienne Karnoski
+@author     Han Bao
+@copyright  2004-2017 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@version    TBD
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+ConnectionWarmer opens the pooled connections of a client before the first
+real call needs them, and keeps them from going idle
+
+    client.warm_up(connections=8, keep_alive=30)
+"""
+from _bulk import run_bulk
+from collections import namedtuple
+import threading
+import time
+
+
+# Outcome of a round of pings
+#   ok       pings answered, each on a connection now in the pool
+#   errors   pings that raised or were refused
+#   elapsed  seconds taken by the round
+WarmUpResult = namedtuple('WarmUpResult', 'ok errors elapsed')
+
+
+class ConnectionWarmer(object):
+    """Class for pings run in the background on behalf of a client."""
+
+    def __init__(self, client, connections=4, keep_alive=None):
+        """
+        Initialize the warmer, nothing runs before start.
+
+        Each round makes connections concurrent pings, so as many pooled
+        connections are opened, or validated if already open. Give the
+        transport a pool of at least that size, extra connections are
+        closed once answered.
+
+        :param  AvataxClient  client:       The client warmed up
+        :param  int           connections:  Concurrent pings per round
+        :param  int/float     keep_alive:   Seconds between rounds after the
+            first one, None stops after it
+        """
+        if connections < 1:
+            raise ValueError('connections must be at least 1')
+        if keep_alive is not None and keep_alive <= 0:
+            raise ValueError('keep_alive must be positive')
+        self.client = client
+        self.connections = connections
+        self.keep_alive = keep_alive
+        self.rounds = 0
+        # WarmUpResult of the latest round
+        self.last = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def round(self):
+        """
+        Make a round of concurrent pings.
+
+        :return: WarmUpResult
+        """
+        ok = errors = 0
+        start = time.time()
+        for result in run_bulk(lambda n: self.client.ping(),
+                               range(self.connections), self.connections):
+            if result.ok:
+                ok += 1
+            else:
+                errors += 1
+        self.last = WarmUpResult(ok, errors, time.time() - start)
+        self.rounds += 1
+        return self.last
+
+    def _run(self):
+        try:
+            self.round()
+        finally:
+            self._ready.set()
+        while self.keep_alive and not self._stopped.wait(self.keep_alive):
+            self.round()
+
+    def start(self):
+        """Run the rounds in a daemon thread, return the warmer."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError('The warmer is already running')
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='avatax-warm-up')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def wait(self, timeout=None):
+        """
+        Block until the first round completed.
+
+        :param  int/float  timeout:  Seconds to wait at most
+        :return: WarmUpResult of the latest round, None on timeout
+        """
+        self._ready.wait(timeout)
+        return self.last
+
+    def stop(self):
+        """Stop the keep-alive rounds, the round in progress completes."""
+        self._stopped.set()
+
+    def after_fork(self):
+        """Warm up the new connection pool of a forked process."""
+        running = self._thread is not None and not self._stopped.is_set()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        if running:
+            self.start()
@@ -1,6 +1,9 @@
 """Conftest is a file recognize by pytest module, allowing us to share fixture across multiple tests."""
 from client import AvataxClient
 from transaction_builder import TransactionBuilder
+from mock_server import MockAvataxServer
+from requests import Response
+import json
 import os
 import pytest
 
@@ -147,6 +150,34 @@ def init_comp_model():
         "phoneNumber": "714 555-2121",
         "mobileNumber": "714 555-1212"}
 
+@pytest.fixture
+def fake_response():
+    """Return a factory building offline requests Response objects."""
+    def _make(status_code=200, body=None):
+        r = Response()
+        r.status_code = status_code
+        if isinstance(body, bytes):
+            r._content = body
+        else:
+            r._content = json.dumps(body if body is not None else {}).encode('utf-8')
+        r._content_consumed = True
+        return r
+    return _make
+
+@pytest.fixture(scope='session')
+def mock_server():
+    """Start a local stand-in for the AvaTax API, shared by the session."""
+    with MockAvataxServer() as server:
+        yield server
+
+
+@pytest.fixture(scope='function')
+def local_client(mock_server):
+    """Create an AvataxClient calling the local stand-in server."""
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          mock_server.url)
+    return client.add_credentials('test', 'test')
+
 def cred_determine():
     """Return the appropriate pair of cred."""
     if os.environ.get('USERNAME') and os.environ.get('PASSWORD'):
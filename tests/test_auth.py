@@ -1,7 +1,11 @@
 """Test the add_credential method."""
 import pytest
+import time
+from multiprocessing.pool import ThreadPool
 from requests.auth import HTTPBasicAuth
 from client import AvataxClient
+from oauth import ClientCredentialsProvider, Token, TokenAuth, TokenProvider
+from transport import Transport
 
 
 def test_username_auth(unauth_client):
@@ -60,3 +64,140 @@ def test_if_valid_pair_sandbox_cred_in_place(auth_client):
     """Test if there is a pair of valid Avatax credentials stored in env."""
     assert auth_client is not None
 
+
+
+class CountingProvider(TokenProvider):
+    """Token provider numbering its tokens, slow to answer."""
+
+    def __init__(self, lifetime=3600, delay=0):
+        self.lifetime = lifetime
+        self.delay = delay
+        self.fetched = 0
+
+    def fetch(self):
+        time.sleep(self.delay)
+        self.fetched += 1
+        return Token('token-{}'.format(self.fetched),
+                     time.time() + self.lifetime)
+
+
+def test_token_provider_authenticates_calls(local_client):
+    """Test the token of the provider is sent as a bearer token."""
+    provider = CountingProvider()
+    local_client.add_token_provider(provider)
+    assert local_client.ping().json()['authenticated']
+    assert local_client.ping().request.headers['Authorization'] == \
+        'Bearer token-1'
+    assert provider.fetched == 1
+    local_client.auth.close()
+
+
+def test_concurrent_calls_fetch_a_single_token():
+    """Test an expired token is refreshed once, not by every thread."""
+    provider = CountingProvider(delay=0.05)
+    auth = TokenAuth(provider, background=False)
+    pool = ThreadPool(32)
+    tokens = pool.map(lambda n: auth.token, range(64))
+    pool.close()
+    assert set(tokens) == set([tokens[0]])
+    assert provider.fetched == 1
+
+
+def test_token_is_refreshed_before_it_expires():
+    """Test the background timer replaces the token ahead of its expiry."""
+    provider = CountingProvider(lifetime=0.5)
+    auth = TokenAuth(provider, refresh_margin=0.4)
+    first = auth.token
+    deadline = time.time() + 2
+    while provider.fetched < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    auth.close()
+    assert provider.fetched >= 2
+    assert auth.token is not first
+
+
+def test_token_is_refreshed_inline_within_the_margin():
+    """Test without background, a call near expiry fetches a new token."""
+    now = [1000.0]
+    tokens = []
+
+    def fetch():
+        tokens.append(Token('token-{}'.format(len(tokens)), now[0] + 3600))
+        return tokens[-1]
+    auth = TokenAuth(fetch, refresh_margin=60, background=False,
+                     clock=lambda: now[0])
+    first = auth.token
+    now[0] += 3539
+    assert auth.token is first
+    now[0] += 2
+    assert auth.token is not first
+    assert len(tokens) == 2 and auth.token is tokens[1]
+
+
+def test_refused_token_is_refreshed_and_call_retried_once(fake_response):
+    """Test a 401 fetches a new token and the call is made again once."""
+    accepted = ['token-2']
+    sent = []
+
+    class Identity(Transport):
+        def send(self, prepared, timeout=None, stream=False):
+            sent.append(prepared.headers['Authorization'])
+            ok = prepared.headers['Authorization'] == 'Bearer ' + accepted[0]
+            r = fake_response(200 if ok else 401)
+            r.request = prepared
+            return r
+    provider = CountingProvider()
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          transport=Identity())
+    client.add_token_provider(provider, background=False)
+    assert client.ping().status_code == 200
+    assert sent == ['Bearer token-1', 'Bearer token-2']
+    accepted[0] = 'revoked'
+    assert client.ping().status_code == 401
+    assert len(sent) == 4
+    assert provider.fetched == 3
+
+
+def test_client_credentials_provider(fake_response):
+    """Test the client credentials grant is posted to the token endpoint."""
+    posted = []
+
+    class Session(object):
+        def post(self, url, data=None, auth=None, timeout=None):
+            posted.append((url, data, auth.username, auth.password))
+            return fake_response(200, {'access_token': 'abc',
+                                       'expires_in': 60})
+    provider = ClientCredentialsProvider('https://identity.example/token',
+                                         'id', 'secret', 'avatax',
+                                         session=Session(), clock=lambda: 100)
+    assert provider.fetch() == Token('abc', 160)
+    assert posted == [('https://identity.example/token',
+                       {'grant_type': 'client_credentials',
+                        'scope': 'avatax'}, 'id', 'secret')]
+
+
+def test_provider_session_is_rebuilt_after_fork(fake_response):
+    """Test a forked child does not refresh tokens on parent connections."""
+    provider = ClientCredentialsProvider('https://identity.example/token',
+                                         'id', 'secret')
+    adapter = provider.session.get_adapter('https://')
+    pool = adapter.poolmanager
+    auth = TokenAuth(provider, background=False)
+    auth.after_fork()
+    assert adapter.poolmanager is not pool
+
+
+def test_close_stops_the_refresh_timer(mock_server):
+    """Test closing the client cancels its background token refresh."""
+    with AvataxClient('test app', 'ver 0.0', 'test machine',
+                      mock_server.url) as client:
+        client.add_token_provider(CountingProvider())
+        assert client.ping().ok
+        timer = client.auth._timer
+        assert timer.is_alive()
+        warmer = client.warm_up(1, keep_alive=10)
+        hedger = client.enable_hedging()
+    timer.join(1)
+    assert not timer.is_alive()
+    assert warmer._stopped.is_set()
+    assert hedger._pool._shutdown
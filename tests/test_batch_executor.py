@@ -0,0 +1,107 @@
+"""Test the micro-batching create_transaction executor."""
+import pytest
+import threading
+from batch_executor import TransactionBatcher
+
+
+class RecordingClient(object):
+    """Stand in for AvataxClient, record every create_transaction call."""
+
+    def __init__(self, fake_response, error=None):
+        self.fake_response = fake_response
+        self.error = error
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def create_transaction(self, model, include=None):
+        with self.lock:
+            self.calls.append(model)
+        if self.error:
+            raise self.error
+        return self.fake_response(201, {'code': model.get('code')})
+
+
+def test_futures_resolve_to_responses(tax_document, fake_response):
+    """Test every submitted transaction gets its own response."""
+    client = RecordingClient(fake_response)
+    with TransactionBatcher(client, max_batch_size=4) as batcher:
+        futures = [batcher.submit(dict(tax_document, code=str(i)))
+                   for i in range(10)]
+        codes = [f.result().json()['code'] for f in futures]
+    assert codes == [str(i) for i in range(10)]
+    assert len(client.calls) == 10
+
+
+def test_requests_are_grouped_in_batches(tax_document, fake_response):
+    """Test queued requests are dispatched together up to max_batch_size."""
+    client = RecordingClient(fake_response)
+    batcher = TransactionBatcher(client, max_batch_size=5, linger=0.5)
+    futures = [batcher.submit(dict(tax_document, code=str(i)))
+               for i in range(10)]
+    batcher.close()
+    assert all(f.done() for f in futures)
+    assert batcher.batches == 2
+
+
+def test_identical_estimates_share_one_call(tax_document, fake_response):
+    """Test identical SalesOrders in one batch reach AvaTax once."""
+    client = RecordingClient(fake_response)
+    tax_document['type'] = 'SalesOrder'
+    batcher = TransactionBatcher(client, max_batch_size=8, linger=0.5)
+    futures = [batcher.submit(tax_document) for _ in range(3)]
+    batcher.close()
+    assert len(client.calls) == 1
+    assert futures[0].result() is futures[2].result()
+
+
+def test_invoices_are_never_merged(tax_document, fake_response):
+    """Test identical SalesInvoices are each created."""
+    client = RecordingClient(fake_response)
+    batcher = TransactionBatcher(client, max_batch_size=8, linger=0.5)
+    for _ in range(3):
+        batcher.submit(tax_document)
+    batcher.close()
+    assert len(client.calls) == 3
+
+
+def test_errors_are_set_on_the_future(tax_document, fake_response):
+    """Test a failing call raises from future.result()."""
+    client = RecordingClient(fake_response, error=IOError('down'))
+    with TransactionBatcher(client) as batcher:
+        future = batcher.submit(tax_document)
+        with pytest.raises(IOError):
+            future.result()
+
+
+def test_submit_after_close_raises(tax_document, fake_response):
+    """Test a closed batcher refuses new work."""
+    batcher = TransactionBatcher(RecordingClient(fake_response))
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(tax_document)
+
+
+def test_submit_racing_close_never_hangs(tax_document, fake_response):
+    """Test every accepted request resolves when close runs concurrently."""
+    for _ in range(20):
+        batcher = TransactionBatcher(RecordingClient(fake_response), linger=0)
+        accepted = []
+        start = threading.Event()
+
+        def submit():
+            start.wait()
+            for n in range(50):
+                try:
+                    accepted.append(batcher.submit(dict(tax_document,
+                                                        code=str(n))))
+                except RuntimeError:
+                    return
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        start.set()
+        batcher.close()
+        for t in threads:
+            t.join()
+        for future in accepted:
+            assert future.result(timeout=5).status_code == 201
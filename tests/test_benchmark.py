@@ -0,0 +1,44 @@
+"""Test the offline benchmark suite."""
+from benchmark import (SCENARIOS, compare_transports, format_results,
+                       format_transports, main, percentile, run_suite)
+import pytest
+
+
+def test_percentile_nearest_rank():
+    """Test the percentile picks the nearest ranked measurement."""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 99) == 0.0
+
+
+def test_every_scenario_succeeds(local_client):
+    """Test each scenario runs against the stand-in without errors."""
+    results = run_suite(local_client, requests=20, concurrency=4)
+    assert [r.name for r in results] == sorted(SCENARIOS)
+    for result in results:
+        assert result.errors == 0
+        assert len(result.latencies) == 20
+        assert result.throughput > 0
+        assert result.p50 <= result.p99
+    assert 'create_transaction' in format_results(results)
+
+
+def test_main_counts_injected_errors(capsys):
+    """Test the command line runs its own server and reports errors."""
+    results = main(['--requests', '10', '--scenario', 'ping',
+                    '--error-rate', '1'])
+    assert results[0].errors == 10
+    assert 'ping' in capsys.readouterr().out
+
+
+def test_compare_transports_counts_connections():
+    """Test HTTP/2 needs one connection where HTTP/1.1 opens several."""
+    pytest.importorskip('h2')
+    results = compare_transports(['requests', 'http2'], requests=40,
+                                 concurrency=20, latency=0.02)
+    by_name = dict((r.transport, r) for r in results)
+    assert by_name['http2'].connections == 1
+    assert by_name['requests'].connections > 1
+    assert all(r.result.errors == 0 for r in results)
+    assert 'conns' in format_transports(results)
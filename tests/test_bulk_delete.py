@@ -0,0 +1,70 @@
+"""Test the bulk delete helpers."""
+import pytest
+import re
+import threading
+from bulk_delete import bulk_delete
+
+
+class StoreClient(object):
+    """Stand in for AvataxClient, keep the locations of a company in memory."""
+
+    def __init__(self, fake_response, count):
+        self.fake_response = fake_response
+        self.locations = dict((i, {'id': i, 'locationCode': 'Location{}'.format(i)})
+                              for i in range(1, count + 1))
+        self.locations[1]['locationCode'] = 'DEFAULT'
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def list_locations_by_company(self, companyId, include=None):
+        self.pages.append(include)
+        last = re.search(r'id gt (\d+)', include.get('$filter', ''))
+        with self.lock:
+            ids = sorted(i for i in self.locations
+                         if not last or i > int(last.group(1)))
+            page = [self.locations[i] for i in ids[:include['$top']]]
+        return self.fake_response(200, {'value': page})
+
+    def delete_location(self, companyId, id_):
+        with self.lock:
+            self.locations.pop(id_)
+        return self.fake_response(200, [])
+
+
+def test_every_location_is_deleted_while_paging(fake_response):
+    """Test deleting during iteration does not skip any page."""
+    client = StoreClient(fake_response, 25)
+    results = list(bulk_delete(client, 1, 'locations', page_size=10))
+    assert len(results) == 25
+    assert client.locations == {}
+    assert len(client.pages) == 3
+
+
+def test_excluded_objects_are_kept(fake_response):
+    """Test the exclusion predicate keeps matching objects."""
+    client = StoreClient(fake_response, 5)
+    list(bulk_delete(client, 1, 'locations',
+                     exclude=lambda loc: loc['locationCode'] == 'DEFAULT'))
+    assert list(client.locations) == [1]
+
+
+def test_dry_run_deletes_nothing(fake_response):
+    """Test a dry run only lists what would be deleted."""
+    client = StoreClient(fake_response, 5)
+    results = list(bulk_delete(client, 1, 'locations', dry_run=True))
+    assert [r.item['id'] for r in results] == [1, 2, 3, 4, 5]
+    assert len(client.locations) == 5
+
+
+def test_user_filter_is_kept(fake_response):
+    """Test a $filter is combined with the paging condition."""
+    client = StoreClient(fake_response, 3)
+    list(bulk_delete(client, 1, 'locations', include={'$filter': "region eq 'WA'"},
+                     page_size=2))
+    assert client.pages[1]['$filter'] == "(region eq 'WA') and id gt 2"
+
+
+def test_unknown_resource_raises_value_error(fake_response):
+    """Test value error is raised for a resource that can't be deleted."""
+    with pytest.raises(ValueError):
+        bulk_delete(StoreClient(fake_response, 1), 1, 'companies')
@@ -0,0 +1,94 @@
+"""Test the catalog synchronization engine."""
+import pytest
+import re
+import threading
+from catalog_sync import CatalogSync
+
+
+class CatalogClient(object):
+    """Stand in for AvataxClient, keep the items of a company in memory."""
+
+    def __init__(self, fake_response, items):
+        self.fake_response = fake_response
+        self.items = dict((i, dict(item, id=i)) for i, item in enumerate(items, 1))
+        self.next_id = len(items) + 1
+        self.lock = threading.Lock()
+
+    def list_items_by_company(self, companyId, include=None):
+        last = re.search(r'id gt (\d+)', include.get('$filter', ''))
+        ids = sorted(i for i in self.items if not last or i > int(last.group(1)))
+        return self.fake_response(200, {'value': [self.items[i] for i in
+                                                  ids[:include['$top']]]})
+
+    def create_items(self, companyId, model):
+        if any(not item.get('taxCode') for item in model):
+            return self.fake_response(400)
+        created = []
+        with self.lock:
+            for item in model:
+                self.items[self.next_id] = dict(item, id=self.next_id)
+                created.append(self.items[self.next_id])
+                self.next_id += 1
+        return self.fake_response(201, created)
+
+    def update_item(self, companyId, id_, model):
+        with self.lock:
+            self.items[id_] = model
+        return self.fake_response(200, model)
+
+    def delete_item(self, companyId, id_):
+        with self.lock:
+            del self.items[id_]
+        return self.fake_response(200, [])
+
+
+def item(code, tax_code='P0000000', description='Yarn'):
+    """Return an item model."""
+    return {'itemCode': code, 'taxCode': tax_code, 'description': description}
+
+
+@pytest.fixture
+def client(fake_response):
+    """A company with three items."""
+    return CatalogClient(fake_response, [item('A'), item('B'), item('C')])
+
+
+def test_diff_finds_creates_updates_and_deletes(client):
+    """Test each kind of change is detected."""
+    sync = CatalogSync(client, 1, page_size=2)
+    diff = sync.diff([item('A'), item('B', description='Wool'), item('D')])
+    assert [i['itemCode'] for i in diff.creates] == ['D']
+    assert [(i, m['itemCode']) for i, m in diff.updates] == [(2, 'B')]
+    assert diff.deletes == [('C', 3)]
+    assert diff.unchanged == 1
+
+
+def test_sync_applies_changes(client):
+    """Test the remote catalog matches the local one after a sync."""
+    sync = CatalogSync(client, 1, batch_size=2)
+    local = [item('A'), item('B', description='Wool'), item('D'), item('E')]
+    report = sync.sync(local, delete=True)
+    assert (report.created, report.updated, report.deleted, report.unchanged) == (2, 1, 1, 1)
+    remote = sorted((i['itemCode'], i['description']) for i in client.items.values())
+    assert remote == [('A', 'Yarn'), ('B', 'Wool'), ('D', 'Yarn'), ('E', 'Yarn')]
+    assert sorted(report.timings) == ['apply', 'diff', 'index']
+
+
+def test_deletes_are_opt_in(client):
+    """Test remote objects missing locally are kept by default."""
+    report = CatalogSync(client, 1).sync([item('A')])
+    assert report.deleted == 0
+    assert len(client.items) == 3
+
+
+def test_failed_create_is_reported_per_object(client):
+    """Test a rejected object is reported by its key."""
+    report = CatalogSync(client, 1).sync([item('X', tax_code=None), item('Y')])
+    assert list(report.failures) == ['X']
+    assert report.created == 1
+
+
+def test_unknown_catalog_raises_value_error(client):
+    """Test value error is raised for a catalog that can't be synced."""
+    with pytest.raises(ValueError):
+        CatalogSync(client, 1, catalog='taxcodes')
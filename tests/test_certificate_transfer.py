@@ -0,0 +1,126 @@
+"""Test the bulk certificate image transfers."""
+import os
+import threading
+from certificate_transfer import CertificateTransfer
+
+
+class ImageClient(object):
+    """Stand in for AvataxClient, serve and receive certificate images."""
+
+    def __init__(self, fake_response, missing=()):
+        self.fake_response = fake_response
+        self.missing = set(missing)
+        self.downloads = []
+        self.uploads = {}
+        self.lock = threading.Lock()
+
+    def download_certificate_image(self, companyId, id_, include=None, stream=False):
+        with self.lock:
+            self.downloads.append(id_)
+        if id_ in self.missing:
+            return self.fake_response(404)
+        return self.fake_response(200, 'image {}'.format(id_).encode('utf-8') * 100)
+
+    def upload_certificate_image(self, companyId, id_, file=None):
+        with self.lock:
+            self.uploads[id_] = file.read()
+        return self.fake_response(200, b'"ok"')
+
+
+def test_download_streams_images_to_disk(tmpdir, fake_response):
+    """Test each image is written to its own file."""
+    client = ImageClient(fake_response)
+    transfer = CertificateTransfer(client, 1, str(tmpdir.join('journal')), chunk_size=64)
+    report = transfer.download([1, 2, 3], str(tmpdir.join('images')))
+    assert sorted(report.transferred) == [1, 2, 3]
+    with open(str(tmpdir.join('images', '2.pdf')), 'rb') as f:
+        assert f.read() == b'image 2' * 100
+    assert report.bytes == 3 * 700
+    assert report.throughput > 0
+
+
+def test_download_resumes_from_journal(tmpdir, fake_response):
+    """Test images already downloaded are skipped on the next run."""
+    client = ImageClient(fake_response, missing=[3])
+    journal = str(tmpdir.join('journal'))
+    images = str(tmpdir.join('images'))
+    first = CertificateTransfer(client, 1, journal).download([1, 2, 3], images)
+    assert list(first.failures) == [3]
+    assert not os.path.exists(os.path.join(images, '3.pdf.part'))
+    client.missing.clear()
+    second = CertificateTransfer(client, 1, journal).download([1, 2, 3], images)
+    assert second.transferred == [3]
+    assert sorted(second.skipped) == [1, 2]
+
+
+def test_jpeg_previews_get_jpg_extension(tmpdir, fake_response):
+    """Test the file extension follows the requested type."""
+    transfer = CertificateTransfer(ImageClient(fake_response), 1, str(tmpdir.join('j')))
+    transfer.download([5], str(tmpdir), {'$type': 'Jpeg', '$page': 1})
+    assert tmpdir.join('5.jpg').check()
+
+
+def test_upload_sends_files(tmpdir, fake_response):
+    """Test images are uploaded and journaled separately from downloads."""
+    client = ImageClient(fake_response)
+    journal = str(tmpdir.join('journal'))
+    path = tmpdir.join('7.pdf')
+    path.write_binary(b'%PDF-1.4')
+    transfer = CertificateTransfer(client, 1, journal)
+    report = transfer.upload([(7, str(path))])
+    assert client.uploads == {7: b'%PDF-1.4'}
+    assert report.bytes == 8
+    assert transfer.completed('upload') == {'7'}
+    assert transfer.completed('download') == set()
+
+
+def test_journal_is_kept_per_company_and_page(tmpdir, fake_response):
+    """Test another company or page of the same id is not skipped."""
+    client = ImageClient(fake_response)
+    journal = str(tmpdir.join('journal'))
+    images = str(tmpdir.join('images'))
+    CertificateTransfer(client, 1, journal).download([1, 2], images)
+    other = CertificateTransfer(client, 2, journal).download([1, 2], images)
+    assert sorted(other.transferred) == [1, 2] and other.skipped == []
+    page = CertificateTransfer(client, 1, journal).download(
+        [1], images, {'$page': 2})
+    assert page.transferred == [1]
+    assert os.path.exists(os.path.join(images, '1-2.pdf'))
+    assert CertificateTransfer(client, 1, journal).completed(
+        'download', {'$page': 2}) == {'1'}
+
+
+def test_interrupted_download_removes_partial_file(tmpdir, fake_response):
+    """Test a download failing mid-stream leaves no .part file behind."""
+    class BrokenStreamClient(ImageClient):
+        def download_certificate_image(self, companyId, id_, include=None,
+                                       stream=False):
+            response = self.fake_response(200, b'image')
+
+            def iter_content(chunk_size):
+                yield b'imag'
+                raise IOError('connection reset')
+            response.iter_content = iter_content
+            return response
+
+    images = str(tmpdir.join('images'))
+    transfer = CertificateTransfer(BrokenStreamClient(fake_response), 1,
+                                   str(tmpdir.join('journal')))
+    report = transfer.download([4], images)
+    assert list(report.failures) == [4]
+    assert os.listdir(images) == []
+    assert transfer.completed('download') == set()
+
+
+def test_upload_above_the_size_limit_is_refused(tmpdir, fake_response):
+    """Test an image too large to be sent from memory is not uploaded."""
+    client = ImageClient(fake_response)
+    small, large = tmpdir.join('1.pdf'), tmpdir.join('2.pdf')
+    small.write_binary(b'x' * 10)
+    large.write_binary(b'x' * 11)
+    transfer = CertificateTransfer(client, 1, str(tmpdir.join('journal')),
+                                   max_upload_size=10)
+    report = transfer.upload([(1, str(small)), (2, str(large))])
+    assert report.transferred == [1]
+    assert isinstance(report.failures[2], ValueError)
+    assert list(client.uploads) == [1]
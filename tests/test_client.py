@@ -1,5 +1,13 @@
 """Test the client model."""
-from client import AvataxClient
+from client import AvataxClient, _ReadOnlyDict
+from concurrent.futures import ProcessPoolExecutor
+from mock_server import MockAvataxServer
+from multiprocessing.pool import ThreadPool
+from transport import RequestsTransport
+import _fork
+import multiprocessing
+import os
+import pytest
 
 
 def test_client_can_be_created(unauth_client):
@@ -43,3 +51,103 @@ def test_client_can_obtain_their_own_base_url():
     client = AvataxClient('test app', 'ver 0.0', 'test machine', 'https://myurl.com')
     assert client.base_url == 'https://myurl.com'
 
+
+def test_add_credentials_replaces_headers(unauth_client):
+    """Test bearer credentials do not change headers already handed out."""
+    headers = unauth_client.client_header
+    unauth_client.add_credentials('token')
+    assert 'Authorization' not in headers
+    assert unauth_client.client_header['Authorization'] == 'Bearer token'
+
+
+def test_frozen_client_refuses_configuration_changes(unauth_client):
+    """Test a frozen client keeps its credentials, headers and url."""
+    client = unauth_client.add_credentials('token').freeze()
+    with pytest.raises(RuntimeError):
+        client.add_credentials('other')
+    with pytest.raises(RuntimeError):
+        client.base_url = 'https://myurl.com'
+    with pytest.raises(TypeError):
+        client.client_header['Authorization'] = 'Bearer other'
+    assert client.client_header['Authorization'] == 'Bearer token'
+
+
+def test_read_only_dict_refuses_changes():
+    """Test the header view frozen clients use before Python 3.3."""
+    headers = _ReadOnlyDict({'Authorization': 'Bearer token'})
+    with pytest.raises(TypeError):
+        headers['Authorization'] = 'Bearer other'
+    with pytest.raises(TypeError):
+        del headers['Authorization']
+    assert not hasattr(headers, 'update')
+    assert dict(headers) == {'Authorization': 'Bearer token'}
+
+
+def test_frozen_client_shared_by_64_threads(tax_document):
+    """Test one client serves 64 threads with a bounded connection pool."""
+    with MockAvataxServer() as server:
+        client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                              server.url,
+                              transport=RequestsTransport(pool_maxsize=64))
+        client.add_credentials('test', 'test')
+        cache = client.enable_estimate_cache()
+        client.freeze()
+        estimate = dict(tax_document, type='SalesOrder')
+
+        def call(n):
+            if n % 2:
+                return client.create_transaction(estimate)
+            return client.tax_rates_by_postal_code(
+                {'country': 'US', 'postalCode': '98109'})
+        pool = ThreadPool(64)
+        try:
+            responses = pool.map(call, range(2000))
+        finally:
+            pool.close()
+            pool.join()
+        assert all(r.ok for r in responses)
+        assert server.connections <= 64
+    assert cache.hits + cache.misses + cache.coalesced == 1000
+    assert cache.misses == 1
+
+
+# client created before the workers fork, as a pre-fork server would
+_prefork = {}
+
+
+def _child_call(n):
+    client = _prefork['client']
+    pool = client.transport.session.get_adapter('http://').poolmanager
+    r = client.tax_rates_by_postal_code({'country': 'US', 'postalCode': '98109'})
+    return os.getpid(), not hasattr(pool, 'inherited'), r.status_code
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_client_rebuilds_connections_in_forked_workers(local_client):
+    """Test forked workers use the inherited client on their own sockets."""
+    local_client.ping()
+    _prefork['client'] = local_client
+    local_client.transport.session.get_adapter('http://').poolmanager \
+        .inherited = True
+    context = multiprocessing.get_context('fork')
+    with ProcessPoolExecutor(4, mp_context=context) as pool:
+        results = list(pool.map(_child_call, range(40)))
+    assert all(status == 200 for _, _, status in results)
+    assert all(rebuilt for _, rebuilt, _ in results)
+    assert os.getpid() not in set(pid for pid, _, _ in results)
+    assert local_client.ping().ok
+
+
+def test_unnoticed_fork_is_detected_by_pid(local_client, monkeypatch,
+                                           tax_document, fake_response):
+    """Test a pid change rebuilds the pool but keeps cached estimates."""
+    cache = local_client.enable_estimate_cache()
+    estimate = dict(tax_document, type='SalesOrder')
+    cache.put(estimate, fake_response(201, {'totalTax': 1}))
+    adapter = local_client.transport.session.get_adapter('http://')
+    pool, lock = adapter.poolmanager, cache._lock
+    monkeypatch.setattr(_fork, '_pid', -1)
+    assert local_client.ping().ok
+    assert adapter.poolmanager is not pool
+    assert cache._lock is not lock
+    assert cache.get(estimate).json() == {'totalTax': 1}
@@ -0,0 +1,128 @@
+"""Test the incremental customer and certificate sync."""
+import pytest
+import re
+from customer_sync import IncrementalSync, links_by_customer
+
+
+class CustomerClient(object):
+    """Stand in for AvataxClient, filter customers on modifiedDate."""
+
+    def __init__(self, fake_response):
+        self.fake_response = fake_response
+        self.customers = [
+            {'id': i, 'customerCode': 'C{}'.format(i),
+             'modifiedDate': '2018-05-0{}T00:00:00'.format(i)} for i in range(1, 6)]
+        self.filters = []
+        self.on_page = None
+
+    def query_customers(self, companyId, include=None):
+        self.filters.append(include.get('$filter'))
+        flt = include.get('$filter') or ''
+        after = re.search(r"modifiedDate gt '([^']+)' or \(modifiedDate eq "
+                          r"'[^']+' and id gt (\d+)\)", flt)
+        since = re.search(r"modifiedDate ge '([^']+)'", flt)
+        records = sorted((c for c in self.customers
+                          if (not after or (c['modifiedDate'], c['id']) >
+                              (after.group(1), int(after.group(2)))) and
+                          (not since or c['modifiedDate'] >= since.group(1))),
+                         key=lambda c: (c['modifiedDate'], c['id']))
+        page = records[:include['$top']]
+        if self.on_page:
+            self.on_page(len(self.filters))
+        return self.fake_response(200, {'value': page})
+
+
+def test_first_run_fetches_everything(tmpdir, fake_response):
+    """Test every record is applied when there is no watermark."""
+    client = CustomerClient(fake_response)
+    sync = IncrementalSync(client, 1, str(tmpdir.join('state.json')), batch_size=2)
+    applied = []
+    run = sync.run('customers', applied.append)
+    assert (run.records, run.batches) == (5, 3)
+    assert run.watermark == {'modifiedDate': '2018-05-05T00:00:00', 'id': 5}
+    assert client.filters[0] is None
+
+
+def test_next_run_only_fetches_changes(tmpdir, fake_response):
+    """Test the stored watermark limits the next run to changed records."""
+    state = str(tmpdir.join('state.json'))
+    client = CustomerClient(fake_response)
+    IncrementalSync(client, 1, state).run('customers', lambda batch: None)
+    client.customers[1]['modifiedDate'] = '2018-06-01T00:00:00'
+    applied = []
+    run = IncrementalSync(client, 1, state).run('customers', applied.extend)
+    assert [c['customerCode'] for c in applied] == ['C2']
+    assert run.watermark == {'modifiedDate': '2018-06-01T00:00:00', 'id': 2}
+
+
+def test_failed_batch_keeps_previous_watermark(tmpdir, fake_response):
+    """Test a run resumes after the last applied batch."""
+    state = str(tmpdir.join('state.json'))
+    client = CustomerClient(fake_response)
+    sync = IncrementalSync(client, 1, state, batch_size=2)
+    batches = []
+
+    def apply(batch):
+        if batches:
+            raise IOError('mirror down')
+        batches.append(batch)
+    with pytest.raises(IOError):
+        sync.run('customers', apply)
+    assert IncrementalSync(client, 1, state).watermarks.get('1:customers') == \
+        {'modifiedDate': '2018-05-02T00:00:00', 'id': 2}
+
+
+def test_record_modified_between_pages_is_not_missed(tmpdir, fake_response):
+    """Test a record moving to the end mid-run shifts no later record out."""
+    client = CustomerClient(fake_response)
+    sync = IncrementalSync(client, 1, str(tmpdir.join('state.json')),
+                           page_size=2)
+
+    def modify(pages):
+        if pages == 1:
+            client.customers[0]['modifiedDate'] = '2018-06-01T00:00:00'
+    client.on_page = modify
+    applied = []
+    run = sync.run('customers', applied.extend)
+    assert sorted(c['customerCode'] for c in applied) == \
+        ['C1', 'C1', 'C2', 'C3', 'C4', 'C5']
+    assert run.watermark == {'modifiedDate': '2018-06-01T00:00:00', 'id': 1}
+    assert client.filters[1] == "(modifiedDate gt '2018-05-02T00:00:00' or " \
+        "(modifiedDate eq '2018-05-02T00:00:00' and id gt 2))"
+
+
+def test_watermark_and_filter_are_combined(tmpdir, fake_response):
+    """Test the watermark condition is added to a $filter."""
+    state = str(tmpdir.join('state.json'))
+    client = CustomerClient(fake_response)
+    sync = IncrementalSync(client, 1, state)
+    sync.watermarks.set('1:customers', {'modifiedDate': '2018-05-04T00:00:00',
+                                        'id': 4})
+    list(sync.changes('customers', {'$filter': "country eq 'US'"}))
+    assert client.filters[-1] == \
+        "(country eq 'US') and (modifiedDate gt '2018-05-04T00:00:00' or " \
+        "(modifiedDate eq '2018-05-04T00:00:00' and id gt 4))"
+
+
+def test_invalid_watermark_raises_value_error(tmpdir, fake_response):
+    """Test a watermark without a modifiedDate and id is refused."""
+    sync = IncrementalSync(CustomerClient(fake_response), 1,
+                           str(tmpdir.join('state.json')))
+    sync.watermarks.set('1:customers', '2018-05-04T00:00:00')
+    with pytest.raises(ValueError):
+        sync.changes('customers')
+
+
+def test_links_by_customer():
+    """Test certificates are grouped by linked customer."""
+    certificates = [{'id': 1, 'customers': [{'customerCode': 'A'}, {'customerCode': 'B'}]},
+                    {'id': 2, 'customers': [{'customerCode': 'A'}]},
+                    {'id': 3}]
+    assert links_by_customer(certificates) == {'A': [1, 2], 'B': [1]}
+
+
+def test_unknown_resource_raises_value_error(tmpdir, fake_response):
+    """Test value error is raised for a resource that can't be synced."""
+    sync = IncrementalSync(CustomerClient(fake_response), 1, str(tmpdir.join('s')))
+    with pytest.raises(ValueError):
+        sync.changes('items')
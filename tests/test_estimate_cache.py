@@ -0,0 +1,147 @@
+"""Test the estimate cache for uncommitted SalesOrder calculations."""
+import client_methods
+import pytest
+import threading
+import time
+from estimate_cache import EstimateCache, estimate_key, is_estimate
+
+
+def test_estimate_is_uncommitted_sales_order(tax_document):
+    """Test only uncommitted SalesOrders are considered estimates."""
+    tax_document['type'] = 'SalesOrder'
+    assert is_estimate(tax_document)
+    tax_document['commit'] = True
+    assert not is_estimate(tax_document)
+
+
+def test_invoice_is_not_an_estimate(tax_document):
+    """Test a SalesInvoice is never cached."""
+    assert not is_estimate(tax_document)
+
+
+def test_key_ignores_volatile_fields_and_time_of_day(tax_document):
+    """Test the key only depends on what changes the calculation."""
+    other = dict(tax_document, code='abc', purchaseOrderNo='xyz',
+                 date='2017-04-12 18:30:00.000000')
+    assert estimate_key(tax_document) == estimate_key(other)
+
+
+def test_key_changes_with_lines(tax_document):
+    """Test a different cart produces a different key."""
+    other = dict(tax_document, lines=[dict(tax_document['lines'][0], amount=5)])
+    assert estimate_key(tax_document) != estimate_key(other)
+
+
+def test_cache_expires_after_ttl(tax_document, fake_response):
+    """Test an estimate is dropped once its ttl has passed."""
+    now = [0]
+    cache = EstimateCache(ttl=10, clock=lambda: now[0])
+    cache.put(tax_document, fake_response())
+    assert cache.get(tax_document) is not None
+    now[0] = 11
+    assert cache.get(tax_document) is None
+
+
+def test_cache_evicts_least_recently_used(tax_document, fake_response):
+    """Test the cache never grows past max_size."""
+    cache = EstimateCache(max_size=2)
+    models = [dict(tax_document, customerCode=str(i)) for i in range(3)]
+    for model in models:
+        cache.put(model, fake_response())
+    assert len(cache) == 2
+    assert cache.get(models[0]) is None
+
+
+def test_failed_response_is_not_cached(tax_document, fake_response):
+    """Test error responses are not kept."""
+    cache = EstimateCache()
+    cache.put(tax_document, fake_response(400))
+    assert len(cache) == 0
+
+
+def test_invalidate_company(tax_document, fake_response):
+    """Test all estimates of a company can be dropped."""
+    cache = EstimateCache()
+    cache.put(tax_document, fake_response())
+    cache.put(dict(tax_document, companyCode='OTHER'), fake_response())
+    assert cache.invalidate_company('DEFAULT') == 1
+    assert len(cache) == 1
+
+
+def test_invalid_cache_size_raises_value_error():
+    """Test value error is raised for a non positive size."""
+    with pytest.raises(ValueError):
+        EstimateCache(max_size=0)
+
+
+def test_client_serves_repeated_estimate_from_cache(unauth_client, tax_document,
+                                                    fake_response, monkeypatch):
+    """Test a repeated SalesOrder only reaches the network once."""
+    calls = []
+
+    def create(self, model, include=None):
+        calls.append(model)
+        return fake_response(201, {'totalTax': 7.75})
+    monkeypatch.setattr(client_methods.Mixin, 'create_transaction', create)
+    unauth_client.enable_estimate_cache()
+    tax_document['type'] = 'SalesOrder'
+    first = unauth_client.create_transaction(tax_document)
+    second = unauth_client.create_transaction(dict(tax_document, code='new'))
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_client_without_cache_always_calls(unauth_client, tax_document,
+                                           fake_response, monkeypatch):
+    """Test the cache is opt-in."""
+    calls = []
+
+    def create(self, model, include=None):
+        calls.append(model)
+        return fake_response(201)
+    monkeypatch.setattr(client_methods.Mixin, 'create_transaction', create)
+    tax_document['type'] = 'SalesOrder'
+    unauth_client.create_transaction(tax_document)
+    unauth_client.create_transaction(tax_document)
+    assert len(calls) == 2
+
+
+def test_concurrent_misses_share_one_call(tax_document, fake_response):
+    """Test threads missing the same estimate wait for a single call."""
+    cache = EstimateCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def create(model, include):
+        calls.append(model)
+        started.set()
+        release.wait(5)
+        return fake_response(201, {'totalTax': 7.75})
+    tax_document['type'] = 'SalesOrder'
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        cache.fetch(tax_document, None, create))) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    while cache.coalesced < 7:
+        time.sleep(0.001)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len(set(map(id, results))) == 1
+    assert cache.coalesced == 7
+
+
+def test_failed_call_is_not_left_in_flight(tax_document):
+    """Test a failed call is raised and the next miss calls again."""
+    cache = EstimateCache()
+    tax_document['type'] = 'SalesOrder'
+
+    def create(model, include):
+        raise ValueError('boom')
+    with pytest.raises(ValueError):
+        cache.fetch(tax_document, None, create)
+    assert not cache._inflight
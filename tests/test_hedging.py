@@ -0,0 +1,143 @@
+"""Test the hedged reads of the client."""
+from hedging import Hedger
+import itertools
+import pytest
+import threading
+import time
+
+
+def slow_first(fake_response, slow=0.5):
+    """Return a call sleeping slow seconds the first time only."""
+    counter = itertools.count()
+
+    def call():
+        if next(counter) == 0:
+            time.sleep(slow)
+        return fake_response(200, {'call': 'done'})
+    return call
+
+
+def prime(hedger, fake_response, samples=20):
+    """Record fast latencies so the hedger knows the usual delay."""
+    for _ in range(samples):
+        hedger.call('rates', lambda: fake_response(200))
+
+
+def test_slow_call_is_answered_by_its_duplicate(fake_response):
+    """Test a call slower than usual is sent again and the copy wins."""
+    hedger = Hedger(percentile=95, budget=0.5)
+    prime(hedger, fake_response)
+    start = time.time()
+    response = hedger.call('rates', slow_first(fake_response))
+    assert time.time() - start < 0.3
+    assert response.json() == {'call': 'done'}
+    assert hedger.hedged == 1 and hedger.wins == 1
+    hedger.close()
+
+
+def test_calls_are_not_hedged_before_enough_samples(fake_response):
+    """Test a hedger without latencies to compare to waits for the call."""
+    hedger = Hedger(min_samples=20)
+    assert hedger.delay('rates') is None
+    hedger.call('rates', slow_first(fake_response, 0.05))
+    assert hedger.hedged == 0
+    hedger.close()
+
+
+def test_budget_caps_duplicates(fake_response):
+    """Test no duplicate is sent once the budget is spent."""
+    hedger = Hedger(budget=0)
+    prime(hedger, fake_response)
+    hedger.call('rates', slow_first(fake_response, 0.05))
+    assert hedger.hedged == 0 and hedger.over_budget == 1
+    hedger.close()
+
+
+def test_failed_call_waits_for_its_duplicate(fake_response):
+    """Test an error does not win over a duplicate still running."""
+    hedger = Hedger(budget=1)
+    prime(hedger, fake_response)
+    counter = itertools.count()
+
+    def call():
+        if next(counter) == 0:
+            time.sleep(0.1)
+            raise ValueError('primary')
+        time.sleep(0.2)
+        return fake_response(200)
+    assert hedger.call('rates', call).ok
+    assert hedger.wins == 1
+
+    def fail():
+        time.sleep(0.1)
+        raise KeyError('fail')
+    with pytest.raises(KeyError):
+        hedger.call('rates', fail)
+    hedger.close()
+
+
+def test_server_error_does_not_win_over_a_slower_answer(fake_response):
+    """Test a fast 503 from the duplicate waits for the primary's 200."""
+    hedger = Hedger(budget=1)
+    prime(hedger, fake_response)
+    counter = itertools.count()
+
+    def call():
+        if next(counter) == 0:
+            time.sleep(0.2)
+            return fake_response(200, {'call': 'primary'})
+        return fake_response(503)
+    response = hedger.call('rates', call)
+    assert response.status_code == 200
+    assert hedger.hedged == 1 and hedger.wins == 0
+
+    def unavailable():
+        time.sleep(0.1)
+        return fake_response(503)
+    assert hedger.call('rates', unavailable).status_code == 503
+    hedger.close()
+
+
+def test_client_hedges_tax_rates(local_client):
+    """Test enabled hedging routes reads through the hedger."""
+    hedger = local_client.enable_hedging(min_samples=2)
+    for _ in range(5):
+        r = local_client.tax_rates_by_postal_code({'country': 'US',
+                                                   'postalCode': '98109'})
+        assert r.ok
+    assert local_client.get_transaction_by_code('DEFAULT', 'NOPE') \
+        .status_code == 404
+    assert hedger.calls == 6
+    assert hedger.delay('tax_rates_by_postal_code') is not None
+    hedger.close()
+
+
+def test_invalid_percentile_raises_value_error():
+    """Test value error is raised for a percentile out of range."""
+    with pytest.raises(ValueError):
+        Hedger(percentile=100)
+
+
+def test_concurrent_callers_do_not_queue_behind_the_workers(fake_response):
+    """Test calls beyond the workers run on their own thread, unhedged."""
+    hedger = Hedger(budget=1, workers=2)
+    prime(hedger, fake_response)
+
+    def call():
+        time.sleep(0.2)
+        return fake_response(200)
+    results = []
+    callers = [threading.Thread(
+        target=lambda: results.append(hedger.call('rates', call)))
+        for _ in range(8)]
+    start = time.time()
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    # queued behind 2 workers, the 8 calls would take 0.8 seconds
+    assert time.time() - start < 0.6
+    assert len(results) == 8 and all(r.ok for r in results)
+    assert hedger.saturated >= 6
+    assert hedger.hedged <= 2
+    hedger.close()
@@ -0,0 +1,76 @@
+"""Test the load generator."""
+from client import AvataxClient
+from loadgen import WORKLOADS, generate_load, main, parse_mix
+from mock_server import MockAvataxServer
+import loadgen
+import pytest
+import threading
+
+
+def test_parse_mix():
+    """Test weights default to 1 and unknown workloads are refused."""
+    assert parse_mix('transaction=6, address') == {'transaction': 6.0,
+                                                   'address': 1.0}
+    with pytest.raises(ValueError):
+        parse_mix('refund=2')
+
+
+def test_mix_is_honored(local_client):
+    """Test every call is counted against its workload."""
+    report = generate_load(local_client, {'transaction': 3, 'address': 1,
+                                          'rates': 1},
+                           requests=100, concurrency=4, seed=1)
+    assert sorted(report.workloads) == sorted(WORKLOADS)
+    assert report.total.requests == 100
+    assert report.total.errors == 0
+    assert report.workloads['transaction'].requests > \
+        report.workloads['rates'].requests
+    assert set(report.statuses) <= set([200, 201])
+
+
+def test_rate_paces_calls(local_client):
+    """Test a target rate spreads the calls over time."""
+    report = generate_load(local_client, requests=6, rate=20, concurrency=4)
+    assert report.total.elapsed >= 0.2
+
+
+def test_duration_stops_the_run(local_client):
+    """Test the run ends once its duration elapsed."""
+    report = generate_load(local_client, {'address': 1}, duration=0.2)
+    assert 0.2 <= report.total.elapsed < 2
+    with pytest.raises(ValueError):
+        generate_load(local_client)
+
+
+@pytest.mark.skipif(loadgen._thread_time is None,
+                    reason='requires time.thread_time')
+def test_cpu_counts_only_the_calling_threads():
+    """Test the CPU of a local server and other threads is not counted."""
+    stop = threading.Event()
+
+    def burn():
+        while not stop.is_set():
+            pass
+    burner = threading.Thread(target=burn)
+    with MockAvataxServer(latency=0.05) as server:
+        client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                              server.url).add_credentials('test', 'test')
+        burner.start()
+        try:
+            report = generate_load(client, {'address': 1}, requests=6,
+                                   concurrency=1)
+        finally:
+            stop.set()
+            burner.join()
+    # the burner alone spent about half of the 0.3 seconds the run took
+    assert report.total.elapsed >= 0.3
+    assert report.cpu < 0.1
+
+
+def test_command_line(capsys):
+    """Test the command line against a local server."""
+    report = main(['--local', '--requests', '20', '--workload',
+                   'transaction=1,rates=1', '--seed', '3'])
+    out = capsys.readouterr().out
+    assert report.total.requests == 20
+    assert 'client CPU' in out and 'p99 ms' in out
@@ -0,0 +1,91 @@
+"""Test the bulk location importer."""
+import threading
+from location_import import import_locations
+
+
+class LocationClient(object):
+    """Stand in for AvataxClient, reject locations without a postal code."""
+
+    def __init__(self, fake_response):
+        self.fake_response = fake_response
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def create_locations(self, companyId, model):
+        with self.lock:
+            self.batches.append([loc['locationCode'] for loc in model])
+        if any(not loc.get('postalCode') for loc in model):
+            return self.fake_response(400, {'error': {'code': 'ModelStateInvalid'}})
+        return self.fake_response(201, [dict(loc, id=1) for loc in model])
+
+
+def locations(count):
+    """Return count valid location models."""
+    return [{'locationCode': 'Location{}'.format(i), 'postalCode': '98101',
+             'line1': '1 Main St', 'country': 'US'} for i in range(count)]
+
+
+def test_locations_are_sent_in_batches(fake_response):
+    """Test the list is chunked into batch_size calls."""
+    client = LocationClient(fake_response)
+    result = import_locations(client, 1, locations(25), batch_size=10)
+    assert len(result.created) == 25
+    assert sorted(len(b) for b in client.batches) == [5, 10, 10]
+    assert result.failures == {}
+
+
+def test_duplicate_codes_are_sent_once(fake_response):
+    """Test locations are deduplicated by locationCode."""
+    client = LocationClient(fake_response)
+    result = import_locations(client, 1, locations(3) + locations(2))
+    assert len(result.created) == 3
+    assert sorted(result.duplicates) == ['Location0', 'Location1']
+
+
+def test_bad_record_does_not_fail_its_batch(fake_response):
+    """Test a rejected batch is split to report the bad record only."""
+    client = LocationClient(fake_response)
+    models = locations(8)
+    models[5]['postalCode'] = None
+    result = import_locations(client, 1, models, batch_size=8)
+    assert list(result.failures) == ['Location5']
+    assert result.failures['Location5'].status_code == 400
+    assert len(result.created) == 7
+
+
+def test_exception_fails_every_record_of_the_batch(fake_response):
+    """Test a network error is reported for each record of the batch."""
+    class DownClient(object):
+        def create_locations(self, companyId, model):
+            raise IOError('down')
+    result = import_locations(DownClient(), 1, locations(3))
+    assert sorted(result.failures) == ['Location0', 'Location1', 'Location2']
+
+
+def test_server_error_is_not_split(fake_response):
+    """Test a 5xx fails its whole batch with a single call."""
+    class FailingClient(LocationClient):
+        def create_locations(self, companyId, model):
+            LocationClient.create_locations(self, companyId, model)
+            return self.fake_response(503)
+    client = FailingClient(fake_response)
+    result = import_locations(client, 1, locations(8), batch_size=8)
+    assert len(client.batches) == 1
+    assert sorted(result.failures) == ['Location{}'.format(i) for i in range(8)]
+    assert result.failures['Location0'].status_code == 503
+
+
+def test_split_calls_are_rate_limited(fake_response):
+    """Test the calls isolating a bad record go through the rate limiter."""
+    from _bulk import RateLimiter, create_bisecting
+    acquired = []
+
+    class Limiter(RateLimiter):
+        def acquire(self):
+            acquired.append(1)
+    client = LocationClient(fake_response)
+    models = locations(4)
+    models[0]['postalCode'] = None
+    create_bisecting(lambda chunk: client.create_locations(1, chunk), models,
+                     Limiter(1))
+    assert len(acquired) == len(client.batches) == 5
@@ -0,0 +1,58 @@
+"""Test the local stand-in for the AvaTax API."""
+from client import AvataxClient
+from mock_server import MockAvataxServer
+import time
+
+
+def test_ping(local_client):
+    """Test the ping route sees the credentials."""
+    r = local_client.ping()
+    assert r.status_code == 200
+    assert r.json()['authenticated']
+
+
+def test_create_and_fetch_transaction(local_client, tax_document):
+    """Test a created invoice is taxed, saved and listed."""
+    tax_document['code'] = 'MOCK-1'
+    r = local_client.create_transaction(tax_document)
+    assert r.status_code == 201
+    assert r.json()['totalTax'] == 7.75
+    fetched = local_client.get_transaction_by_code('DEFAULT', 'MOCK-1')
+    assert fetched.json()['totalAmount'] == 100
+    listed = local_client.list_transactions_by_company('DEFAULT')
+    assert 'MOCK-1' in [t['code'] for t in listed.json()['value']]
+
+
+def test_sales_order_is_not_saved(local_client, tax_document):
+    """Test estimates are calculated without being saved."""
+    tax_document.update({'type': 'SalesOrder', 'code': 'MOCK-ESTIMATE'})
+    local_client.create_transaction(tax_document)
+    r = local_client.get_transaction_by_code('DEFAULT', 'MOCK-ESTIMATE')
+    assert r.status_code == 404
+    assert r.json()['error']['code'] == 'EntityNotFoundError'
+
+
+def test_resolve_address(local_client, valid_address):
+    """Test both the GET and POST resolve routes."""
+    assert local_client.resolve_address(valid_address).json()[
+        'validatedAddresses'][0]['city'] == 'Seattle'
+    assert local_client.resolve_address_post(valid_address).ok
+
+
+def test_paged_list(local_client):
+    """Test list routes honor $top and $skip."""
+    r = local_client.query_companies({'$top': 1, '$skip': 1})
+    assert r.json() == {'@recordsetCount': 1, 'value': []}
+
+
+def test_latency_and_error_injection():
+    """Test the configured latency and error rate are applied."""
+    with MockAvataxServer(latency=0.05, error_rate=1,
+                          error_status=429) as server:
+        client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                              server.url)
+        start = time.time()
+        r = client.ping()
+        assert time.time() - start >= 0.05
+        assert r.status_code == 429
+        assert server.errors == 1
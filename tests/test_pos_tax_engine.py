@@ -0,0 +1,85 @@
+"""Test the offline point-of-sale tax engine."""
+import json
+import pytest
+from decimal import Decimal
+from pos_tax_engine import (LocalTaxCalculator, MappedTaxContentTable,
+                            TaxContentTable, tax_content_records)
+
+
+@pytest.fixture
+def tax_content():
+    """Scenarios as returned by build_tax_content_file."""
+    return [
+        {'ScenarioId': 1, 'LocationCode': 'DEFAULT', 'TaxCode': 'P0000000',
+         'EffDate': '2017-01-01', 'EndDate': '2017-12-31', 'TotalTaxRate': 0.0725},
+        {'ScenarioId': 2, 'LocationCode': 'DEFAULT', 'TaxCode': 'P0000000',
+         'EffDate': '2018-01-01', 'TotalTaxRate': 0.0775},
+        {'ScenarioId': 3, 'LocationCode': 'DEFAULT', 'TaxCode': 'FR020100',
+         'EffDate': '2017-01-01', 'TotalTaxRate': 0.0},
+        {'ScenarioId': 4, 'LocationCode': 'STORE2', 'TaxCode': 'P0000000',
+         'EffDate': '2017-01-01', 'TotalTaxRate': 0.101},
+    ]
+
+
+@pytest.fixture(params=['memory', 'mapped'])
+def table(request, tax_content, tmpdir):
+    """Both the in-memory and the memory mapped tables."""
+    table = TaxContentTable(tax_content)
+    if request.param == 'memory':
+        return table
+    path = str(tmpdir.join('content.bin'))
+    table.compile(path)
+    mapped = MappedTaxContentTable(path)
+    request.addfinalizer(mapped.close)
+    return mapped
+
+
+def test_rate_by_location_and_tax_code(table):
+    """Test rates are found by (location, tax code)."""
+    assert table.rate('STORE2', 'P0000000') == 0.101
+    assert table.rate('DEFAULT', 'FR020100') == 0.0
+
+
+def test_rate_depends_on_date(table):
+    """Test the scenario effective on the document date is used."""
+    assert table.rate('DEFAULT', 'P0000000', '2017-06-01') == 0.0725
+    assert table.rate('DEFAULT', 'P0000000', '2018-06-01T00:00:00') == 0.0775
+    assert table.rate('DEFAULT', 'P0000000', '2016-06-01') is None
+
+
+def test_unknown_pair_has_no_rate(table):
+    """Test None is returned for content that was not built."""
+    assert table.rate('NOWHERE', 'P0000000') is None
+    assert table.rate('DEFAULT', 'P0000001') is None
+
+
+def test_calculate_lines(table):
+    """Test each line is taxed and rounded to the cent."""
+    calc = LocalTaxCalculator(table)
+    result = calc.calculate('DEFAULT', [
+        {'amount': 100, 'taxCode': 'P0000000'},
+        {'amount': 19.99, 'taxCode': 'P0000000'},
+        {'amount': 50, 'taxCode': 'FR020100'}], '2018-03-01')
+    assert result['lines'] == [Decimal('7.75'), Decimal('1.55'), Decimal('0.00')]
+    assert result['totalTax'] == Decimal('9.30')
+
+
+def test_missing_content_raises_key_error(table):
+    """Test a line without tax content cannot be priced."""
+    with pytest.raises(KeyError):
+        LocalTaxCalculator(table).line_tax('NOWHERE', 'P0000000', 10)
+
+
+def test_records_from_file(tax_content, tmpdir):
+    """Test tax content files written to disk can be loaded."""
+    path = tmpdir.join('DEFAULT.json')
+    path.write(json.dumps(tax_content))
+    assert len(TaxContentTable(tax_content_records(str(path)))) == 3
+
+
+def test_mapping_other_file_raises_value_error(tmpdir):
+    """Test a file that was not compiled is rejected."""
+    path = tmpdir.join('bogus.bin')
+    path.write('x' * 64)
+    with pytest.raises(ValueError):
+        MappedTaxContentTable(str(path))
@@ -0,0 +1,117 @@
+"""Test the multi-company reconciliation."""
+import pytest
+import re
+from reconciliation import compare, reconcile, transaction_index
+
+
+REMOTE = {
+    'ACME': [{'id': 1, 'code': 'A-1', 'totalAmount': 100, 'totalTax': 8.0},
+             {'id': 2, 'code': 'A-2', 'totalAmount': 50, 'totalTax': 4.0},
+             {'id': 3, 'code': 'A-3', 'totalAmount': 10, 'totalTax': 0.8}],
+    'GLOBEX': [{'id': 4, 'code': 'G-1', 'totalAmount': 20, 'totalTax': 1.6}],
+}
+
+LOCAL = {
+    'ACME': [{'code': 'A-1', 'totalAmount': 100.0, 'totalTax': 8.001},
+             {'code': 'A-2', 'totalAmount': 50, 'totalTax': 4.5},
+             {'code': 'A-4', 'totalAmount': 5, 'totalTax': 0.4}],
+    'GLOBEX': [{'code': 'G-1', 'totalAmount': 20, 'totalTax': 1.6}],
+}
+
+
+class CompanyClient(object):
+    """Stand in for AvataxClient, serve companies and their transactions."""
+
+    def __init__(self, fake_response, broken=(), remote=REMOTE):
+        self.fake_response = fake_response
+        self.broken = broken
+        self.remote = remote
+
+    def page(self, records, include):
+        if '$skip' in include:
+            # unordered offset paging, as AvaTax without $orderby
+            start = include['$skip']
+            return self.fake_response(200, {'value': records[
+                start:start + include['$top']]})
+        last = re.search(r'id gt (\d+)', include.get('$filter', ''))
+        return self.fake_response(200, {'value': sorted(
+            (r for r in records if not last or r['id'] > int(last.group(1))),
+            key=lambda r: r['id'])[:include['$top']]})
+
+    def query_companies(self, include=None):
+        return self.page([{'id': i + 1, 'companyCode': code}
+                          for i, code in enumerate(sorted(self.remote))],
+                         include)
+
+    def list_transactions_by_company(self, companyCode, include=None):
+        if companyCode in self.broken:
+            return self.fake_response(500, {'error': {}})
+        return self.page(self.remote[companyCode], include)
+
+
+def test_compare_reports_each_kind_of_difference():
+    """Test missing, unexpected and mismatched documents are found."""
+    result = compare(transaction_index(LOCAL['ACME']),
+                     transaction_index(REMOTE['ACME']))
+    assert result.matched == 1
+    assert result.missing == [('SalesInvoice', 'A-4')]
+    assert result.unexpected == [('SalesInvoice', 'A-3')]
+    assert result.mismatched == {('SalesInvoice', 'A-2'):
+                                 [('totalTax', 4.5, 4.0)]}
+    assert result.avatax_tax == pytest.approx(12.8)
+
+
+def test_documents_sharing_a_code_are_told_apart_by_type():
+    """Test a return sharing the code of its invoice is not collapsed."""
+    remote = [{'code': 'A-1', 'type': 'SalesInvoice', 'totalAmount': 100,
+               'totalTax': 8.0},
+              {'code': 'A-1', 'type': 'ReturnInvoice', 'totalAmount': -100,
+               'totalTax': -8.0}]
+    local = [{'code': 'A-1', 'totalAmount': 100, 'totalTax': 8.0}]
+    result = compare(transaction_index(local), transaction_index(remote))
+    assert result.matched == 1
+    assert result.unexpected == [('ReturnInvoice', 'A-1')]
+    assert result.avatax_tax == pytest.approx(0.0)
+
+
+def test_reconcile_every_company(fake_response):
+    """Test companies default to every company of the account."""
+    report = reconcile(CompanyClient(fake_response), LOCAL, page_size=2)
+    assert sorted(report.companies) == ['ACME', 'GLOBEX']
+    assert report.companies['GLOBEX'].matched == 1
+    assert report.totals == {'matched': 2, 'missing': 1, 'unexpected': 1,
+                             'mismatched': 1}
+
+
+def test_document_voided_during_the_run_does_not_shift_pages(fake_response):
+    """Test a document leaving the filtered list skips none of the others."""
+    remote = {'ACME': [dict(t) for t in REMOTE['ACME']]}
+    client = CompanyClient(fake_response, remote=remote)
+    fetch = client.list_transactions_by_company
+
+    def void_after_first_page(companyCode, include=None):
+        response = fetch(companyCode, include)
+        if remote['ACME'][0]['code'] == 'A-1':
+            # voided, no longer matches a "status eq 'Committed'" filter
+            del remote['ACME'][0]
+        return response
+    client.list_transactions_by_company = void_after_first_page
+    report = reconcile(client, {'ACME': REMOTE['ACME']}, ['ACME'],
+                       page_size=1)
+    assert report.companies['ACME'].missing == []
+    assert report.companies['ACME'].matched == 3
+
+
+def test_reconcile_with_processes(fake_response):
+    """Test comparing on a process pool gives the same outcome."""
+    inline = reconcile(CompanyClient(fake_response), LOCAL, ['ACME'])
+    pooled = reconcile(CompanyClient(fake_response), LOCAL, ['ACME'],
+                       processes=2)
+    assert pooled.companies == inline.companies
+
+
+def test_failed_company_does_not_stop_the_others(fake_response):
+    """Test a company whose list call fails is reported as a failure."""
+    report = reconcile(CompanyClient(fake_response, broken=('ACME',)), LOCAL)
+    assert list(report.failures) == ['ACME']
+    assert list(report.companies) == ['GLOBEX']
@@ -0,0 +1,114 @@
+"""Test the asynchronous report job manager."""
+import pytest
+import threading
+import time
+from report_jobs import ReportJobManager
+
+
+class ReportClient(object):
+    """Stand in for AvataxClient, reports complete after a number of polls."""
+
+    def __init__(self, fake_response, polls_needed, final='Completed'):
+        self.fake_response = fake_response
+        self.polls_needed = polls_needed
+        self.final = final
+        self.polls = {}
+        self.lock = threading.Lock()
+
+    def initiate_export_document_line_report(self, companyId, model):
+        report_id = companyId * 10
+        self.polls[report_id] = 0
+        return self.fake_response(200, {'id': report_id, 'status': 'Pending'})
+
+    def get_report(self, id_):
+        with self.lock:
+            self.polls[id_] += 1
+            done = self.polls[id_] >= self.polls_needed[id_ // 10]
+        return self.fake_response(200, {'id': id_,
+                                        'status': self.final if done else 'Running'})
+
+    def download_report(self, id_, stream=False):
+        return self.fake_response(200, 'line {}\n'.format(id_).encode('utf-8') * 3)
+
+
+def test_reports_are_saved_as_they_complete(tmpdir, fake_response):
+    """Test the fastest report is yielded first and saved to disk."""
+    client = ReportClient(fake_response, {1: 4, 2: 1})
+    with ReportJobManager(client, str(tmpdir), min_interval=0.01, backoff=1.0) as jobs:
+        slow = jobs.submit(1, {'format': 'Csv'})
+        fast = jobs.submit(2, {'format': 'Csv'})
+        done = list(jobs.as_completed(timeout=5))
+    assert done == [fast, slow]
+    with open(slow.future.result()) as f:
+        assert f.read() == 'line 10\n' * 3
+    assert slow.polls == 4
+
+
+def test_polling_interval_backs_off(tmpdir, fake_response):
+    """Test long running reports are polled less and less often."""
+    client = ReportClient(fake_response, {1: 4})
+    times = []
+    get_report = client.get_report
+
+    def timed_get_report(id_):
+        times.append(time.time())
+        return get_report(id_)
+    client.get_report = timed_get_report
+    with ReportJobManager(client, str(tmpdir), min_interval=0.02,
+                          max_interval=0.08, backoff=2) as jobs:
+        jobs.submit(1, {}).future.result(timeout=5)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert gaps[1] > gaps[0] * 1.5
+    assert gaps[2] < 0.15
+
+
+def test_failed_report_raises(tmpdir, fake_response):
+    """Test a report that failed on the server raises from its future."""
+    client = ReportClient(fake_response, {1: 1}, final='Failed')
+    with ReportJobManager(client, str(tmpdir), min_interval=0.01) as jobs:
+        job = jobs.submit(1, {})
+        with pytest.raises(RuntimeError):
+            job.future.result(timeout=5)
+    assert job.status == 'Failed'
+
+
+def test_close_cancels_jobs_still_polling(tmpdir, fake_response):
+    """Test closing the manager resolves the futures of pending reports."""
+    client = ReportClient(fake_response, {1: 1000})
+    with ReportJobManager(client, str(tmpdir), min_interval=10) as jobs:
+        job = jobs.submit(1, {})
+    assert job.future.cancelled()
+    assert list(jobs.as_completed(timeout=1)) == [job]
+
+
+def test_transient_poll_errors_are_retried(tmpdir, fake_response):
+    """Test a 503 or an exception while polling does not fail the job."""
+    client = ReportClient(fake_response, {1: 2})
+    get_report = client.get_report
+    failures = [fake_response(503), IOError('reset')]
+
+    def flaky_get_report(id_):
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return failure
+        return get_report(id_)
+    client.get_report = flaky_get_report
+    with ReportJobManager(client, str(tmpdir), min_interval=0.01,
+                          backoff=1.0) as jobs:
+        job = jobs.submit(1, {})
+        assert job.future.result(timeout=5) == job.path
+    assert job.polls == 4
+
+
+def test_poll_errors_fail_the_job_after_retries(tmpdir, fake_response):
+    """Test a job fails once its polls failed retries times in a row."""
+    client = ReportClient(fake_response, {1: 1})
+    client.get_report = lambda id_: fake_response(500)
+    with ReportJobManager(client, str(tmpdir), min_interval=0.01,
+                          backoff=1.0, retries=2) as jobs:
+        job = jobs.submit(1, {})
+        with pytest.raises(Exception):
+            job.future.result(timeout=5)
+    assert job.polls == 3 and job.status == 'Error'
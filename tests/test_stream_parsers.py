@@ -0,0 +1,96 @@
+"""Test the streaming parsers for downloaded files."""
+import io
+import json
+import pytest
+from stream_parsers import (iter_csv_records, iter_json_records, iter_lines,
+                            iter_report_records, iter_tax_rates_by_zip_code)
+
+
+ZIP_RATES = (b'\xef\xbb\xbfZIP_CODE,STATE_ABBREV,COUNTY_NAME,CITY_NAME,TOTAL_SALES_TAX\r\n'
+             b'98101,WA,KING,SEATTLE,0.101\r\n'
+             b'92615,CA,ORANGE,"IRVINE, CITY OF",0.0775\r\n')
+
+
+def chunks(data, size):
+    """Split bytes in chunks of size bytes, as a stream would."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_lines_survive_chunk_boundaries():
+    """Test lines split across chunks are reassembled."""
+    assert list(iter_lines(chunks(b'ab\ncd\nef', 3))) == ['ab\n', 'cd\n', 'ef']
+
+
+def test_multibyte_characters_survive_chunk_boundaries():
+    """Test utf-8 characters split across chunks are decoded."""
+    assert ''.join(iter_lines(chunks(u'caf\xe9\n'.encode('utf-8'), 4))) == u'caf\xe9\n'
+
+
+def test_csv_records_as_dicts():
+    """Test each row becomes a dictionary keyed by the header."""
+    records = list(iter_csv_records(chunks(ZIP_RATES, 7)))
+    assert records[1]['CITY_NAME'] == 'IRVINE, CITY OF'
+    assert records[0]['ZIP_CODE'] == '98101'
+
+
+def test_csv_projection_as_tuples():
+    """Test only the requested columns are kept."""
+    records = list(iter_csv_records(io.BytesIO(ZIP_RATES),
+                                    ['ZIP_CODE', 'TOTAL_SALES_TAX'], as_tuples=True))
+    assert records == [('98101', '0.101'), ('92615', '0.0775')]
+
+
+def test_csv_unknown_column_raises_key_error():
+    """Test a projection on a missing column fails early."""
+    with pytest.raises(KeyError):
+        list(iter_csv_records(io.BytesIO(ZIP_RATES), ['NOPE']))
+
+
+def test_json_array_is_decoded_object_by_object():
+    """Test records are yielded from a chunked JSON array."""
+    data = json.dumps([{'id': i, 'name': 'n{}'.format(i)} for i in range(50)])
+    records = list(iter_json_records(chunks(data.encode('utf-8'), 10), ['id']))
+    assert records == [{'id': i} for i in range(50)]
+
+
+def test_json_fetch_result_is_supported():
+    """Test a FetchResult document yields its value records."""
+    data = json.dumps({'@recordsetCount': 1, 'value': [{'id': 1}]}).encode('utf-8')
+    assert list(iter_json_records(chunks(data, 5))) == [{'id': 1}]
+
+
+def test_truncated_json_raises_value_error():
+    """Test a download cut in the middle is not silently accepted."""
+    with pytest.raises(ValueError):
+        list(iter_json_records([b'[{"id": 1}, {"id"']))
+
+
+class DownloadClient(object):
+    """Stand in for AvataxClient, serve downloads as streamed responses."""
+
+    def __init__(self, fake_response):
+        self.fake_response = fake_response
+        self.streamed = []
+
+    def download_tax_rates_by_zip_code(self, date, include=None, stream=False):
+        self.streamed.append(stream)
+        return self.fake_response(200, ZIP_RATES)
+
+    def download_report(self, id_, stream=False):
+        self.streamed.append(stream)
+        return self.fake_response(200, b'[{"docCode": "A"}, {"docCode": "B"}]')
+
+
+def test_zip_rates_are_streamed(fake_response):
+    """Test the zip rates file is requested as a stream."""
+    client = DownloadClient(fake_response)
+    records = list(iter_tax_rates_by_zip_code(client, '2018-05-31', ['ZIP_CODE']))
+    assert records == [{'ZIP_CODE': '98101'}, {'ZIP_CODE': '92615'}]
+    assert client.streamed == [True]
+
+
+def test_json_report_records(fake_response):
+    """Test a JSON report is parsed with the JSON parser."""
+    client = DownloadClient(fake_response)
+    records = list(iter_report_records(client, 1, as_tuples=True, format='Json'))
+    assert records == [('A',), ('B',)]
@@ -0,0 +1,167 @@
+"""Test building tax content files for many locations."""
+import io
+import os
+import threading
+import pytest
+from client import AvataxClient
+from tax_content import (current_tax_content_dir, read_manifest,
+                         sync_tax_content, tax_content_path)
+
+
+class TaxContentClient(AvataxClient):
+    """AvataxClient answering the point-of-sale calls offline."""
+
+    def __init__(self, fake_response):
+        AvataxClient.__init__(self, 'test app', 'ver 0.0', 'test machine')
+        self.fake_response = fake_response
+        self.models = []
+        self.lock = threading.Lock()
+
+    def build_tax_content_file(self, model):
+        with self.lock:
+            self.models.append(model)
+        code = model['locationCodes'][0]
+        return self.fake_response(400 if code == 'BAD' else 200, {'loc': code})
+
+    def query_companies(self, include=None):
+        return self.fake_response(200, {'value': [{'id': 7}]})
+
+    def list_locations_by_company(self, companyId, include=None):
+        return self.fake_response(200, {'value': [
+            {'id': 11, 'locationCode': 'A'}, {'id': 12, 'locationCode': 'B'}]})
+
+    def build_tax_content_file_for_location(self, companyId, id_, include=None):
+        return self.fake_response(200, {'company': companyId, 'location': id_})
+
+
+def test_one_file_per_location(tmpdir, fake_response):
+    """Test each location gets its own file with the response content."""
+    client = TaxContentClient(fake_response)
+    run = client.build_tax_content_files('DEFAULT', ['A', 'B', 'C'], ['P0000000'],
+                                         directory=str(tmpdir), date='2018-01-01')
+    assert sorted(run.files) == ['A', 'B', 'C']
+    path = tax_content_path(str(tmpdir), 'B', '2018-01-01')
+    assert run.files['B'] == path
+    with open(path) as f:
+        assert f.read() == '{"loc": "B"}'
+    assert all(m['taxCodes'] == ['P0000000'] for m in client.models)
+    assert all(m['documentDate'] == '2018-01-01' for m in client.models)
+    assert all('date' not in m for m in client.models)
+
+
+def test_failures_and_report(tmpdir, fake_response):
+    """Test failed locations are reported and timings are written."""
+    client = TaxContentClient(fake_response)
+    report = io.StringIO()
+    run = client.build_tax_content_files('DEFAULT', ['A', 'BAD'], ['P0000000'],
+                                         directory=str(tmpdir), report=report)
+    assert list(run.failures) == ['BAD']
+    assert sorted(run.timings) == ['A', 'BAD']
+    assert report.getvalue().splitlines()[-1].startswith('Total Time')
+
+
+def test_build_for_location_without_tax_codes(tmpdir, fake_response):
+    """Test location ids are looked up when no tax codes are given."""
+    client = TaxContentClient(fake_response)
+    run = client.build_tax_content_files('DEFAULT', ['B', 'Z'],
+                                         directory=str(tmpdir), date='2018-01-01')
+    with open(run.files['B']) as f:
+        assert f.read() == '{"company": 7, "location": 12}'
+    assert isinstance(run.failures['Z'].error, ValueError)
+
+
+def test_directory_is_created(tmpdir, fake_response):
+    """Test a missing output folder is created."""
+    directory = os.path.join(str(tmpdir), 'taxfiles')
+    TaxContentClient(fake_response).build_tax_content_files(
+        'DEFAULT', ['A'], ['P0000000'], directory=directory)
+    assert os.path.isdir(directory)
+
+
+class ChangingContentClient(TaxContentClient):
+    """Tax content client whose rates can be changed between syncs."""
+
+    def __init__(self, fake_response):
+        TaxContentClient.__init__(self, fake_response)
+        self.rates = {'A': 0.1, 'B': 0.2, 'C': 0.3}
+        self.down = set()
+
+    def build_tax_content_file(self, model):
+        with self.lock:
+            self.models.append(model)
+        code = model['locationCodes'][0]
+        if code in self.down:
+            return self.fake_response(500)
+        return self.fake_response(200, [{'LocationCode': code,
+                                         'TotalTaxRate': self.rates[code]}])
+
+
+def test_first_sync_publishes_every_location(tmpdir, fake_response):
+    """Test a first sync writes every file and a manifest."""
+    root = str(tmpdir)
+    client = ChangingContentClient(fake_response)
+    sync = sync_tax_content(client, 'DEFAULT', ['A', 'B', 'C'],
+                            ['P0000000'], root=root, date='2018-01-01')
+    assert sync.version == 1
+    assert sorted(sync.changed) == ['A', 'B', 'C']
+    manifest = read_manifest(root)
+    assert sorted(manifest['locations']) == ['A', 'B', 'C']
+    assert current_tax_content_dir(root).endswith('1')
+    assert all(m['documentDate'] == '2018-01-01' for m in client.models)
+
+
+def test_sync_without_changes_keeps_version(tmpdir, fake_response):
+    """Test nothing is rewritten when no rate changed."""
+    root = str(tmpdir)
+    client = ChangingContentClient(fake_response)
+    sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    sync = sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    assert sync.version == 1
+    assert sync.changed == []
+    assert not os.path.exists(os.path.join(root, 'versions', '2'))
+
+
+def test_sync_only_rewrites_changed_locations(tmpdir, fake_response):
+    """Test a new version only has new content for changed locations."""
+    root = str(tmpdir)
+    client = ChangingContentClient(fake_response)
+    sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    client.rates['B'] = 0.25
+    sync = sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    assert (sync.version, sync.changed, sync.unchanged) == (2, ['B'], ['A'])
+    locations = read_manifest(root)['locations']
+    assert locations['A']['version'] == 1
+    assert locations['B']['version'] == 2
+
+
+def test_failed_location_keeps_previous_content(tmpdir, fake_response):
+    """Test a location that could not be built is carried over."""
+    root = str(tmpdir)
+    client = ChangingContentClient(fake_response)
+    sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    client.down.add('A')
+    client.rates['B'] = 0.25
+    sync = sync_tax_content(client, 'DEFAULT', ['A', 'B'], ['P0000000'], root=root)
+    assert list(sync.failures) == ['A']
+    directory = current_tax_content_dir(root)
+    with open(os.path.join(directory, read_manifest(root)['locations']['A']['file'])) as f:
+        assert '0.1' in f.read()
+
+
+def test_old_versions_are_pruned(tmpdir, fake_response):
+    """Test only the last versions are kept on disk."""
+    root = str(tmpdir)
+    client = ChangingContentClient(fake_response)
+    for rate in (0.1, 0.2, 0.3):
+        client.rates['A'] = rate
+        sync_tax_content(client, 'DEFAULT', ['A'], ['P0000000'], root=root, keep=2)
+    assert sorted(os.listdir(os.path.join(root, 'versions'))) == ['2', '3']
+
+
+def test_keep_below_one_raises_value_error(tmpdir, fake_response):
+    """Test the published version cannot be pruned, nor anything written."""
+    root = str(tmpdir)
+    with pytest.raises(ValueError):
+        sync_tax_content(ChangingContentClient(fake_response), 'DEFAULT',
+                         ['A'], ['P0000000'], root=root, keep=0)
+    assert os.listdir(root) == []
@@ -0,0 +1,149 @@
+"""Test the columnar export of transaction history."""
+import pytest
+import re
+from requests.exceptions import HTTPError
+from transaction_export import export_transactions, flatten, iter_column_batches
+
+
+def transactions(count):
+    """Return count transactions with one line and one detail each."""
+    return [{'id': i, 'code': 'INV-{}'.format(i), 'totalTax': 7.75 if i % 2 else 8,
+             'addresses': [{'city': 'Irvine'}], 'taxOverride': None,
+             'lines': [{'id': 100 + i, 'lineAmount': 100, 'details': [
+                 {'id': 1000 + i, 'rate': 0.0775, 'jurisName': 'CALIFORNIA'}]}]}
+            for i in range(1, count + 1)]
+
+
+class TransactionClient(object):
+    """Stand in for AvataxClient, serve transactions page by page."""
+
+    def __init__(self, fake_response, count):
+        self.fake_response = fake_response
+        self.transactions = transactions(count)
+        self.pages = 0
+
+    def list_transactions_by_company(self, companyCode, include=None):
+        self.pages += 1
+        last = re.search(r'id gt (\d+)', include.get('$filter', ''))
+        page = [t for t in self.transactions
+                if not last or t['id'] > int(last.group(1))][:include['$top']]
+        return self.fake_response(200, {'value': page})
+
+
+def test_flatten_links_lines_and_details():
+    """Test nested lines and details become their own rows."""
+    rows = list(flatten(transactions(1)))
+    assert [table for table, _ in rows] == ['transactions', 'lines', 'details']
+    assert 'lines' not in rows[0][1]
+    assert rows[1][1]['transactionId'] == 1
+    assert rows[2][1]['transactionLineId'] == 101
+
+
+def test_column_batches_are_bounded():
+    """Test rows are grouped in batches of batch_size per table."""
+    rows = (('transactions', {'id': i}) for i in range(5))
+    batches = list(iter_column_batches(rows, 2))
+    assert [b['id'] for _, b in batches] == [[0, 1], [2, 3], [4]]
+
+
+def test_export_to_parquet(tmpdir, fake_response):
+    """Test every table is written to a parquet file."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    client = TransactionClient(fake_response, 25)
+    report = export_transactions(client, 'DEFAULT', str(tmpdir),
+                                 {'$include': 'Lines,Details'},
+                                 batch_size=10, page_size=10)
+    assert report.rows == {'transactions': 25, 'lines': 25, 'details': 25}
+    assert client.pages == 3
+    table = pq.read_table(report.files['transactions'])
+    assert table.column('totalTax').to_pylist()[:2] == [7.75, 8.0]
+    assert str(table.schema.field('id').type) == 'int64'
+
+
+def test_export_to_arrow(tmpdir, fake_response):
+    """Test the arrow IPC format can be read back."""
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.ipc
+    report = export_transactions(TransactionClient(fake_response, 3), 'DEFAULT',
+                                 str(tmpdir), format='arrow')
+    with pa.OSFile(report.files['transactions']) as f:
+        table = pyarrow.ipc.open_file(f).read_all()
+    assert table.column('code').to_pylist() == ['INV-1', 'INV-2', 'INV-3']
+
+
+def test_unknown_format_raises_value_error(tmpdir, fake_response):
+    """Test value error is raised for a format that can't be written."""
+    pytest.importorskip('pyarrow')
+    with pytest.raises(ValueError):
+        export_transactions(TransactionClient(fake_response, 1), 'DEFAULT',
+                            str(tmpdir), format='csv')
+
+
+def test_later_columns_and_types_widen_the_schema(tmpdir, fake_response):
+    """Test no column is dropped nor value corrupted by later batches."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    client = TransactionClient(fake_response, 6)
+    client.transactions[3]['exchangeRate'] = 1.25
+    client.transactions[4]['totalTax'] = 'N/A'
+    client.transactions[5]['locked'] = 'No'
+    for trans in client.transactions[:5]:
+        trans['locked'] = False
+    report = export_transactions(client, 'DEFAULT', str(tmpdir), batch_size=2,
+                                 page_size=10)
+    table = pq.read_table(report.files['transactions'])
+    assert table.column('exchangeRate').to_pylist() == \
+        [None, None, None, 1.25, None, None]
+    assert table.column('totalTax').to_pylist() == \
+        ['7.75', '8', '7.75', '8', 'N/A', '8']
+    assert table.column('locked').to_pylist()[4:] == ['false', 'No']
+    assert table.column('addresses').to_pylist()[0] == '[{"city": "Irvine"}]'
+    assert str(table.schema.field('id').type) == 'int64'
+    assert not tmpdir.listdir('*.tmp')
+
+
+def test_transactions_deleted_during_export_do_not_shift_pages(
+        tmpdir, fake_response):
+    """Test every remaining transaction is exported once."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    client = TransactionClient(fake_response, 25)
+    fetch = client.list_transactions_by_company
+
+    def delete_after_first_page(companyCode, include=None):
+        response = fetch(companyCode, include)
+        if client.pages == 1:
+            del client.transactions[:3]
+        return response
+    client.list_transactions_by_company = delete_after_first_page
+    report = export_transactions(client, 'DEFAULT', str(tmpdir),
+                                 page_size=10)
+    ids = pq.read_table(report.files['transactions']).column('id')
+    assert ids.to_pylist() == list(range(1, 26))
+
+
+def test_failed_export_writes_no_file(tmpdir, fake_response):
+    """Test an export interrupted by a failed call publishes nothing."""
+    pytest.importorskip('pyarrow')
+    client = TransactionClient(fake_response, 25)
+    fetch = client.list_transactions_by_company
+
+    def fail_third_page(companyCode, include=None):
+        if client.pages == 2:
+            return fake_response(500, {'error': {}})
+        return fetch(companyCode, include)
+    client.list_transactions_by_company = fail_third_page
+    with pytest.raises(HTTPError):
+        export_transactions(client, 'DEFAULT', str(tmpdir), batch_size=5,
+                            page_size=10)
+    assert tmpdir.listdir() == []
+
+
+def test_values_not_fitting_a_column_raise_value_error():
+    """Test coercion refuses values instead of converting them."""
+    pa = pytest.importorskip('pyarrow')
+    from transaction_export import _coerce
+    with pytest.raises(ValueError):
+        _coerce('No', pa.bool_(), 'locked')
+    with pytest.raises(ValueError):
+        _coerce(1.5, pa.int64(), 'id')
+    with pytest.raises(ValueError):
+        _coerce('N/A', pa.float64(), 'totalTax')
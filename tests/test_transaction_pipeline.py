@@ -0,0 +1,93 @@
+"""Test the bulk commit, void, settle and lock pipeline."""
+import pytest
+import threading
+from _bulk import RateLimiter, run_bulk
+from transaction_pipeline import TransactionPipeline
+
+
+class RecordingClient(object):
+    """Stand in for AvataxClient, record the transaction calls."""
+
+    def __init__(self, fake_response):
+        self.fake_response = fake_response
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, method, comp_code, trans_code, model, include):
+        with self.lock:
+            self.calls.append((method, comp_code, trans_code, model, include))
+        status = 404 if trans_code == 'missing' else 200
+        return self.fake_response(status, {'code': trans_code})
+
+    def commit_transaction(self, *args):
+        return self._record('commit', *args)
+
+    def void_transaction(self, *args):
+        return self._record('void', *args)
+
+    def lock_transaction(self, *args):
+        return self._record('lock', *args)
+
+
+def test_commit_every_pair(fake_response):
+    """Test every pair is committed with a commit model."""
+    client = RecordingClient(fake_response)
+    pairs = [('DEFAULT', str(i)) for i in range(20)]
+    results = list(TransactionPipeline(client, workers=4).commit(pairs))
+    assert sorted(r.item for r in results) == sorted(pairs)
+    assert all(c[3] == {'commit': True} for c in client.calls)
+
+
+def test_failures_are_reported_per_item(fake_response):
+    """Test a failed call is reported without stopping the others."""
+    client = RecordingClient(fake_response)
+    pairs = [('DEFAULT', 'a'), ('DEFAULT', 'missing'), ('DEFAULT', 'b')]
+    results = list(TransactionPipeline(client).void(pairs))
+    failed = [r.item for r in results if not r.ok]
+    assert failed == [('DEFAULT', 'missing')]
+
+
+def test_lock_passes_include(fake_response):
+    """Test include is sent along each call."""
+    client = RecordingClient(fake_response)
+    include = {'documentType': 'PurchaseInvoice'}
+    list(TransactionPipeline(client).lock([('DEFAULT', 'a')], include=include))
+    assert client.calls == [('lock', 'DEFAULT', 'a', {'isLocked': True}, include)]
+
+
+def test_run_bulk_captures_exceptions():
+    """Test an exception becomes the error of its result."""
+    def boom(item):
+        raise IOError(item)
+    result, = run_bulk(boom, ['x'])
+    assert not result.ok
+    assert isinstance(result.error, IOError)
+
+
+def test_run_bulk_consumes_items_lazily():
+    """Test the item iterable is not drained ahead of the workers."""
+    pulled = []
+
+    def items():
+        for i in range(100):
+            pulled.append(i)
+            yield i
+    results = run_bulk(lambda i: i, items(), workers=2)
+    next(results)
+    assert len(pulled) < 100
+    results.close()
+
+
+def test_rate_limiter_spaces_calls():
+    """Test calls beyond the burst wait for a token."""
+    slept = []
+    limiter = RateLimiter(10, clock=lambda: 0, sleep=slept.append)
+    for _ in range(3):
+        limiter.acquire()
+    assert slept == [pytest.approx(0.1), pytest.approx(0.2)]
+
+
+def test_rate_limiter_rejects_bad_rate():
+    """Test value error is raised for a non positive rate."""
+    with pytest.raises(ValueError):
+        RateLimiter(0)
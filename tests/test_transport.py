@@ -0,0 +1,193 @@
+"""Test the transports carrying the calls of the client."""
+from _bulk import run_bulk
+from client import AvataxClient
+from mock_server import MockAvataxServer
+from requests import Session
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError, Timeout
+from transport import (HttpxTransport, RequestsTransport, Transport,
+                       make_transport)
+import pytest
+import socket
+
+
+TRANSPORTS = ['requests', 'urllib3', 'httpx', 'http2']
+
+
+@pytest.fixture(scope='module')
+def h2_server():
+    """Start a local stand-in talking HTTP/2."""
+    pytest.importorskip('h2')
+    with MockAvataxServer(http2=True) as server:
+        yield server
+
+
+def client_for(server, name, timeout=None):
+    """Return a client using the named transport, skip if unavailable."""
+    if name == 'httpx':
+        pytest.importorskip('httpx')
+    if name == 'http2':
+        pytest.importorskip('h2')
+    client = AvataxClient('test app', 'ver 0.0', 'test machine', server.url,
+                          timeout, transport=name)
+    return client.add_credentials('test', 'test')
+
+
+@pytest.mark.parametrize('name', TRANSPORTS)
+def test_every_transport_answers_like_requests(request, tax_document, name):
+    """Test each transport returns the same Response objects."""
+    mock_server = request.getfixturevalue(
+        'h2_server' if name == 'http2' else 'mock_server')
+    client = client_for(mock_server, name)
+    try:
+        assert client.ping().json()['authenticated']
+        created = client.create_transaction(tax_document)
+        assert created.status_code == 201
+        assert created.json()['totalTax'] == 7.75
+        page = client.query_companies({'$top': 1, '$skip': 0})
+        assert page.ok and page.json()['value'][0]['companyCode'] == 'DEFAULT'
+        missing = client.get_transaction_by_code('DEFAULT', 'NOPE')
+        assert missing.status_code == 404 and not missing.ok
+        streamed = client.transport.get(mock_server.url +
+                                        '/api/v2/utilities/ping', stream=True)
+        assert b''.join(streamed.iter_content(4)).startswith(b'{')
+        streamed.close()
+    finally:
+        client.transport.close()
+
+
+@pytest.mark.parametrize('name', TRANSPORTS)
+def test_transport_reconnects_after_fork(request, name):
+    """Test after_fork leaves the inherited connections alone."""
+    mock_server = request.getfixturevalue(
+        'h2_server' if name == 'http2' else 'mock_server')
+    client = client_for(mock_server, name)
+    try:
+        assert client.ping().ok
+        connections = mock_server.connections
+        client.transport.after_fork()
+        assert client.ping().ok
+        assert mock_server.connections == connections + 1
+    finally:
+        client.transport.close()
+
+
+def test_given_httpx_client_is_refused_after_fork(mock_server):
+    """Test a forked child cannot share the sockets of a client given."""
+    httpx = pytest.importorskip('httpx')
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          mock_server.url,
+                          transport=HttpxTransport(client=httpx.Client()))
+    try:
+        assert client.ping().ok
+        client.transport.after_fork()
+        with pytest.raises(RuntimeError):
+            client.ping()
+    finally:
+        client.transport.close()
+
+
+def test_adapters_without_after_fork_are_warned_about():
+    """Test adapters other than HTTPAdapters are reset or reported."""
+    class Resettable(BaseAdapter):
+        resets = 0
+
+        def after_fork(self):
+            self.resets += 1
+
+    session = Session()
+    resettable = Resettable()
+    session.mount('https://sandbox-rest.avatax.com', resettable)
+    session.mount('http://localhost', BaseAdapter())
+    with pytest.warns(RuntimeWarning, match='http://localhost'):
+        RequestsTransport(session).after_fork()
+    assert resettable.resets == 1
+
+
+@pytest.mark.parametrize('name', TRANSPORTS)
+def test_unreachable_host_raises_connection_error(mock_server, name):
+    """Test transport errors surface as requests exceptions."""
+    client = client_for(mock_server, name)
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    client.base_url = 'http://127.0.0.1:{}'.format(port)
+    with pytest.raises(ConnectionError):
+        client.ping()
+
+
+def test_http2_multiplexes_concurrent_calls(h2_server, tax_document):
+    """Test 150 concurrent calls share a single HTTP/2 connection."""
+    client = client_for(h2_server, 'http2')
+    before = h2_server.connections
+    try:
+        results = list(run_bulk(lambda n: client.create_transaction(
+            tax_document), range(150), workers=150))
+        assert all(result.ok for result in results)
+        assert h2_server.connections == before + 1
+    finally:
+        client.transport.close()
+
+
+def test_closed_http2_transport_refuses_calls(h2_server):
+    """Test a call after close raises instead of waiting on the loop."""
+    client = client_for(h2_server, 'http2')
+    assert client.ping().ok
+    client.transport.close()
+    with pytest.raises(RuntimeError):
+        client.ping()
+
+
+def test_http2_read_timeout(tax_document):
+    """Test a slow HTTP/2 answer raises the requests Timeout."""
+    pytest.importorskip('h2')
+    with MockAvataxServer(latency=0.5, http2=True) as server:
+        client = client_for(server, 'http2', timeout=0.1)
+        try:
+            with pytest.raises(Timeout):
+                client.ping()
+            # the connection survives the cancelled call
+            client.timeout_limit = 2
+            assert client.ping().ok
+        finally:
+            client.transport.close()
+
+
+def test_test_double_sees_prepared_calls(fake_response):
+    """Test a Transport subclass only has to implement send."""
+    class Recorder(Transport):
+        def __init__(self):
+            self.sent = []
+
+        def send(self, prepared, timeout=None, stream=False):
+            self.sent.append((prepared, timeout))
+            return fake_response(200, {'value': []})
+
+    recorder = Recorder()
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          'sandbox', transport=recorder)
+    client.add_credentials('user', 'pass')
+    client.query_companies({'$top': 5})
+    prepared, timeout = recorder.sent[0]
+    assert prepared.url.endswith('/api/v2/companies?%24top=5')
+    assert prepared.headers['Authorization'].startswith('Basic ')
+    assert timeout == 10
+
+
+def test_given_session_refuses_cookies_and_pool_size():
+    """Test a given session refuses cookies, and cannot be resized here."""
+    session = Session()
+    RequestsTransport(session)
+    assert session.cookies._policy.allowed_domains() == ()
+    with pytest.raises(ValueError):
+        RequestsTransport(Session(), pool_maxsize=64)
+
+
+def test_make_transport():
+    """Test transports are picked by name, requests by default."""
+    assert isinstance(make_transport(), RequestsTransport)
+    session_transport = RequestsTransport()
+    assert make_transport(session_transport) is session_transport
+    with pytest.raises(ValueError):
+        make_transport('carrier-pigeon')
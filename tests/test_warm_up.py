@@ -0,0 +1,58 @@
+"""Test the connection warm-up of the client."""
+from client import AvataxClient
+from mock_server import MockAvataxServer
+from transport import RequestsTransport
+from warm_up import ConnectionWarmer
+import pytest
+import time
+
+
+@pytest.fixture(scope='module')
+def slow_server():
+    """Start a local stand-in slow enough for pings to overlap."""
+    with MockAvataxServer(latency=0.05) as server:
+        yield server
+
+
+def test_warm_up_opens_connections_used_by_later_calls(slow_server,
+                                                       tax_document):
+    """Test concurrent calls after a warm-up open no new connection."""
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          slow_server.url,
+                          transport=RequestsTransport(pool_maxsize=8))
+    client.add_credentials('test', 'test')
+    before = slow_server.connections
+    result = client.warm_up(connections=8, wait=True).last
+    assert result.ok == 8 and result.errors == 0
+    assert slow_server.connections == before + 8
+    warmer = ConnectionWarmer(client, 8)
+    for _ in range(3):
+        assert warmer.round().ok == 8
+    assert slow_server.connections == before + 8
+
+
+def test_keep_alive_pings_until_stopped(local_client):
+    """Test keep-alive rounds repeat in the background."""
+    warmer = local_client.warm_up(connections=2, keep_alive=0.02)
+    deadline = time.time() + 2
+    while warmer.rounds < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    warmer.stop()
+    assert warmer.rounds >= 3
+    assert warmer.last.ok == 2
+
+
+def test_warm_up_reports_unreachable_server():
+    """Test failed pings are counted, not raised."""
+    client = AvataxClient('test app', 'ver 0.0', 'test machine',
+                          'http://127.0.0.1:9', 1)
+    result = client.warm_up(connections=2).wait(5)
+    assert result.ok == 0 and result.errors == 2
+
+
+def test_invalid_warm_up_raises_value_error(local_client):
+    """Test value error is raised for no connection or no interval."""
+    with pytest.raises(ValueError):
+        local_client.warm_up(connections=0)
+    with pytest.raises(ValueError):
+        local_client.warm_up(keep_alive=0)